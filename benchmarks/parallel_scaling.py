@@ -0,0 +1,87 @@
+"""Benchmark ParallelBusinessDuration throughput against worker count.
+
+Run from the repository root:
+
+    python benchmarks/parallel_scaling.py --rows 20000000 --workers 1 2 4 8 16 32
+
+For each worker count the script times calculate_many() and
+add_business_time_many() over the same random batch and prints rows per
+second and the speedup over a single process without a pool.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from bizdurr import BusinessDuration, ParallelBusinessDuration
+
+
+def build_duration() -> BusinessDuration:
+    return BusinessDuration(
+        business_hours={"start": "09:00", "end": "17:00"},
+        business_timezone="America/New_York",
+        holidays=[f"{year}-12-25" for year in range(2020, 2031)],
+        overrides={
+            f"{year}-12-24": {"start": "09:00", "end": "12:00"}
+            for year in range(2020, 2031)
+        },
+    )
+
+
+def build_batch(rows: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    first = np.datetime64("2024-01-01T00:00", "us").astype(np.int64)
+    span = 365 * 86400 * 1_000_000
+    starts = (first + rng.integers(0, span, rows)).astype("datetime64[us]")
+    lengths = rng.integers(0, 30 * 86400 * 1_000_000, rows).astype("timedelta64[us]")
+    return starts, starts + lengths, lengths
+
+
+def best_of(repeats: int, function) -> float:
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--chunk-size", type=int, default=500_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    duration = build_duration()
+    starts, ends, lengths = build_batch(args.rows)
+
+    baseline = best_of(args.repeats, lambda: duration.calculate_many(starts, ends))
+    print(f"rows={args.rows:,} chunk_size={args.chunk_size:,}")
+    print(f"{'workers':>8} {'calculate rows/s':>18} {'speedup':>8} {'deadline rows/s':>17}")
+    print(f"{'serial':>8} {args.rows / baseline:>18,.0f} {1.0:>8.2f}")
+
+    for workers in args.workers:
+        with ParallelBusinessDuration(
+            duration, max_workers=workers, chunk_size=args.chunk_size
+        ) as parallel:
+            # Warm up so pool start-up is not part of the timing
+            parallel.calculate_many(starts[: workers * 2], ends[: workers * 2])
+
+            elapsed = best_of(
+                args.repeats, lambda: parallel.calculate_many(starts, ends)
+            )
+            deadline_elapsed = best_of(
+                args.repeats, lambda: parallel.add_business_time_many(starts, lengths)
+            )
+
+        print(
+            f"{workers:>8} {args.rows / elapsed:>18,.0f} "
+            f"{baseline / elapsed:>8.2f} {args.rows / deadline_elapsed:>17,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Benchmark a shared FrozenBusinessDuration against thread count.
+
+Run from the repository root, ideally on a free-threaded build:
+
+    python3.13t benchmarks/thread_scaling.py --queries 200000 --threads 1 2 4 8 16
+
+For each thread count the script splits the same scalar queries across a
+thread pool sharing one FrozenBusinessDuration, then times
+ParallelBusinessDuration(executor="thread") over a NumPy batch, and prints
+queries per second and the speedup over a single thread.
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from bizdurr import FrozenBusinessDuration, ParallelBusinessDuration
+
+
+def build_duration() -> FrozenBusinessDuration:
+    return FrozenBusinessDuration(
+        business_hours={"start": "09:00", "end": "17:00"},
+        business_timezone="America/New_York",
+        holidays=[f"{year}-12-25" for year in range(2020, 2031)],
+        overrides={
+            f"{year}-12-24": {"start": "09:00", "end": "12:00"}
+            for year in range(2020, 2031)
+        },
+    )
+
+
+def build_queries(rows: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    first = np.datetime64("2024-01-01T00:00", "ns").astype(np.int64)
+    span = 365 * 86400 * 1_000_000_000
+    starts = first + rng.integers(0, span, rows)
+    ends = starts + rng.integers(0, 30 * 86400 * 1_000_000_000, rows)
+    return starts, ends
+
+
+def best_of(repeats: int, function) -> float:
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def run_scalar(duration, pairs):
+    calculate_epoch = duration.calculate_epoch
+    return sum(calculate_epoch(start, end) for start, end in pairs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=200_000)
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--chunk-size", type=int, default=500_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    duration = build_duration()
+    starts, ends = build_queries(args.queries)
+    pairs = list(zip(starts.tolist(), ends.tolist()))
+    batch_starts, batch_ends = (
+        values.astype("datetime64[ns]") for values in build_queries(args.rows, seed=1)
+    )
+
+    # Warm up the zone transition table so no thread has to extend it
+    run_scalar(duration, pairs[:1000])
+
+    print(f"python={sys.version.split()[0]} gil_enabled={gil_enabled}")
+    print(f"queries={args.queries:,} rows={args.rows:,}")
+    print(f"{'threads':>8} {'scalar queries/s':>18} {'speedup':>8} {'batch rows/s':>14}")
+
+    baseline = None
+    for threads in args.threads:
+        slices = [pairs[offset::threads] for offset in range(threads)]
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+
+            def scalar():
+                list(pool.map(lambda part: run_scalar(duration, part), slices))
+
+            elapsed = best_of(args.repeats, scalar)
+
+        with ParallelBusinessDuration(
+            duration,
+            max_workers=threads,
+            chunk_size=args.chunk_size,
+            executor="thread",
+        ) as parallel:
+            batch_elapsed = best_of(
+                args.repeats, lambda: parallel.calculate_many(batch_starts, batch_ends)
+            )
+
+        baseline = elapsed if baseline is None else baseline
+        print(
+            f"{threads:>8} {args.queries / elapsed:>18,.0f} "
+            f"{baseline / elapsed:>8.2f} {args.rows / batch_elapsed:>14,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,14 +4,46 @@ This module provides the BusinessDuration class for calculating how much time
 within a given interval falls within defined business hours.
 """
 
+import json
+import struct
 from dataclasses import dataclass, field
-from datetime import date, datetime, timedelta
-from typing import Dict, List, Optional, Set, Union
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 from zoneinfo import ZoneInfo
 
-from bizdurr.BusinessHours import BusinessHours
+from bizdurr.BusinessHours import WEEKDAY_NAMES, BusinessHours, DayHours
 from bizdurr.BusinessHoursOverrides import BusinessHoursOverrides
-from bizdurr.utils import parse_date_string, resolve_timezone
+from bizdurr.BusinessTimeIndex import BusinessTimeIndex
+from bizdurr.CalendarCache import CalendarCache
+from bizdurr.CompiledCalendar import CompiledCalendar, DaySegments
+from bizdurr.LRUCache import CacheInfo, LRUCache
+from bizdurr.ZoneTransitions import ZoneTransitions
+from bizdurr.combine import DEFAULT_FIRST_DATE, DEFAULT_LAST_DATE, combine_calendars
+from bizdurr.utils import (
+    EPOCH_ORDINAL,
+    NAT_INT64,
+    SECONDS_PER_DAY,
+    from_wall_clock_microseconds,
+    import_optional,
+    merge_intervals,
+    parse_date_string,
+    resolve_timezone,
+    split_overnight,
+    wall_clock_microseconds,
+)
+
+# Header of the to_bytes() encoding: magic bytes, format version, and the
+# length of the JSON settings that precede the compiled calendar
+SERIALIZED_MAGIC = b"BZDR"
+SERIALIZED_VERSION = 1
+SERIALIZED_HEADER = struct.Struct("<4sII")
+
+MICROSECOND = timedelta(microseconds=1)
+
+# Fields whose reassignment recompiles the calendar and clears the caches
+SCHEDULE_FIELDS = frozenset(
+    ("business_hours", "business_timezone", "holidays", "overrides")
+)
 
 
 @dataclass
@@ -24,14 +56,32 @@ class BusinessDuration:
 
     Args:
         business_hours: Weekly schedule as a BusinessHours object or a dict
-            mapping weekday names to {'start': 'HH:MM', 'end': 'HH:MM'}.
+            mapping weekday names to {'start': 'HH:MM', 'end': 'HH:MM'} or to
+            a list of such intervals.
         business_timezone: IANA timezone string (e.g., 'America/New_York') or
             ZoneInfo object. This specifies where the business is located and
             determines how business hours are interpreted.
         holidays: Optional list of dates when the business is closed.
             Can be date objects or ISO date strings ('YYYY-MM-DD').
         overrides: Optional per-date schedule overrides as a BusinessHoursOverrides
-            object or a dict mapping dates to {'start': 'HH:MM', 'end': 'HH:MM'}.
+            object or a dict mapping dates to {'start': 'HH:MM', 'end': 'HH:MM'}
+            or to a list of such intervals.
+        interval_cache_size: Maximum number of dates whose UTC business
+            intervals are kept by get_business_intervals_utc(). None means
+            unbounded and 0 disables the cache.
+        memo_size: Maximum number of calculate() and
+            is_within_business_hours() results to memoize. The default of 0
+            disables memoization; None means unbounded.
+        memo_max_age: Optional lifetime of a memoized result in seconds.
+        calendar_cache: Optional CalendarCache to load the compiled calendar
+            from, keyed by a hash of the schedule inputs. On a hit the
+            weekly schedule and overrides are still converted, but the
+            calendar is not compiled again. On a miss the compiled calendar
+            is stored for next time.
+
+    Assigning new business_hours, business_timezone, holidays, or overrides
+    after construction recompiles the calendar and discards the index and
+    all cached results. Mutating those values in place is not detected.
 
     Raises:
         TypeError: If business_hours or overrides are invalid types.
@@ -53,14 +103,21 @@ class BusinessDuration:
         datetime.timedelta(seconds=18000)  # 5 hours
     """
 
-    business_hours: Union[BusinessHours, Dict[str, Dict[str, str]]]
+    business_hours: Union[BusinessHours, Dict[str, DayHours]]
     business_timezone: Union[str, ZoneInfo]
     holidays: Optional[List[Union[date, str]]] = None
-    overrides: Optional[Union[BusinessHoursOverrides, Dict[str, Dict[str, str]]]] = None
+    overrides: Optional[Union[BusinessHoursOverrides, Dict[str, DayHours]]] = None
+    interval_cache_size: Optional[int] = 1024
+    memo_size: Optional[int] = 0
+    memo_max_age: Optional[float] = None
+    calendar_cache: Optional[CalendarCache] = field(default=None, repr=False)
 
     # Internal fields (initialized in __post_init__)
     _tz: ZoneInfo = field(default=None, init=False, repr=False)
-    _holidays: Set[date] = field(default=None, init=False, repr=False)
+    _index: Optional[BusinessTimeIndex] = field(default=None, init=False, repr=False)
+    _calendar: CompiledCalendar = field(default=None, init=False, repr=False)
+    _interval_cache: LRUCache = field(default=None, init=False, repr=False)
+    _memo: LRUCache = field(default=None, init=False, repr=False)
 
     # -------------------------------------------------------------------------
     # Initialization
@@ -68,12 +125,87 @@ class BusinessDuration:
 
     def __post_init__(self):
         """Validate and normalize all inputs."""
+        self._compile_schedule()
+        self._create_caches()
+
+    def __reduce__(self):
+        """Pickle as the compact to_bytes() encoding."""
+        return (self.__class__.from_bytes, (self.to_bytes(),))
+
+    def __or__(self, other):
+        """Combine with another calendar into their union()."""
+        if not isinstance(other, BusinessDuration):
+            return NotImplemented
+        return self.union(other)
+
+    def __and__(self, other):
+        """Combine with another calendar into their intersection()."""
+        if not isinstance(other, BusinessDuration):
+            return NotImplemented
+        return self.intersection(other)
+
+    def __sub__(self, other):
+        """Remove another calendar's business hours; see difference()."""
+        if not isinstance(other, BusinessDuration):
+            return NotImplemented
+        return self.difference(other)
+
+    def __setattr__(self, name, value):
+        """Recompile the calendar when part of the schedule is reassigned."""
+        super().__setattr__(name, value)
+
+        if name in SCHEDULE_FIELDS and getattr(self, "_calendar", None) is not None:
+            # Cleared first so the normalizing assignments below don't recurse
+            self._calendar = None
+            self._compile_schedule()
+            self._index = None
+            self._interval_cache.clear()
+            self._memo.clear()
+
+    def _compile_schedule(self) -> None:
+        """Normalize the schedule inputs and compile the calendar."""
         self._tz = resolve_timezone(self.business_timezone)
         self.business_timezone = self._tz  # Store as ZoneInfo for consistency
 
+        # Converted before the lookup, so the attributes have the same types
+        # on a hit and a miss and every key hashes the converted inputs
         self._convert_business_hours_if_needed()
         self._convert_overrides_if_needed()
-        self._holidays = self._normalize_holidays()
+
+        cache_key = self._calendar_cache_key()
+        if cache_key is not None:
+            calendar = self.calendar_cache.load(cache_key)
+            if calendar is not None:
+                self._calendar = calendar
+                return
+
+        self._calendar = self._compile_calendar(self._normalize_holidays())
+
+        if cache_key is not None:
+            self.calendar_cache.store(cache_key, self._calendar)
+
+    def _create_caches(self) -> None:
+        """Create the empty interval cache and memo."""
+        self._interval_cache = LRUCache(maxsize=self.interval_cache_size)
+        self._memo = LRUCache(maxsize=self.memo_size, max_age=self.memo_max_age)
+
+    def _calendar_cache_key(self) -> Optional[str]:
+        """Get the calendar_cache key for the schedule inputs.
+
+        Returns:
+            The key, or None if there is no cache or the inputs cannot be
+            hashed (invalid inputs are then reported by the regular
+            compilation).
+        """
+        if self.calendar_cache is None:
+            return None
+
+        try:
+            return self.calendar_cache.key_for(
+                self.business_hours, self._tz, self.holidays, self.overrides
+            )
+        except (TypeError, ValueError):
+            return None
 
     def _convert_business_hours_if_needed(self) -> None:
         """Convert business_hours dict to BusinessHours object if necessary."""
@@ -122,10 +254,491 @@ class BusinessDuration:
 
         return normalized
 
+    def _build_exception_dates(self, holidays: Set[date]) -> Set[date]:
+        """Collect every date that deviates from the weekly schedule.
+
+        Args:
+            holidays: The normalized holidays.
+
+        Returns:
+            The set of holiday and override dates.
+        """
+        exception_dates = set(holidays)
+        if self.overrides:
+            exception_dates.update(self.overrides.get_override_dates())
+        return exception_dates
+
+    def _compile_calendar(self, holidays: Set[date]) -> CompiledCalendar:
+        """Compile the schedule, overrides, and holidays into integer tables.
+
+        Args:
+            holidays: The normalized holidays.
+
+        Returns:
+            The CompiledCalendar every calculation is evaluated against.
+        """
+        weekday_segments = self.business_hours.get_weekday_segments()
+        exception_dates = self._build_exception_dates(holidays)
+
+        # The day after an exception also deviates if the exception changes
+        # the overnight shifts that carry into it
+        candidates = exception_dates.union(
+            exception_date + timedelta(days=1) for exception_date in exception_dates
+        )
+
+        exception_days = []
+        exception_segments = []
+        for candidate in sorted(candidates):
+            segments = self._get_day_segments(candidate, holidays)
+            if (
+                candidate in exception_dates
+                or segments != weekday_segments[candidate.weekday()]
+            ):
+                exception_days.append(candidate.toordinal() - EPOCH_ORDINAL)
+                exception_segments.append(segments)
+
+        return CompiledCalendar(
+            weekday_segments=weekday_segments,
+            exception_days=tuple(exception_days),
+            exception_segments=tuple(exception_segments),
+        )
+
     # -------------------------------------------------------------------------
     # Public Methods
     # -------------------------------------------------------------------------
 
+    @property
+    def calendar(self) -> CompiledCalendar:
+        """The compiled integer form of this calendar."""
+        return self._calendar
+
+    @property
+    def zone_transitions(self) -> ZoneTransitions:
+        """The UTC offset transitions of the business timezone.
+
+        The table is shared by every calendar in the same timezone and is
+        used to convert arrays between UTC and local time in bulk.
+        """
+        return ZoneTransitions.for_timezone(self._tz)
+
+    def to_bytes(self) -> bytes:
+        """Encode the compiled calendar and settings as bytes.
+
+        Only the compiled, validated state is encoded: the timezone name,
+        the cache and memo settings, and the calendar in the format of
+        CompiledCalendar.to_bytes(). Cached results, the index, and the
+        calendar_cache are not included. Pickling uses the same encoding.
+
+        Returns:
+            The encoded BusinessDuration, for from_bytes().
+
+        Raises:
+            ValueError: If business_timezone is a ZoneInfo without a key.
+
+        Example:
+            >>> restored = BusinessDuration.from_bytes(duration.to_bytes())
+        """
+        if self._tz.key is None:
+            raise ValueError("Cannot encode a timezone that has no key.")
+
+        settings = json.dumps(
+            {
+                "business_timezone": self._tz.key,
+                "interval_cache_size": self.interval_cache_size,
+                "memo_size": self.memo_size,
+                "memo_max_age": self.memo_max_age,
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+        header = SERIALIZED_HEADER.pack(
+            SERIALIZED_MAGIC, SERIALIZED_VERSION, len(settings)
+        )
+        return header + settings + self._calendar.to_bytes()
+
+    @classmethod
+    def from_bytes(cls, data) -> "BusinessDuration":
+        """Restore a BusinessDuration encoded by to_bytes().
+
+        The calendar is loaded as compiled, without parsing or validating
+        the schedule again. The restored business_hours, holidays, and
+        overrides are plain dicts and lists equivalent to the originals,
+        rather than BusinessHours and BusinessHoursOverrides objects.
+
+        Args:
+            data: The bytes (or another buffer) from to_bytes().
+
+        Returns:
+            The restored BusinessDuration.
+
+        Raises:
+            ValueError: If data is not an encoded BusinessDuration or was
+                written by an incompatible version.
+        """
+        with memoryview(data) as view:
+            if len(view) < SERIALIZED_HEADER.size:
+                raise ValueError("Data is too short to hold a BusinessDuration.")
+
+            magic, version, settings_length = SERIALIZED_HEADER.unpack_from(view)
+            if magic != SERIALIZED_MAGIC:
+                raise ValueError("Data does not hold a BusinessDuration.")
+            if version != SERIALIZED_VERSION:
+                raise ValueError(
+                    f"Unsupported BusinessDuration format version {version}; "
+                    f"expected {SERIALIZED_VERSION}."
+                )
+
+            calendar_offset = SERIALIZED_HEADER.size + settings_length
+            settings = json.loads(bytes(view[SERIALIZED_HEADER.size : calendar_offset]))
+            calendar = CompiledCalendar.from_buffer(view[calendar_offset:])
+
+        return cls._from_calendar(calendar, **settings)
+
+    @classmethod
+    def _from_calendar(
+        cls, calendar: CompiledCalendar, business_timezone: str, **settings
+    ) -> "BusinessDuration":
+        """Build an instance around an already compiled calendar.
+
+        Bypasses __init__, so the schedule is neither parsed nor validated.
+
+        Args:
+            calendar: The compiled calendar.
+            business_timezone: The IANA timezone name.
+            **settings: The remaining init arguments other than the schedule.
+        """
+        duration = cls.__new__(cls)
+        tz = resolve_timezone(business_timezone)
+
+        duration._tz = tz
+        duration.business_timezone = tz
+        duration.calendar_cache = None
+        for name, value in settings.items():
+            setattr(duration, name, value)
+
+        duration._calendar = calendar
+        schedule = cls._schedule_from_calendar(calendar)
+        for name, value in zip(("business_hours", "holidays", "overrides"), schedule):
+            # Bypasses __setattr__, which would compile the schedule again
+            object.__setattr__(duration, name, value)
+
+        duration._index = None
+        duration._create_caches()
+        return duration
+
+    @staticmethod
+    def _schedule_from_calendar(
+        calendar: CompiledCalendar,
+    ) -> Tuple[Dict[str, DayHours], List[date], Optional[Dict[date, DayHours]]]:
+        """Rebuild schedule inputs equivalent to a compiled calendar.
+
+        Args:
+            calendar: The compiled calendar.
+
+        Returns:
+            A (business_hours, holidays, overrides) tuple in the dict and
+            list forms accepted by __init__.
+        """
+
+        formatted = {}
+
+        def clock(seconds: int) -> str:
+            # Midnight at the end of the day is written as 00:00, which makes
+            # the interval an overnight one that ends at midnight
+            seconds %= SECONDS_PER_DAY
+            return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}"
+
+        def hours(segments: DaySegments) -> DayHours:
+            if segments not in formatted:
+                intervals = []
+                for start, end in segments:
+                    if (start, end) == (0, SECONDS_PER_DAY):
+                        # 00:00-00:00 would be empty, so write a whole day
+                        # as two touching halves, which merge again
+                        middle = SECONDS_PER_DAY // 2
+                        intervals += [(start, middle), (middle, end)]
+                    else:
+                        intervals.append((start, end))
+                formatted[segments] = [
+                    (clock(start), clock(end)) for start, end in intervals
+                ]
+            intervals = [
+                {"start": start, "end": end} for start, end in formatted[segments]
+            ]
+            return intervals[0] if len(intervals) == 1 else intervals
+
+        business_hours = {
+            WEEKDAY_NAMES[weekday]: hours(segments)
+            for weekday, segments in enumerate(calendar.weekday_segments)
+            if segments
+        }
+
+        exception_dates = map(
+            date.fromordinal,
+            [day + EPOCH_ORDINAL for day in calendar.exception_days],
+        )
+        holidays = []
+        overrides = {}
+        for exception_date, segments in zip(
+            exception_dates, calendar.exception_segments
+        ):
+            if segments:
+                overrides[exception_date] = hours(segments)
+            else:
+                holidays.append(exception_date)
+
+        return business_hours, holidays, overrides or None
+
+    def build_index(
+        self, start: Union[date, str], end: Union[date, str]
+    ) -> BusinessTimeIndex:
+        """Precompute the calendar's running totals for a range of dates.
+
+        Once built, calculate() answers any query whose start and end dates
+        fall within the range from the index, with the same result as the
+        compiled calendar but without its search over the exception days.
+        Queries outside the range use the compiled calendar and the memo.
+        Building a new index replaces the previous one.
+
+        Args:
+            start: The first date to index (date object or 'YYYY-MM-DD').
+            end: The last date to index, inclusive.
+
+        Returns:
+            The BusinessTimeIndex now used by this instance.
+
+        Raises:
+            ValueError: If a date string is malformed or end is before start.
+
+        Example:
+            >>> duration.build_index("2025-01-01", "2030-12-31")
+            BusinessTimeIndex(first_date=datetime.date(2025, 1, 1),
+                              last_date=datetime.date(2030, 12, 31))
+        """
+        first_date, last_date = self._parse_date_range(start, end)
+        self._index = BusinessTimeIndex(
+            calendar=self._calendar, first_date=first_date, last_date=last_date
+        )
+        return self._index
+
+    def clear_index(self) -> None:
+        """Discard the index built by build_index(), if any."""
+        self._index = None
+
+    def holidays_between(
+        self, start: Union[date, str], end: Union[date, str]
+    ) -> List[date]:
+        """Get the holidays in a range of dates.
+
+        The holidays are looked up by bisect in the calendar's sorted
+        exception days, so the cost grows with the number of holidays found
+        rather than the length of the range.
+
+        Args:
+            start: The first date of the range (date object or 'YYYY-MM-DD').
+            end: The last date of the range, inclusive.
+
+        Returns:
+            The holiday dates in the range, in increasing order. A date
+            whose only business hours are an overnight shift carried over
+            from a holiday is closed as well, and is included.
+
+        Raises:
+            ValueError: If a date string is malformed or end is before start.
+
+        Example:
+            >>> duration.holidays_between("2025-12-01", "2026-01-31")
+            [datetime.date(2025, 12, 25), datetime.date(2026, 1, 1)]
+        """
+        first_date, last_date = self._parse_date_range(start, end)
+        days = self._calendar.closed_exception_days(
+            first_date.toordinal() - EPOCH_ORDINAL,
+            last_date.toordinal() - EPOCH_ORDINAL,
+        )
+        return [date.fromordinal(day + EPOCH_ORDINAL) for day in days]
+
+    def business_days_between(
+        self, start: Union[date, str], end: Union[date, str]
+    ) -> int:
+        """Count the dates with business hours in a range.
+
+        Holidays and overrides are applied. The count is computed from
+        running totals over whole weeks and the calendar's exception days,
+        without visiting each date.
+
+        Args:
+            start: The first date of the range (date object or 'YYYY-MM-DD').
+            end: The last date of the range, inclusive.
+
+        Returns:
+            The number of business days in the range.
+
+        Raises:
+            ValueError: If a date string is malformed or end is before start.
+
+        Example:
+            >>> duration.business_days_between("2025-12-22", "2025-12-28")
+            4
+        """
+        first_date, last_date = self._parse_date_range(start, end)
+        return self._calendar.open_day_count(
+            first_date.toordinal() - EPOCH_ORDINAL,
+            last_date.toordinal() - EPOCH_ORDINAL,
+        )
+
+    def union(
+        self,
+        *others: "BusinessDuration",
+        start: Optional[Union[date, str]] = None,
+        end: Optional[Union[date, str]] = None,
+        business_timezone: Optional[Union[str, ZoneInfo]] = None,
+    ) -> "BusinessDuration":
+        """Combine calendars into one that is open when any of them is open.
+
+        The calendars may be in different timezones: their business hours
+        are matched by UTC instant, so the union of desks in New York,
+        London, and Singapore is the follow-the-sun coverage. The result is
+        an ordinary calendar compiled into the weekly schedule and
+        exceptions of business_timezone, and every query method runs on it
+        as fast as on any other calendar. a | b is a.union(b).
+
+        The range from start to end is combined exactly, including daylight
+        saving transitions that the timezones observe on different dates.
+        Outside the range, the result repeats its most common weekly
+        schedule. By default the range spans 2000 to 2050, widened to cover
+        every holiday and override of the calendars.
+
+        Args:
+            *others: The calendars to combine with this one.
+            start: The first date to combine exactly (date object or
+                'YYYY-MM-DD').
+            end: The last date to combine exactly, inclusive.
+            business_timezone: Timezone of the result. Defaults to the
+                timezone of this calendar.
+
+        Returns:
+            A new calendar with the settings of this one.
+
+        Raises:
+            TypeError: If another calendar is not a BusinessDuration.
+            ValueError: If a date string is malformed or end is before start.
+
+        Example:
+            >>> coverage = new_york.union(london, singapore)
+            >>> coverage.calculate(
+            ...     datetime(2025, 12, 22, 0, 0), datetime(2025, 12, 23, 0, 0)
+            ... )
+        """
+        return self._combine("union", others, start, end, business_timezone)
+
+    def intersection(
+        self,
+        *others: "BusinessDuration",
+        start: Optional[Union[date, str]] = None,
+        end: Optional[Union[date, str]] = None,
+        business_timezone: Optional[Union[str, ZoneInfo]] = None,
+    ) -> "BusinessDuration":
+        """Combine calendars into one that is open when all of them are open.
+
+        Use it for the hours in which two parties, such as a team and its
+        vendor, are both available. a & b is a.intersection(b). Arguments
+        and range are as in union().
+
+        Returns:
+            A new calendar with the settings of this one.
+
+        Raises:
+            TypeError: If another calendar is not a BusinessDuration.
+            ValueError: If a date string is malformed or end is before start.
+
+        Example:
+            >>> joint = team.intersection(vendor)
+            >>> joint.add_business_time(opened_at, timedelta(hours=4))
+        """
+        return self._combine("intersection", others, start, end, business_timezone)
+
+    def difference(
+        self,
+        *others: "BusinessDuration",
+        start: Optional[Union[date, str]] = None,
+        end: Optional[Union[date, str]] = None,
+        business_timezone: Optional[Union[str, ZoneInfo]] = None,
+    ) -> "BusinessDuration":
+        """Combine calendars into one open when this one is and no other is.
+
+        a - b is a.difference(b). Arguments and range are as in union().
+
+        Returns:
+            A new calendar with the settings of this one.
+
+        Raises:
+            TypeError: If another calendar is not a BusinessDuration.
+            ValueError: If a date string is malformed or end is before start.
+
+        Example:
+            >>> uncovered = support.difference(on_call)
+        """
+        return self._combine("difference", others, start, end, business_timezone)
+
+    def get_business_intervals_utc(
+        self, day: Union[date, str]
+    ) -> Tuple[Tuple[datetime, datetime], ...]:
+        """Get the business hours on a date as UTC instants.
+
+        Holidays and overrides are applied, and each local opening and
+        closing time is converted to UTC with the offset in effect on that
+        date, so intervals on daylight saving transition days are correct.
+        Results are kept in a bounded LRU cache; see interval_cache_info().
+
+        Args:
+            day: The local business date (date object or 'YYYY-MM-DD').
+
+        Returns:
+            A tuple of (start, end) pairs of UTC-aware datetimes, empty if
+            the business is closed that day.
+
+        Raises:
+            ValueError: If a date string is malformed.
+
+        Example:
+            >>> duration.get_business_intervals_utc("2025-12-22")
+            ((datetime.datetime(2025, 12, 22, 14, 0, tzinfo=datetime.timezone.utc),
+              datetime.datetime(2025, 12, 22, 22, 0, tzinfo=datetime.timezone.utc)),)
+        """
+        day = parse_date_string(day)
+        return self._interval_cache.get_or_compute(
+            day, lambda: self._resolve_business_intervals_utc(day)
+        )
+
+    def interval_cache_info(self) -> CacheInfo:
+        """Get hit, miss, and eviction statistics for the interval cache.
+
+        Returns:
+            A CacheInfo(hits, misses, evictions, size, maxsize) tuple.
+
+        Example:
+            >>> duration.interval_cache_info()
+            CacheInfo(hits=9120, misses=42, evictions=0, size=42, maxsize=1024, expirations=0)
+        """
+        return self._interval_cache.info()
+
+    def clear_interval_cache(self) -> None:
+        """Empty the interval cache and reset its statistics."""
+        self._interval_cache.clear()
+
+    def memo_info(self) -> CacheInfo:
+        """Get statistics for the calculate() and is_within_business_hours() memo.
+
+        Returns:
+            A CacheInfo(hits, misses, evictions, size, maxsize, expirations)
+            tuple. All counts stay at zero unless memo_size is set.
+        """
+        return self._memo.info()
+
+    def clear_memo(self) -> None:
+        """Discard all memoized results and reset the memo statistics."""
+        self._memo.clear()
+
     def calculate(self, start: datetime, end: datetime) -> timedelta:
         """Calculate the business duration between two datetimes.
 
@@ -133,6 +746,12 @@ class BusinessDuration:
         the start and end times, accounting for the weekly schedule,
         per-date overrides, and holidays.
 
+        The interval is evaluated against the compiled calendar with integer
+        arithmetic, so the cost depends on the number of holidays and
+        overrides (logarithmically) rather than the length of the interval.
+        With memo_size set, results are memoized by the wall-clock instants
+        of start and end in the business timezone.
+
         Args:
             start: The start of the time interval.
             end: The end of the time interval.
@@ -155,19 +774,316 @@ class BusinessDuration:
         start_dt = self._to_schedule_timezone(start)
         end_dt = self._to_schedule_timezone(end)
 
-        # Sum business time for each day in the range
-        total_duration = timedelta(0)
-        current_date = start_dt.date()
-        last_date = end_dt.date()
+        start_us = wall_clock_microseconds(start_dt)
+        end_us = wall_clock_microseconds(end_dt)
 
-        while current_date <= last_date:
-            day_duration = self._calculate_day_business_time(
-                current_date, start_dt, end_dt
-            )
-            total_duration += day_duration
-            current_date = self._next_day(current_date)
+        # The index holds the calendar's own totals, so it answers exactly
+        # as the calendar would. Read once, so that a concurrent
+        # build_index() or clear_index() is safe
+        index = self._index
+        if index is not None and index.covers(start_us) and index.covers(end_us):
+            return timedelta(microseconds=index.duration(start_us, end_us))
+
+        return self._memoize(
+            ("calculate", start_us, end_us),
+            lambda: timedelta(microseconds=self._calendar.duration(start_us, end_us)),
+        )
+
+    def calculate_many(self, starts, ends):
+        """Calculate business durations for arrays of start and end times.
+
+        The whole batch is evaluated with NumPy array operations against the
+        compiled calendar, without calling calculate() per element. Inputs
+        are broadcast against each other, so a single start can be paired
+        with many ends.
+
+        Naive values (including every numpy datetime64 array) are assumed to
+        be in the business timezone, as in calculate(). Aware datetime objects
+        are converted to the business timezone first. Missing values (None or
+        NaT) produce NaT.
+
+        Args:
+            starts: A numpy datetime64 array, a sequence of datetimes, or a
+                single datetime.
+            ends: Same as starts.
+
+        Returns:
+            A numpy timedelta64[us] array of business durations. Intervals
+            where start >= end have a duration of zero.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+
+        Example:
+            >>> duration.calculate_many(
+            ...     np.array(["2025-12-22T10:00", "2025-12-22T16:00"], dtype="datetime64[us]"),
+            ...     np.array(["2025-12-22T15:00", "2025-12-23T10:00"], dtype="datetime64[us]"),
+            ... )
+            array([18000000000,  7200000000], dtype='timedelta64[us]')
+        """
+        np = import_optional("numpy")
+
+        start_us, end_us = np.broadcast_arrays(
+            self._to_local_microseconds_array(starts),
+            self._to_local_microseconds_array(ends),
+        )
+
+        durations = self._calendar.duration_array(start_us, end_us)
+
+        result = durations.astype("timedelta64[us]")
+        missing = (start_us == NAT_INT64) | (end_us == NAT_INT64)
+        result[missing] = np.timedelta64("NaT", "us")
+        return result
+
+    def add_business_time(self, start: datetime, duration: timedelta) -> datetime:
+        """Find the datetime at which a duration of business time has elapsed.
+
+        This is the inverse of calculate(): for a ticket opened at start with
+        a service level of duration business time, it returns the deadline.
+        The deadline is located by searching the calendar's running totals,
+        so a 30-business-day duration costs about the same as a 1-hour one.
+
+        If the duration uses up a day's hours exactly, the result is that
+        day's closing time rather than the next opening time.
+
+        Args:
+            start: When the clock starts.
+            duration: The business time to add. A negative duration is
+                equivalent to subtract_business_time().
+
+        Returns:
+            The deadline. A naive start gives a naive result in the business
+            timezone; an aware start gives a result in the same timezone.
+
+        Raises:
+            ValueError: If the calendar never accumulates enough business
+                time (for example, an empty schedule).
+
+        Example:
+            >>> duration.add_business_time(
+            ...     datetime(2025, 12, 22, 15, 0), timedelta(hours=4)
+            ... )
+            datetime.datetime(2025, 12, 23, 11, 0)
+        """
+        local_us = wall_clock_microseconds(self._to_schedule_timezone(start))
+        amount_us = (
+            duration.days * 86400 + duration.seconds
+        ) * 1_000_000 + duration.microseconds
+
+        return self._from_local_microseconds(
+            self._calendar.advance(local_us, amount_us), start
+        )
+
+    def subtract_business_time(self, end: datetime, duration: timedelta) -> datetime:
+        """Find the datetime from which a duration of business time remains until end.
+
+        If the duration starts exactly at an opening time, the result is
+        that opening time rather than the previous day's close.
+
+        Args:
+            end: The reference point.
+            duration: The business time to go back.
+
+        Returns:
+            The earlier datetime, naive or aware to match end.
+
+        Raises:
+            ValueError: If the calendar never has enough business time before end.
+
+        Example:
+            >>> duration.subtract_business_time(
+            ...     datetime(2025, 12, 23, 11, 0), timedelta(hours=4)
+            ... )
+            datetime.datetime(2025, 12, 22, 15, 0)
+        """
+        return self.add_business_time(end, -duration)
+
+    def add_business_time_many(self, starts, durations):
+        """Find deadlines for arrays of start times and business durations.
+
+        The vectorized form of add_business_time(). All deadlines are located
+        at once with NumPy array operations against the compiled calendar,
+        so recomputing millions of deadlines after a calendar change takes
+        seconds. Inputs are broadcast against each other, so one duration can
+        be applied to many starts.
+
+        Naive values (including every numpy datetime64 array) are assumed to
+        be in the business timezone, and aware datetime objects are converted
+        to it, as in calculate_many().
+
+        Args:
+            starts: A numpy datetime64 array, a sequence of datetimes, or a
+                single datetime.
+            durations: A numpy timedelta64 array, a sequence of timedeltas, or
+                a single timedelta. Negative durations go back in time, as
+                in subtract_business_time().
+
+        Returns:
+            A numpy datetime64[us] array of naive deadlines in the business
+            timezone. Missing values (None or NaT) in either input give NaT.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            ValueError: If the calendar never accumulates enough business
+                time for some element.
 
-        return total_duration
+        Example:
+            >>> duration.add_business_time_many(
+            ...     np.array(["2025-12-22T15:00", "2025-12-23T09:00"], dtype="datetime64[us]"),
+            ...     timedelta(hours=4),
+            ... )
+            array(['2025-12-23T11:00:00.000000', '2025-12-23T13:00:00.000000'],
+                  dtype='datetime64[us]')
+        """
+        np = import_optional("numpy")
+
+        start_us, amount_us = np.broadcast_arrays(
+            self._to_local_microseconds_array(starts),
+            self._to_microseconds_array(durations),
+        )
+        missing = (start_us == NAT_INT64) | (amount_us == NAT_INT64)
+
+        deadlines = self._calendar.advance_array(
+            np.where(missing, 0, start_us), np.where(missing, 0, amount_us)
+        )
+
+        result = deadlines.astype("datetime64[us]")
+        result[missing] = np.datetime64("NaT", "us")
+        return result
+
+    def subtract_business_time_many(self, ends, durations):
+        """Vectorized subtract_business_time() over arrays.
+
+        Args:
+            ends: A numpy datetime64 array, a sequence of datetimes, or a
+                single datetime.
+            durations: A numpy timedelta64 array, a sequence of timedeltas, or
+                a single timedelta.
+
+        Returns:
+            A numpy datetime64[us] array of naive datetimes in the business
+            timezone, with NaT where either input is missing.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            ValueError: If the calendar never has enough business time before
+                some element.
+        """
+        np = import_optional("numpy")
+
+        amount_us = self._to_microseconds_array(durations)
+        negated = np.where(amount_us == NAT_INT64, NAT_INT64, -amount_us)
+        return self.add_business_time_many(ends, negated.astype("timedelta64[us]"))
+
+    def next_business_open(self, dt: datetime) -> datetime:
+        """Find when business hours next begin.
+
+        Holidays, overrides, and the weekly schedule are all taken into
+        account, so this answers "when can queued work start?" in one lookup.
+
+        Args:
+            dt: The reference datetime.
+
+        Returns:
+            dt itself if it falls within business hours, otherwise the next
+            opening time. Naive or aware to match dt, as in add_business_time().
+
+        Raises:
+            ValueError: If the business never opens after dt.
+
+        Example:
+            >>> duration.next_business_open(datetime(2025, 12, 24, 18, 0))
+            datetime.datetime(2025, 12, 26, 9, 0)  # the 25th is a holiday
+        """
+        return self._query_calendar(self._calendar.next_open, dt)
+
+    def next_business_close(self, dt: datetime) -> datetime:
+        """Find when business hours next end.
+
+        Args:
+            dt: The reference datetime.
+
+        Returns:
+            The close of the business period in progress at dt, or of the
+            next one if business is closed at dt. Naive or aware to match dt.
+
+        Raises:
+            ValueError: If the business never opens after dt.
+
+        Example:
+            >>> duration.next_business_close(datetime(2025, 12, 22, 10, 0))
+            datetime.datetime(2025, 12, 22, 17, 0)
+        """
+        return self._query_calendar(self._calendar.next_close, dt)
+
+    def previous_business_close(self, dt: datetime) -> datetime:
+        """Find when business hours last ended.
+
+        Args:
+            dt: The reference datetime.
+
+        Returns:
+            The latest closing time at or before dt. Naive or aware to match dt.
+
+        Raises:
+            ValueError: If the business was never open before dt.
+
+        Example:
+            >>> duration.previous_business_close(datetime(2025, 12, 22, 10, 0))
+            datetime.datetime(2025, 12, 19, 17, 0)
+        """
+        return self._query_calendar(self._calendar.previous_close, dt)
+
+    def next_business_open_many(self, values):
+        """Vectorized next_business_open() over an array of datetimes.
+
+        Args:
+            values: A numpy datetime64 array, a sequence of datetimes, or a
+                single datetime, interpreted as in calculate_many().
+
+        Returns:
+            A numpy datetime64[us] array of naive datetimes in the business
+            timezone, with NaT where the input is missing.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            ValueError: If the business never opens after some element.
+        """
+        return self._query_calendar_many(self._calendar.next_open_array, values)
+
+    def next_business_close_many(self, values):
+        """Vectorized next_business_close() over an array of datetimes.
+
+        Args:
+            values: A numpy datetime64 array, a sequence of datetimes, or a
+                single datetime, interpreted as in calculate_many().
+
+        Returns:
+            A numpy datetime64[us] array of naive datetimes in the business
+            timezone, with NaT where the input is missing.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            ValueError: If the business never opens after some element.
+        """
+        return self._query_calendar_many(self._calendar.next_close_array, values)
+
+    def previous_business_close_many(self, values):
+        """Vectorized previous_business_close() over an array of datetimes.
+
+        Args:
+            values: A numpy datetime64 array, a sequence of datetimes, or a
+                single datetime, interpreted as in calculate_many().
+
+        Returns:
+            A numpy datetime64[us] array of naive datetimes in the business
+            timezone, with NaT where the input is missing.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            ValueError: If the business was never open before some element.
+        """
+        return self._query_calendar_many(self._calendar.previous_close_array, values)
 
     def is_within_business_hours(self, dt: datetime) -> bool:
         """Check if a datetime falls within business hours.
@@ -185,173 +1101,504 @@ class BusinessDuration:
             >>> duration.is_within_business_hours(datetime(2025, 12, 22, 10, 30))
             True
         """
-        # Check if it's a holiday
-        if self._is_holiday(dt.date()):
-            return False
+        local_us = wall_clock_microseconds(self._to_schedule_timezone(dt))
+        return self._memoize(
+            ("is_within", local_us), lambda: self._calendar.is_open(local_us)
+        )
 
-        # Check for per-date override
-        if self.overrides:
-            override = self.overrides.get_override_for_date(dt)
-            if override is not None:
-                return self._is_time_in_range(dt, override)
+    def is_within_business_hours_many(self, values):
+        """Vectorized is_within_business_hours() over an array of datetimes.
 
-        # Fall back to regular schedule
-        return self.business_hours.is_within_business_hours(dt)
+        Every element is looked up in the compiled calendar at once with
+        NumPy array operations, so classifying millions of events makes no
+        per-element Python calls for datetime64 input. For pyarrow input,
+        see bizdurr.arrow.is_within_business_hours_arrow().
 
-    # -------------------------------------------------------------------------
-    # Internal Calculation Methods
-    # -------------------------------------------------------------------------
+        Args:
+            values: A numpy datetime64 array, a sequence of datetimes, or a
+                single datetime, interpreted as in calculate_many().
 
-    def _calculate_day_business_time(
-        self, current_date: date, start_dt: datetime, end_dt: datetime
-    ) -> timedelta:
-        """Calculate the business time for a single day.
+        Returns:
+            A numpy bool array, False where the input is missing.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+
+        Example:
+            >>> duration.is_within_business_hours_many(
+            ...     np.array(["2025-12-22T10:30", "2025-12-22T18:00"], dtype="datetime64[us]")
+            ... )
+            array([ True, False])
+        """
+        np = import_optional("numpy")
+
+        local_us = self._to_local_microseconds_array(values)
+        missing = local_us == NAT_INT64
+
+        is_open = self._calendar.is_open_array(np.where(missing, 0, local_us))
+        return is_open & ~missing
+
+    def to_business_timezone_many(self, values):
+        """Convert UTC timestamps to naive wall-clock times in the business timezone.
+
+        Conversion is a binary search in the timezone's transition table
+        (see zone_transitions), so no datetime objects are created. Use it to
+        prepare UTC event data for calculate_many() and the other batch
+        methods, which interpret datetime64 values as business-timezone
+        wall-clock times.
 
         Args:
-            current_date: The date to calculate for.
-            start_dt: The overall interval start (timezone-aware).
-            end_dt: The overall interval end (timezone-aware).
+            values: A numpy datetime64 array or scalar of naive UTC times.
 
         Returns:
-            The business duration for this day.
+            A numpy datetime64[us] array of naive local times, with NaT where
+            the input is NaT.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+
+        Example:
+            >>> duration.to_business_timezone_many(
+            ...     np.array(["2025-12-22T15:00"], dtype="datetime64[us]")
+            ... )
+            array(['2025-12-22T10:00:00.000000'], dtype='datetime64[us]')
         """
-        # Skip holidays
-        if self._is_holiday(current_date):
-            return timedelta(0)
+        np = import_optional("numpy")
 
-        # Get business hours for this day (override or regular schedule)
-        business_interval = self._get_business_interval_for_date(current_date)
-        if business_interval is None:
-            return timedelta(0)
+        utc_us = np.asarray(values).astype("datetime64[us]").view(np.int64)
+        return self.zone_transitions.to_local_array(utc_us).view("datetime64[us]")
+
+    def to_utc_many(self, values):
+        """Convert naive wall-clock times in the business timezone to UTC.
+
+        The inverse of to_business_timezone_many(), for example to store the
+        deadlines from add_business_time_many() in UTC. Wall times in a
+        daylight saving gap or fold are resolved as by
+        datetime.replace(tzinfo=business_timezone): an ambiguous time takes
+        its first occurrence and a skipped time uses the offset from before
+        the gap.
+
+        Args:
+            values: A numpy datetime64 array or scalar of naive local times.
+
+        Returns:
+            A numpy datetime64[us] array of naive UTC times, with NaT where
+            the input is NaT.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+
+        Example:
+            >>> duration.to_utc_many(
+            ...     np.array(["2025-12-22T10:00"], dtype="datetime64[us]")
+            ... )
+            array(['2025-12-22T15:00:00.000000'], dtype='datetime64[us]')
+        """
+        np = import_optional("numpy")
+
+        local_us = np.asarray(values).astype("datetime64[us]").view(np.int64)
+        return self.zone_transitions.to_utc_array(local_us).view("datetime64[us]")
+
+    def calculate_epoch(self, start_ns: int, end_ns: int) -> int:
+        """Calculate the business duration between two epoch timestamps.
+
+        The integer form of calculate() for timestamps stored as nanoseconds
+        since 1970-01-01 UTC. Both ends are converted to local time with
+        zone_transitions and evaluated against the compiled calendar, so no
+        datetime or timedelta objects are created. The index and the memo
+        are not used.
+
+        Timestamps are rounded down to whole microseconds, the resolution
+        of the calendar.
+
+        Args:
+            start_ns: The start of the interval in epoch nanoseconds.
+            end_ns: The end of the interval in epoch nanoseconds.
+
+        Returns:
+            The business time in nanoseconds, 0 if start_ns >= end_ns.
+
+        Example:
+            >>> duration.calculate_epoch(1766415600000000000, 1766433600000000000)
+            18000000000000  # 5 hours: 10:00 to 15:00 New York time
+        """
+        if start_ns >= end_ns:
+            return 0
+
+        transitions = self.zone_transitions
+        start_us = transitions.to_local(start_ns // 1000)
+        end_us = transitions.to_local(end_ns // 1000)
+        return self._calendar.duration(start_us, end_us) * 1000
+
+    def add_business_time_epoch(self, start_ns: int, duration_ns: int) -> int:
+        """Find the epoch timestamp at which a duration of business time has elapsed.
+
+        The integer form of add_business_time(), with the same conversions
+        and rounding as calculate_epoch().
+
+        Args:
+            start_ns: When the clock starts, in epoch nanoseconds.
+            duration_ns: The business time to add in nanoseconds. A negative
+                duration goes back in time.
+
+        Returns:
+            The deadline in epoch nanoseconds.
+
+        Raises:
+            ValueError: If the calendar never accumulates enough business time.
 
-        biz_start_time, biz_end_time = business_interval
+        Example:
+            >>> duration.add_business_time_epoch(1766433600000000000, 4 * 3600 * 10**9)
+            1766505600000000000  # Tuesday 11:00 New York time
+        """
+        transitions = self.zone_transitions
+        local_us = transitions.to_local(start_ns // 1000)
+        deadline_us = self._calendar.advance(local_us, duration_ns // 1000)
+        return transitions.to_utc(deadline_us) * 1000
 
-        # Build full datetime objects for the business interval
-        biz_start_dt = self._build_datetime(current_date, biz_start_time)
-        biz_end_dt = self._build_datetime(current_date, biz_end_time)
+    def subtract_business_time_epoch(self, end_ns: int, duration_ns: int) -> int:
+        """The integer form of subtract_business_time().
 
-        # Calculate overlap between request interval and business interval
-        return self._calculate_overlap(start_dt, end_dt, biz_start_dt, biz_end_dt)
+        Args:
+            end_ns: The reference point in epoch nanoseconds.
+            duration_ns: The business time to go back in nanoseconds.
 
-    def _get_business_interval_for_date(self, current_date: date):
-        """Get the business hours interval for a specific date.
+        Returns:
+            The earlier timestamp in epoch nanoseconds.
+
+        Raises:
+            ValueError: If the calendar never has enough business time before
+                end_ns.
+        """
+        return self.add_business_time_epoch(end_ns, -duration_ns)
 
-        Checks overrides first, then falls back to the regular weekly schedule.
+    def is_within_business_hours_epoch(self, timestamp_ns: int) -> bool:
+        """The integer form of is_within_business_hours().
+
+        Args:
+            timestamp_ns: The instant to check in epoch nanoseconds.
+
+        Returns:
+            True if the instant is within business hours, False otherwise.
+
+        Example:
+            >>> duration.is_within_business_hours_epoch(1766417400000000000)
+            True  # Monday 10:30 New York time
+        """
+        local_us = self.zone_transitions.to_local(timestamp_ns // 1000)
+        return self._calendar.is_open(local_us)
+
+    # -------------------------------------------------------------------------
+    # Internal Calculation Methods
+    # -------------------------------------------------------------------------
+
+    def _get_day_segments(self, current_date: date, holidays: Set[date]) -> DaySegments:
+        """Get the business segments on a date as seconds from midnight.
+
+        These are the date's own intervals, cut at midnight, plus the part
+        of the previous date's overnight intervals that runs past midnight.
+        A holiday closes the whole date, including any overnight shift
+        carried into it.
 
         Args:
             current_date: The date to look up.
+            holidays: The normalized holidays.
 
         Returns:
-            A tuple of (start_time, end_time) or None if closed.
+            Sorted (start_seconds, end_seconds) segments, empty if closed.
         """
-        # Check for override first
-        if self.overrides:
-            override = self.overrides.get_override_for_date(current_date)
-            if override is not None:
-                return override
+        if current_date in holidays:
+            return ()
 
-        # Fall back to weekly schedule
-        day_name = self._date_to_weekday_name(current_date)
-        return self.business_hours.get_day_hours(day_name)
+        same_day, _ = split_overnight(self._get_day_shifts(current_date, holidays))
+        _, carried = split_overnight(
+            self._get_day_shifts(current_date - timedelta(days=1), holidays)
+        )
+        return merge_intervals(same_day + carried)
 
-    def _calculate_overlap(
-        self,
-        request_start: datetime,
-        request_end: datetime,
-        business_start: datetime,
-        business_end: datetime,
-    ) -> timedelta:
-        """Calculate the overlap between two time intervals.
+    def _get_day_shifts(
+        self, current_date: date, holidays: Set[date]
+    ) -> List[Tuple[int, int]]:
+        """Get the business intervals that start on a date.
+
+        Checks holidays first, then overrides, then falls back to the regular
+        weekly schedule.
 
         Args:
-            request_start: Start of the requested interval.
-            request_end: End of the requested interval.
-            business_start: Start of the business hours interval.
-            business_end: End of the business hours interval.
+            current_date: The date to look up.
+            holidays: The normalized holidays.
 
         Returns:
-            The duration of the overlap, or timedelta(0) if no overlap.
+            (start_seconds, end_seconds) intervals from midnight, where an
+            overnight interval has its start after its end. Empty if closed.
         """
-        overlap_start = max(request_start, business_start)
-        overlap_end = min(request_end, business_end)
+        if current_date in holidays:
+            return []
+
+        intervals = None
+        if self.overrides:
+            intervals = self.overrides.get_override_intervals(current_date)
+        if intervals is None:
+            intervals = self.business_hours.get_day_intervals(
+                WEEKDAY_NAMES[current_date.weekday()]
+            )
+
+        return [
+            (
+                biz_start_time.hour * 3600 + biz_start_time.minute * 60,
+                biz_end_time.hour * 3600 + biz_end_time.minute * 60,
+            )
+            for biz_start_time, biz_end_time in intervals
+        ]
 
-        if overlap_end > overlap_start:
-            return overlap_end - overlap_start
-        return timedelta(0)
+    def _resolve_business_intervals_utc(
+        self, day: date
+    ) -> Tuple[Tuple[datetime, datetime], ...]:
+        """Convert the compiled segments of a date to UTC instants.
+
+        Args:
+            day: The local business date.
+
+        Returns:
+            A tuple of (start, end) pairs of UTC-aware datetimes.
+        """
+        midnight = datetime(day.year, day.month, day.day)
+        segments = self._calendar.segments_for_day(day.toordinal() - EPOCH_ORDINAL)
+
+        return tuple(
+            tuple(
+                (midnight + timedelta(seconds=seconds))
+                .replace(tzinfo=self._tz)
+                .astimezone(timezone.utc)
+                for seconds in segment
+            )
+            for segment in segments
+        )
 
     # -------------------------------------------------------------------------
     # Helper Methods
     # -------------------------------------------------------------------------
 
-    def _to_schedule_timezone(self, dt: datetime) -> datetime:
-        """Convert a datetime to the schedule's timezone.
+    @staticmethod
+    def _parse_date_range(
+        start: Union[date, str], end: Union[date, str]
+    ) -> Tuple[date, date]:
+        """Parse an inclusive range of dates.
 
         Args:
-            dt: The datetime to convert.
+            start: The first date (date object or 'YYYY-MM-DD').
+            end: The last date.
 
         Returns:
-            The datetime in the schedule's timezone.
+            The (first_date, last_date) pair.
+
+        Raises:
+            ValueError: If a date string is malformed or end is before start.
         """
-        if dt.tzinfo is None:
-            return dt.replace(tzinfo=self._tz)
-        return dt.astimezone(self._tz)
+        first_date = parse_date_string(start)
+        last_date = parse_date_string(end)
+
+        if last_date < first_date:
+            raise ValueError(
+                f"Range end ({last_date.isoformat()}) must not be before "
+                f"start ({first_date.isoformat()})."
+            )
+        return first_date, last_date
+
+    def _combine(
+        self,
+        operation: str,
+        others: Tuple["BusinessDuration", ...],
+        start: Optional[Union[date, str]],
+        end: Optional[Union[date, str]],
+        business_timezone: Optional[Union[str, ZoneInfo]],
+    ) -> "BusinessDuration":
+        """Combine this calendar with others; see union().
+
+        Args:
+            operation: An operation of combine_calendars().
+            others: The other calendars.
+            start: The first date to combine exactly, or None for the default.
+            end: The last date to combine exactly, or None for the default.
+            business_timezone: Timezone of the result, or None for this one's.
 
-    def _is_holiday(self, d: date) -> bool:
-        """Check if a date is a holiday.
+        Returns:
+            A new instance of this class around the combined calendar.
+        """
+        for other in others:
+            if not isinstance(other, BusinessDuration):
+                raise TypeError(
+                    f"Can only combine with a BusinessDuration, got {type(other).__name__}."
+                )
+        durations = (self,) + others
+        tz = self._tz if business_timezone is None else resolve_timezone(business_timezone)
+
+        first_date, last_date = self._parse_date_range(
+            DEFAULT_FIRST_DATE if start is None else start,
+            DEFAULT_LAST_DATE if end is None else end,
+        )
+        first_day = first_date.toordinal() - EPOCH_ORDINAL
+        last_day = last_date.toordinal() - EPOCH_ORDINAL
+
+        # Default bounds widen to keep every holiday and override exact
+        exception_days = [
+            day for duration in durations for day in duration._calendar.exception_days
+        ]
+        if exception_days and start is None:
+            first_day = min(first_day, min(exception_days) - 1)
+        if exception_days and end is None:
+            last_day = max(last_day, max(exception_days) + 1)
+
+        calendar = combine_calendars(
+            operation,
+            [(duration._calendar, duration.zone_transitions) for duration in durations],
+            ZoneTransitions.for_timezone(tz),
+            first_day,
+            last_day,
+        )
+        return self._from_calendar(
+            calendar,
+            tz,
+            interval_cache_size=self.interval_cache_size,
+            memo_size=self.memo_size,
+            memo_max_age=self.memo_max_age,
+        )
+
+    def _memoize(self, key: Tuple, compute: Callable[[], Any]) -> Any:
+        """Look a result up in the memo, or compute it directly if disabled.
+
+        Keys hold local wall-clock microseconds rather than UTC instants:
+        results are a function of the wall-clock time, and a naive time in a
+        daylight saving gap shares its UTC instant with a different wall time.
+        """
+        if self.memo_size == 0:
+            return compute()
+        return self._memo.get_or_compute(key, compute)
+
+    def _query_calendar(self, query, dt: datetime) -> datetime:
+        """Run a compiled calendar query on a single datetime.
 
         Args:
-            d: The date to check.
+            query: A CompiledCalendar method mapping local microseconds to
+                local microseconds.
+            dt: The input datetime.
 
         Returns:
-            True if the date is in the holidays set.
+            The result, naive or aware to match dt.
         """
-        return d in self._holidays
+        local_us = wall_clock_microseconds(self._to_schedule_timezone(dt))
+        return self._from_local_microseconds(query(local_us), dt)
 
-    def _is_time_in_range(self, dt: datetime, time_range) -> bool:
-        """Check if a datetime's time is within a given range.
+    def _query_calendar_many(self, query, values):
+        """Run a compiled calendar array query over datetimes, keeping NaT.
 
         Args:
-            dt: The datetime to check.
-            time_range: A tuple of (start_time, end_time).
+            query: A CompiledCalendar array method mapping local microseconds
+                to local microseconds.
+            values: Datetimes in any form accepted by calculate_many().
 
         Returns:
-            True if the time is within the range [start, end).
+            A numpy datetime64[us] array of naive local datetimes.
         """
-        start_time, end_time = time_range
-        dt_local = self._to_schedule_timezone(dt)
-        current_time = dt_local.timetz()
-        return start_time <= current_time < end_time
+        np = import_optional("numpy")
 
-    def _build_datetime(self, d: date, t) -> datetime:
-        """Build a datetime from a date and time, preserving timezone.
+        local_us = self._to_local_microseconds_array(values)
+        missing = local_us == NAT_INT64
+
+        result = query(np.where(missing, 0, local_us)).astype("datetime64[us]")
+        result[missing] = np.datetime64("NaT", "us")
+        return result
+
+    def _from_local_microseconds(self, local_us: int, reference: datetime) -> datetime:
+        """Convert local microseconds back to a datetime shaped like reference.
 
         Args:
-            d: The date.
-            t: The time (with tzinfo).
+            local_us: Local wall-clock microseconds in the business timezone.
+            reference: The input the result was derived from.
 
         Returns:
-            A timezone-aware datetime.
+            A naive local datetime if reference is naive, otherwise an aware
+            datetime in reference's timezone.
         """
-        return datetime(d.year, d.month, d.day, t.hour, t.minute, tzinfo=t.tzinfo)
+        result = from_wall_clock_microseconds(local_us)
+
+        if reference.tzinfo is None:
+            return result
+        return result.replace(tzinfo=self._tz).astimezone(reference.tzinfo)
 
-    def _date_to_weekday_name(self, d: date) -> str:
-        """Get the lowercase weekday name for a date.
+    def _to_local_microseconds_array(self, values):
+        """Convert datetimes to local wall-clock microseconds since 1970-01-01.
 
         Args:
-            d: The date.
+            values: A numpy datetime64 array or scalar (assumed to be in the
+                business timezone), a datetime, or a sequence of datetimes.
 
         Returns:
-            The weekday name in lowercase (e.g., 'monday').
+            A numpy int64 array, with NaT and None mapped to NAT_INT64.
         """
-        return datetime(d.year, d.month, d.day).strftime("%A").lower()
+        np = import_optional("numpy")
+
+        if isinstance(values, (np.ndarray, np.datetime64)) and np.asarray(
+            values
+        ).dtype.kind == "M":
+            return np.asarray(values).astype("datetime64[us]").view(np.int64)
+
+        if isinstance(values, datetime):
+            values = [values]
+            shape = ()
+        else:
+            values = list(values)
+            shape = (len(values),)
+
+        # Aware values are taken to UTC here and to local time in bulk below
+        offsets = [None if value is None else value.utcoffset() for value in values]
+        array = np.array(
+            [
+                NAT_INT64
+                if value is None
+                else wall_clock_microseconds(value)
+                - (0 if offset is None else offset // MICROSECOND)
+                for value, offset in zip(values, offsets)
+            ],
+            dtype=np.int64,
+        )
+
+        aware = np.array([offset is not None for offset in offsets], dtype=bool)
+        if aware.any():
+            array[aware] = self.zone_transitions.to_local_array(array[aware])
+        return array.reshape(shape)
+
+    def _to_microseconds_array(self, values):
+        """Convert durations to integer microseconds.
 
-    def _next_day(self, d: date) -> date:
-        """Get the next day.
+        Args:
+            values: A numpy timedelta64 array or scalar, a timedelta, or a
+                sequence of timedeltas.
+
+        Returns:
+            A numpy int64 array, with NaT and None mapped to NAT_INT64.
+        """
+        np = import_optional("numpy")
+
+        if isinstance(values, (np.ndarray, np.timedelta64)) and np.asarray(
+            values
+        ).dtype.kind == "m":
+            return np.asarray(values).astype("timedelta64[us]").view(np.int64)
+
+        if isinstance(values, timedelta):
+            return np.array(values, dtype="timedelta64[us]").view(np.int64)
+
+        return np.array(list(values), dtype="timedelta64[us]").view(np.int64)
+
+    def _to_schedule_timezone(self, dt: datetime) -> datetime:
+        """Convert a datetime to the schedule's timezone.
 
         Args:
-            d: The current date.
+            dt: The datetime to convert.
 
         Returns:
-            The next date.
+            The datetime in the schedule's timezone.
         """
-        return (datetime(d.year, d.month, d.day) + timedelta(days=1)).date()
+        if dt.tzinfo is None:
+            return dt.replace(tzinfo=self._tz)
+        return dt.astimezone(self._tz)
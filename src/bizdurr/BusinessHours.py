@@ -7,10 +7,16 @@ schedules with timezone support.
 import calendar
 from dataclasses import dataclass, field
 from datetime import datetime, time
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from zoneinfo import ZoneInfo
 
-from bizdurr.utils import parse_time_string, resolve_timezone
+from bizdurr.utils import (
+    merge_intervals,
+    normalize_intervals,
+    parse_time_string,
+    resolve_timezone,
+    split_overnight,
+)
 
 # Valid weekday names (lowercase) from the calendar module
 VALID_WEEKDAYS = frozenset(day.lower() for day in calendar.day_name if day)
@@ -18,6 +24,12 @@ VALID_WEEKDAYS = frozenset(day.lower() for day in calendar.day_name if day)
 # Standard weekdays for shorthand schedule expansion (Monday-Friday)
 WEEKDAYS_MON_FRI = ("monday", "tuesday", "wednesday", "thursday", "friday")
 
+# Lowercase weekday names indexed by date.weekday() (Monday == 0)
+WEEKDAY_NAMES = tuple(day.lower() for day in calendar.day_name)
+
+# A day's hours: one {'start', 'end'} dict, or a list of them
+DayHours = Union[Dict[str, str], List[Dict[str, str]]]
+
 
 @dataclass
 class BusinessHours:
@@ -30,7 +42,12 @@ class BusinessHours:
         schedule: Business hours definition. Can be either:
             - A mapping of weekday names to business hours, where keys are
               case-insensitive weekday names ('monday', 'Tuesday', etc.) and
-              values are dicts with 'start' and 'end' time strings in 'HH:MM' format.
+              values are dicts with 'start' and 'end' time strings in 'HH:MM' format,
+              or lists of such dicts for days with several intervals (e.g., a
+              lunch break). Overlapping or touching intervals are merged. An
+              interval whose start is after its end is an overnight shift that
+              ends on the following day; use an end of '00:00' to run until
+              midnight.
             - A shorthand dict with just 'start' and 'end' keys, which will be
               expanded to Monday-Friday with the same hours.
         timezone: IANA timezone string (e.g., 'America/New_York') or ZoneInfo object.
@@ -38,7 +55,7 @@ class BusinessHours:
     Raises:
         TypeError: If schedule is not a dictionary or timezone is invalid type.
         ValueError: If schedule contains invalid weekday names, time formats,
-            or if start time equals or exceeds end time.
+            or if start time equals end time.
 
     Example:
         >>> # Full schedule
@@ -61,14 +78,34 @@ class BusinessHours:
         >>> hours.get_day_hours("monday")
         (datetime.time(9, 0, tzinfo=ZoneInfo('America/New_York')),
          datetime.time(17, 0, tzinfo=ZoneInfo('America/New_York')))
+
+        >>> # Closed for lunch on weekdays
+        >>> hours = BusinessHours(
+        ...     schedule={
+        ...         "monday": [
+        ...             {"start": "09:00", "end": "12:00"},
+        ...             {"start": "13:00", "end": "17:00"},
+        ...         ],
+        ...     },
+        ...     timezone="America/New_York"
+        ... )
+
+        >>> # Overnight shift from Monday 22:00 to Tuesday 06:00
+        >>> hours = BusinessHours(
+        ...     schedule={"monday": {"start": "22:00", "end": "06:00"}},
+        ...     timezone="America/New_York"
+        ... )
     """
 
-    schedule: Dict[str, Dict[str, str]]
+    schedule: Dict[str, DayHours]
     timezone: ZoneInfo
 
     # Internal fields (initialized in __post_init__)
     _tz: ZoneInfo = field(default=None, init=False, repr=False)
-    _normalized: Dict[str, Tuple[time, time]] = field(
+    _normalized: Dict[str, Tuple[Tuple[time, time], ...]] = field(
+        default=None, init=False, repr=False
+    )
+    _weekday_segments: Tuple[Tuple[Tuple[int, int], ...], ...] = field(
         default=None, init=False, repr=False
     )
 
@@ -82,6 +119,7 @@ class BusinessHours:
         self.schedule = self._expand_shorthand_schedule(self.schedule)
         self._tz = resolve_timezone(self.timezone)
         self._normalized = self._build_normalized_schedule()
+        self._weekday_segments = self._build_weekday_segments()
 
     def _validate_schedule_type(self) -> None:
         """Ensure schedule is a dictionary."""
@@ -90,7 +128,7 @@ class BusinessHours:
                 f"schedule must be a dict, got {type(self.schedule).__name__}."
             )
 
-    def _expand_shorthand_schedule(self, schedule: Dict) -> Dict[str, Dict[str, str]]:
+    def _expand_shorthand_schedule(self, schedule: Dict) -> Dict[str, DayHours]:
         """Expand shorthand schedule to full Monday-Friday schedule.
 
         If the schedule contains only 'start' and 'end' keys (no weekday names),
@@ -121,22 +159,53 @@ class BusinessHours:
         # Not shorthand, return as-is
         return schedule
 
-    def _build_normalized_schedule(self) -> Dict[str, Tuple[time, time]]:
+    def _build_normalized_schedule(self) -> Dict[str, Tuple[Tuple[time, time], ...]]:
         """Parse and validate all schedule entries.
 
         Returns:
-            A dictionary mapping lowercase weekday names to (start_time, end_time) tuples
-            with timezone information attached.
+            A dictionary mapping lowercase weekday names to sorted tuples of
+            (start_time, end_time) intervals with timezone information
+            attached. Overlapping same-day intervals are merged.
         """
-        normalized: Dict[str, Tuple[time, time]] = {}
+        normalized: Dict[str, Tuple[Tuple[time, time], ...]] = {}
 
-        for day_key, hours_dict in self.schedule.items():
+        for day_key, hours in self.schedule.items():
             day_name = self._validate_weekday_key(day_key)
-            start_time, end_time = self._parse_day_hours(day_name, hours_dict)
-            normalized[day_name] = (start_time, end_time)
+            normalized[day_name] = normalize_intervals(
+                self._parse_day_hours(day_name, hours)
+            )
 
         return normalized
 
+    def _build_weekday_segments(self) -> Tuple[Tuple[Tuple[int, int], ...], ...]:
+        """Compile the schedule into a weekday-indexed table of seconds.
+
+        Overnight intervals are split at midnight, so a weekday's segments
+        include the part of the previous weekday's overnight shifts that runs
+        past midnight.
+
+        Returns:
+            A 7-tuple indexed by date.weekday() (Monday == 0) holding each
+            day's sorted, merged (start_seconds, end_seconds) segments from
+            local midnight. Days without business hours have no segments.
+        """
+        split = [
+            split_overnight(
+                (
+                    start_time.hour * 3600 + start_time.minute * 60,
+                    end_time.hour * 3600 + end_time.minute * 60,
+                )
+                for start_time, end_time in self._normalized.get(day_name, ())
+            )
+            for day_name in WEEKDAY_NAMES
+        ]
+
+        # Sunday's overnight shifts continue into Monday (split[-1])
+        return tuple(
+            merge_intervals(same_day + split[weekday - 1][1])
+            for weekday, (same_day, _) in enumerate(split)
+        )
+
     # -------------------------------------------------------------------------
     # Validation Helpers
     # -------------------------------------------------------------------------
@@ -170,9 +239,39 @@ class BusinessHours:
         return day_name
 
     def _parse_day_hours(
+        self, day_name: str, hours: DayHours
+    ) -> List[Tuple[time, time]]:
+        """Parse and validate a single day's hours entry.
+
+        Args:
+            day_name: The normalized weekday name (for error messages).
+            hours: A dictionary with 'start' and 'end' time strings, or a
+                non-empty list of such dictionaries.
+
+        Returns:
+            A list of (start_time, end_time) tuples with timezone info attached.
+
+        Raises:
+            TypeError: If hours is not a dictionary or list of dictionaries.
+            ValueError: If the list is empty, required keys are missing,
+                times are invalid, or start equals end.
+        """
+        if isinstance(hours, list):
+            if not hours:
+                raise ValueError(
+                    f"schedule[{day_name!r}] must contain at least one interval. "
+                    "To mark a day as closed, leave it out of the schedule."
+                )
+            return [
+                self._parse_interval(day_name, hours_dict) for hours_dict in hours
+            ]
+
+        return [self._parse_interval(day_name, hours)]
+
+    def _parse_interval(
         self, day_name: str, hours_dict: Dict[str, str]
     ) -> Tuple[time, time]:
-        """Parse and validate a single day's hours entry.
+        """Parse and validate one interval of a day's hours.
 
         Args:
             day_name: The normalized weekday name (for error messages).
@@ -184,13 +283,13 @@ class BusinessHours:
         Raises:
             TypeError: If hours_dict is not a dictionary.
             ValueError: If required keys are missing, times are invalid,
-                or start >= end.
+                or start equals end.
         """
         # Validate structure
         if not isinstance(hours_dict, dict):
             raise TypeError(
-                f"schedule[{day_name!r}] must be a dict with 'start' and 'end' keys, "
-                f"got {type(hours_dict).__name__}."
+                f"schedule[{day_name!r}] must be a dict with 'start' and 'end' keys "
+                f"or a list of such dicts, got {type(hours_dict).__name__}."
             )
 
         if "start" not in hours_dict or "end" not in hours_dict:
@@ -232,7 +331,10 @@ class BusinessHours:
     def _validate_time_ordering(
         self, day_name: str, start_time: time, end_time: time
     ) -> None:
-        """Validate that start time is before end time.
+        """Validate that an interval has a non-zero duration.
+
+        A start time after the end time is valid and denotes an overnight
+        interval that ends on the following day.
 
         Args:
             day_name: The weekday name (for error messages).
@@ -240,7 +342,7 @@ class BusinessHours:
             end_time: The business day end time.
 
         Raises:
-            ValueError: If start equals or exceeds end time.
+            ValueError: If start equals end time.
         """
         if start_time == end_time:
             raise ValueError(
@@ -249,13 +351,6 @@ class BusinessHours:
                 "Business hours must have a non-zero duration."
             )
 
-        if start_time > end_time:
-            raise ValueError(
-                f"schedule[{day_name!r}] has start time ({start_time.strftime('%H:%M')}) "
-                f"after end time ({end_time.strftime('%H:%M')}). "
-                "Overnight schedules are not currently supported."
-            )
-
     # -------------------------------------------------------------------------
     # Public Methods
     # -------------------------------------------------------------------------
@@ -270,13 +365,61 @@ class BusinessHours:
             A tuple of (start_time, end_time) if the day has defined hours,
             or None if the business is closed that day.
 
+        Raises:
+            ValueError: If the day has more than one interval; use
+                get_day_intervals() for such days.
+
         Example:
             >>> hours.get_day_hours("Monday")
             (datetime.time(9, 0, tzinfo=...), datetime.time(17, 0, tzinfo=...))
             >>> hours.get_day_hours("Sunday")  # Not in schedule
             None
         """
-        return self._normalized.get(day.strip().lower())
+        intervals = self.get_day_intervals(day)
+        if not intervals:
+            return None
+        if len(intervals) > 1:
+            raise ValueError(
+                f"{day.strip().lower()!r} has {len(intervals)} intervals; "
+                "use get_day_intervals() instead."
+            )
+        return intervals[0]
+
+    def get_day_intervals(self, day: str) -> Tuple[Tuple[time, time], ...]:
+        """Get all business intervals for a specific weekday.
+
+        Args:
+            day: Weekday name (case-insensitive), e.g., 'Monday' or 'monday'.
+
+        Returns:
+            The day's (start_time, end_time) intervals in ascending order,
+            with overlapping same-day entries merged. Overnight intervals
+            keep their start after their end. Empty if no interval starts on
+            that day.
+
+        Example:
+            >>> hours.get_day_intervals("Monday")  # Closed for lunch
+            ((datetime.time(9, 0, tzinfo=...), datetime.time(12, 0, tzinfo=...)),
+             (datetime.time(13, 0, tzinfo=...), datetime.time(17, 0, tzinfo=...)))
+        """
+        return self._normalized.get(day.strip().lower(), ())
+
+    def get_weekday_segments(self) -> Tuple[Tuple[Tuple[int, int], ...], ...]:
+        """Get the business hours of each weekday as seconds from midnight.
+
+        Overnight intervals are split at midnight, so each weekday holds
+        the segments open between its own midnights.
+
+        Returns:
+            A 7-tuple indexed by date.weekday() (Monday == 0) holding each
+            day's sorted (start_seconds, end_seconds) segments. Closed days
+            have an empty tuple.
+
+        Example:
+            >>> hours.get_weekday_segments()[0]  # Monday
+            ((32400, 61200),)
+        """
+        return self._weekday_segments
 
     def is_within_business_hours(self, dt: datetime) -> bool:
         """Check if a datetime falls within business hours.
@@ -308,18 +451,12 @@ class BusinessHours:
         # Convert to schedule timezone
         dt_in_tz = self._to_schedule_timezone(dt)
 
-        # Look up hours for this weekday
-        day_name = dt_in_tz.strftime("%A").lower()
-        hours = self._normalized.get(day_name)
-
-        if hours is None:
-            return False
-
-        start_time, end_time = hours
-        current_time = dt_in_tz.timetz()
-
-        # Check if current time is within range [start, end)
-        return start_time <= current_time < end_time
+        # Check if current time is within any segment [start, end) of the weekday
+        seconds = dt_in_tz.hour * 3600 + dt_in_tz.minute * 60 + dt_in_tz.second
+        return any(
+            start_seconds <= seconds < end_seconds
+            for start_seconds, end_seconds in self._weekday_segments[dt_in_tz.weekday()]
+        )
 
     # -------------------------------------------------------------------------
     # Internal Helpers
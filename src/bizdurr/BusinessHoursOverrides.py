@@ -7,10 +7,18 @@ special events with extended hours).
 
 from dataclasses import dataclass, field
 from datetime import date, datetime, time
-from typing import Dict, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 from zoneinfo import ZoneInfo
 
-from bizdurr.utils import parse_date_string, parse_time_string, resolve_timezone
+from bizdurr.utils import (
+    normalize_intervals,
+    parse_date_string,
+    parse_time_string,
+    resolve_timezone,
+)
+
+# A date's hours: one {'start', 'end'} dict, or a list of them
+OverrideHours = Union[Dict[str, str], List[Dict[str, str]]]
 
 
 @dataclass
@@ -23,7 +31,10 @@ class BusinessHoursOverrides:
     Args:
         overrides: A mapping of dates to business hours for those dates.
             Keys can be date objects or ISO date strings ('YYYY-MM-DD').
-            Values are dicts with 'start' and 'end' time strings in 'HH:MM' format.
+            Values are dicts with 'start' and 'end' time strings in 'HH:MM' format,
+            or lists of such dicts for dates with several intervals. An
+            interval whose start is after its end is an overnight shift that
+            ends on the following day.
         timezone: IANA timezone string (e.g., 'America/New_York') or ZoneInfo object.
 
     Raises:
@@ -43,12 +54,12 @@ class BusinessHoursOverrides:
         (datetime.time(9, 0, tzinfo=...), datetime.time(12, 0, tzinfo=...))
     """
 
-    overrides: Dict[Union[str, date], Dict[str, str]]
+    overrides: Dict[Union[str, date], OverrideHours]
     timezone: Union[str, ZoneInfo]
 
     # Internal fields (initialized in __post_init__)
     _tz: ZoneInfo = field(default=None, init=False, repr=False)
-    _normalized: Dict[date, Tuple[time, time]] = field(
+    _normalized: Dict[date, Tuple[Tuple[time, time], ...]] = field(
         default=None, init=False, repr=False
     )
 
@@ -69,19 +80,21 @@ class BusinessHoursOverrides:
                 f"overrides must be a dict, got {type(self.overrides).__name__}."
             )
 
-    def _build_normalized_overrides(self) -> Dict[date, Tuple[time, time]]:
+    def _build_normalized_overrides(self) -> Dict[date, Tuple[Tuple[time, time], ...]]:
         """Parse and validate all override entries.
 
         Returns:
-            A dictionary mapping date objects to (start_time, end_time) tuples
-            with timezone information attached.
+            A dictionary mapping date objects to sorted tuples of
+            (start_time, end_time) intervals with timezone information
+            attached. Overlapping same-day intervals are merged.
         """
-        normalized: Dict[date, Tuple[time, time]] = {}
+        normalized: Dict[date, Tuple[Tuple[time, time], ...]] = {}
 
-        for date_key, hours_dict in self.overrides.items():
+        for date_key, hours in self.overrides.items():
             override_date = self._parse_date_key(date_key)
-            start_time, end_time = self._parse_override_hours(date_key, hours_dict)
-            normalized[override_date] = (start_time, end_time)
+            normalized[override_date] = normalize_intervals(
+                self._parse_override_hours(date_key, hours)
+            )
 
         return normalized
 
@@ -108,9 +121,40 @@ class BusinessHoursOverrides:
             raise type(e)(f"Invalid override date key {date_key!r}: {e}")
 
     def _parse_override_hours(
+        self, date_key: Union[str, date], hours: OverrideHours
+    ) -> List[Tuple[time, time]]:
+        """Parse and validate a single date's override hours.
+
+        Args:
+            date_key: The original date key (for error messages).
+            hours: A dictionary with 'start' and 'end' time strings, or a
+                non-empty list of such dictionaries.
+
+        Returns:
+            A list of (start_time, end_time) tuples with timezone info attached.
+
+        Raises:
+            TypeError: If hours is not a dictionary or list of dictionaries.
+            ValueError: If the list is empty, required keys are missing,
+                times are invalid, or start equals end.
+        """
+        if isinstance(hours, list):
+            if not hours:
+                raise ValueError(
+                    f"overrides[{date_key!r}] must contain at least one interval. "
+                    "To mark a date as closed, exclude it from overrides and add it to holidays."
+                )
+            return [
+                self._parse_override_interval(date_key, hours_dict)
+                for hours_dict in hours
+            ]
+
+        return [self._parse_override_interval(date_key, hours)]
+
+    def _parse_override_interval(
         self, date_key: Union[str, date], hours_dict: Dict[str, str]
     ) -> Tuple[time, time]:
-        """Parse and validate a single date's override hours.
+        """Parse and validate one interval of a date's override hours.
 
         Args:
             date_key: The original date key (for error messages).
@@ -127,8 +171,8 @@ class BusinessHoursOverrides:
         # Validate structure
         if not isinstance(hours_dict, dict):
             raise TypeError(
-                f"overrides[{date_key!r}] must be a dict with 'start' and 'end' keys, "
-                f"got {type(hours_dict).__name__}."
+                f"overrides[{date_key!r}] must be a dict with 'start' and 'end' keys "
+                f"or a list of such dicts, got {type(hours_dict).__name__}."
             )
 
         if "start" not in hours_dict or "end" not in hours_dict:
@@ -205,12 +249,43 @@ class BusinessHoursOverrides:
             A tuple of (start_time, end_time) if an override exists for that date,
             or None if no override is defined.
 
+        Raises:
+            ValueError: If the override has more than one interval; use
+                get_override_intervals() for such dates.
+
         Example:
             >>> overrides.get_override_for_date("2025-12-24")
             (datetime.time(9, 0, tzinfo=...), datetime.time(12, 0, tzinfo=...))
             >>> overrides.get_override_for_date("2025-12-25")  # No override
             None
         """
+        intervals = self.get_override_intervals(d)
+        if intervals is None:
+            return None
+        if len(intervals) > 1:
+            raise ValueError(
+                f"The override for {self._normalize_date_lookup(d).isoformat()} has "
+                f"{len(intervals)} intervals; use get_override_intervals() instead."
+            )
+        return intervals[0]
+
+    def get_override_intervals(
+        self, d: Union[date, datetime, str]
+    ) -> Optional[Tuple[Tuple[time, time], ...]]:
+        """Get all override intervals for a specific date.
+
+        Args:
+            d: The date to look up. Can be a date object, datetime object,
+               or ISO date string ('YYYY-MM-DD').
+
+        Returns:
+            The date's (start_time, end_time) intervals in ascending order,
+            or None if no override is defined.
+
+        Example:
+            >>> overrides.get_override_intervals("2025-12-24")
+            ((datetime.time(9, 0, tzinfo=...), datetime.time(12, 0, tzinfo=...)),)
+        """
         lookup_date = self._normalize_date_lookup(d)
         return self._normalized.get(lookup_date)
 
@@ -230,7 +305,19 @@ class BusinessHoursOverrides:
             >>> overrides.is_override_for_date("2025-12-25")
             False
         """
-        return self.get_override_for_date(d) is not None
+        return self._normalize_date_lookup(d) in self._normalized
+
+    def get_override_dates(self) -> List[date]:
+        """Get all dates that have an override, in ascending order.
+
+        Returns:
+            A sorted list of date objects.
+
+        Example:
+            >>> overrides.get_override_dates()
+            [datetime.date(2025, 12, 24), datetime.date(2025, 12, 31)]
+        """
+        return sorted(self._normalized)
 
     # -------------------------------------------------------------------------
     # Internal Helpers
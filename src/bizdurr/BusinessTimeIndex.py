@@ -0,0 +1,144 @@
+"""Precomputed business time index.
+
+This module provides the BusinessTimeIndex class, which caches the running
+business time totals of a CompiledCalendar at every day boundary over a fixed
+date range, so that range queries skip the search over exception days.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Tuple
+
+from bizdurr.CompiledCalendar import (
+    MICROSECONDS_PER_DAY,
+    MICROSECONDS_PER_SECOND,
+    CompiledCalendar,
+    DaySegments,
+)
+from bizdurr.utils import EPOCH_ORDINAL
+
+
+@dataclass(frozen=True)
+class BusinessTimeIndex:
+    """Running business time totals of a compiled calendar over a date range.
+
+    The index holds, for each day in the range, the calendar's running total
+    at local midnight and the day's segments, both read from the calendar.
+    elapsed() therefore returns exactly CompiledCalendar.elapsed(), with a
+    list lookup in place of the bisect over the exception days.
+
+    Instances are immutable, so an index can be shared between threads.
+
+    Args:
+        calendar: The compiled calendar to index.
+        first_date: The first date covered by the index.
+        last_date: The last date covered by the index, inclusive.
+
+    Raises:
+        ValueError: If last_date is before first_date.
+
+    Example:
+        >>> index = BusinessTimeIndex(
+        ...     calendar=duration.calendar,
+        ...     first_date=date(2025, 1, 1),
+        ...     last_date=date(2030, 12, 31),
+        ... )
+        >>> index.duration(start_us, end_us) == duration.calendar.duration(start_us, end_us)
+        True
+    """
+
+    calendar: CompiledCalendar = field(repr=False)
+    first_date: date
+    last_date: date
+
+    # Derived fields (initialized in __post_init__)
+    _first_day: int = field(default=None, init=False, repr=False)
+    _day_totals: Tuple[int, ...] = field(default=None, init=False, repr=False)
+    _day_segments: Tuple[DaySegments, ...] = field(
+        default=None, init=False, repr=False
+    )
+
+    # -------------------------------------------------------------------------
+    # Initialization
+    # -------------------------------------------------------------------------
+
+    def __post_init__(self):
+        """Validate the range and read the calendar's tables for it."""
+        if self.last_date < self.first_date:
+            raise ValueError(
+                f"Range end ({self.last_date.isoformat()}) must not be before "
+                f"start ({self.first_date.isoformat()})."
+            )
+
+        first_day = self.first_date.toordinal() - EPOCH_ORDINAL
+        days = range(first_day, self.last_date.toordinal() - EPOCH_ORDINAL + 1)
+
+        object.__setattr__(self, "_first_day", first_day)
+        object.__setattr__(
+            self,
+            "_day_totals",
+            tuple(self.calendar._day_total(day) * MICROSECONDS_PER_SECOND for day in days),
+        )
+        object.__setattr__(
+            self, "_day_segments", tuple(map(self.calendar.segments_for_day, days))
+        )
+
+    # -------------------------------------------------------------------------
+    # Public Methods
+    # -------------------------------------------------------------------------
+
+    def covers(self, local_us: int) -> bool:
+        """Check if a local instant falls within the indexed range.
+
+        Args:
+            local_us: Microseconds of local wall-clock time since 1970-01-01.
+
+        Returns:
+            True if the index has an entry for the instant's date.
+        """
+        return 0 <= local_us // MICROSECONDS_PER_DAY - self._first_day < len(
+            self._day_totals
+        )
+
+    def elapsed(self, local_us: int) -> int:
+        """Get the calendar's running business time total at a local instant.
+
+        Args:
+            local_us: Microseconds of local wall-clock time since 1970-01-01,
+                within the indexed range.
+
+        Returns:
+            The same total as CompiledCalendar.elapsed(), in microseconds.
+
+        Raises:
+            ValueError: If the instant is outside the index.
+        """
+        day, time_of_day = divmod(local_us, MICROSECONDS_PER_DAY)
+        position = day - self._first_day
+        if not 0 <= position < len(self._day_totals):
+            raise ValueError(
+                f"{date.fromordinal(day + EPOCH_ORDINAL).isoformat()} is outside "
+                f"the indexed range {self.first_date.isoformat()} to "
+                f"{self.last_date.isoformat()}."
+            )
+
+        return self._day_totals[position] + CompiledCalendar._elapsed_within_day(
+            self._day_segments[position], time_of_day
+        )
+
+    def duration(self, start_us: int, end_us: int) -> int:
+        """Get the business time between two indexed local instants.
+
+        Args:
+            start_us: Interval start in local microseconds since 1970-01-01.
+            end_us: Interval end in local microseconds since 1970-01-01.
+
+        Returns:
+            The business time in microseconds, or 0 if end is not after start.
+
+        Raises:
+            ValueError: If either instant is outside the index.
+        """
+        if end_us <= start_us:
+            return 0
+        return max(self.elapsed(end_us) - self.elapsed(start_us), 0)
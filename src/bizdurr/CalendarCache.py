@@ -0,0 +1,179 @@
+"""Persistent cache of compiled calendars.
+
+This module provides the CalendarCache class, a directory of compiled
+calendars in the binary format of CompiledCalendar.to_bytes(). Each file is
+named after a content hash of the schedule inputs it was compiled from, so a
+later process building the same calendar maps the file in instead of parsing
+and validating the schedule again.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+from dataclasses import dataclass, field
+from datetime import date, time
+from pathlib import Path
+from typing import Any, Optional, Union
+from zoneinfo import ZoneInfo
+
+from bizdurr.BusinessHours import BusinessHours
+from bizdurr.BusinessHoursOverrides import BusinessHoursOverrides
+from bizdurr.CompiledCalendar import FORMAT_VERSION, CompiledCalendar
+
+# File extension of cached calendars
+CACHE_SUFFIX = ".bzcal"
+
+
+@dataclass
+class CalendarCache:
+    """A directory of compiled calendars keyed by a hash of their inputs.
+
+    Pass an instance to BusinessDuration(calendar_cache=...) to reuse
+    compiled calendars across processes and cold starts. Files are written
+    atomically, so several processes may share one directory, and are read
+    through a read-only memory map.
+
+    Entries never go stale: a key covers every schedule input and the
+    format version, so a changed calendar gets a new key. Old entries can
+    be removed with clear().
+
+    Args:
+        directory: Where cached calendars are stored. Created if missing.
+
+    Example:
+        >>> cache = CalendarCache("/var/cache/bizdurr")
+        >>> duration = BusinessDuration(
+        ...     business_hours={"start": "09:00", "end": "17:00"},
+        ...     business_timezone="America/New_York",
+        ...     holidays=["2025-12-25"],
+        ...     calendar_cache=cache,
+        ... )
+    """
+
+    directory: Union[str, Path]
+
+    # Internal fields (initialized in __post_init__)
+    _path: Path = field(default=None, init=False, repr=False)
+
+    # -------------------------------------------------------------------------
+    # Initialization
+    # -------------------------------------------------------------------------
+
+    def __post_init__(self):
+        """Create the cache directory if needed."""
+        self._path = Path(self.directory)
+        self._path.mkdir(parents=True, exist_ok=True)
+
+    # -------------------------------------------------------------------------
+    # Public Methods
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def key_for(business_hours, business_timezone, holidays, overrides) -> str:
+        """Compute the cache key for a set of BusinessDuration inputs.
+
+        The key is a hash of a canonical JSON encoding of the inputs, so
+        equal inputs give equal keys whether dates are date objects or ISO
+        strings and whatever the order of dict entries and holidays.
+
+        Args:
+            business_hours: As passed to BusinessDuration.
+            business_timezone: As passed to BusinessDuration.
+            holidays: As passed to BusinessDuration.
+            overrides: As passed to BusinessDuration.
+
+        Returns:
+            A hexadecimal content hash.
+
+        Raises:
+            ValueError: If business_timezone is a ZoneInfo without a key.
+        """
+        if isinstance(business_hours, BusinessHours):
+            business_hours = business_hours.schedule
+        if isinstance(overrides, BusinessHoursOverrides):
+            overrides = overrides.overrides
+        if isinstance(business_timezone, ZoneInfo):
+            if business_timezone.key is None:
+                raise ValueError("Cannot cache a calendar whose timezone has no key.")
+            business_timezone = business_timezone.key
+
+        content = {
+            "version": FORMAT_VERSION,
+            "business_hours": business_hours,
+            "business_timezone": business_timezone,
+            "holidays": sorted(_canonical(holiday) for holiday in holidays or ()),
+            "overrides": {
+                _canonical(day): hours for day, hours in (overrides or {}).items()
+            },
+        }
+        encoded = json.dumps(
+            content, sort_keys=True, separators=(",", ":"), default=_canonical
+        )
+        return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+    def load(self, key: str) -> Optional[CompiledCalendar]:
+        """Load the calendar stored under key.
+
+        Args:
+            key: A key from key_for().
+
+        Returns:
+            The cached CompiledCalendar, or None if there is no valid entry.
+            Unreadable or corrupt entries are treated as missing.
+        """
+        try:
+            with open(self._file_for(key), "rb") as cache_file:
+                with mmap.mmap(
+                    cache_file.fileno(), 0, access=mmap.ACCESS_READ
+                ) as mapped:
+                    return CompiledCalendar.from_buffer(mapped)
+        except (OSError, ValueError):
+            return None
+
+    def store(self, key: str, calendar: CompiledCalendar) -> None:
+        """Store a calendar under key, replacing any existing entry.
+
+        The file is written under a temporary name and renamed into place,
+        so concurrent readers never see a partial entry.
+
+        Args:
+            key: A key from key_for().
+            calendar: The compiled calendar to store.
+        """
+        descriptor, temporary = tempfile.mkstemp(
+            dir=self._path, prefix=".", suffix=CACHE_SUFFIX
+        )
+        try:
+            with os.fdopen(descriptor, "wb") as cache_file:
+                cache_file.write(calendar.to_bytes())
+            os.replace(temporary, self._file_for(key))
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def clear(self) -> None:
+        """Delete every cached calendar in the directory."""
+        for path in self._path.glob(f"*{CACHE_SUFFIX}"):
+            path.unlink(missing_ok=True)
+
+    def __contains__(self, key: str) -> bool:
+        return self._file_for(key).exists()
+
+    # -------------------------------------------------------------------------
+    # Internal Helpers
+    # -------------------------------------------------------------------------
+
+    def _file_for(self, key: str) -> Path:
+        """Get the path of the entry for a key."""
+        return self._path / f"{key}{CACHE_SUFFIX}"
+
+
+def _canonical(value: Any) -> str:
+    """Encode dates and times that JSON cannot represent as ISO strings."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    raise TypeError(f"Cannot compute a cache key for {type(value).__name__}.")
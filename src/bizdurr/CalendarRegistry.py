@@ -0,0 +1,398 @@
+"""Multi-tenant calendar registry.
+
+This module provides the CalendarRegistry class, which maps tenant IDs to
+business calendars. Tenants with identical calendars share one
+BusinessDuration and one CompiledCalendar, so memory grows with the number of
+distinct calendars rather than the number of tenants.
+"""
+
+import threading
+import weakref
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, Iterable, List, NamedTuple, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from bizdurr.BusinessDuration import BusinessDuration
+from bizdurr.CalendarCache import CalendarCache
+from bizdurr.CompiledCalendar import CompiledCalendar
+from bizdurr.FrozenBusinessDuration import FrozenBusinessDuration
+from bizdurr.utils import import_optional
+
+
+class RegistryInfo(NamedTuple):
+    """Statistics reported by CalendarRegistry.info()."""
+
+    tenants: int
+    calendars: int
+    compiled_calendars: int
+
+
+@dataclass
+class CalendarRegistry:
+    """Business calendars for many tenants, deduplicated.
+
+    register() looks a tenant's inputs up by a content hash (the key of
+    CalendarCache.key_for()), so tenants whose inputs are equal share a
+    BusinessDuration without compiling it again. Inputs that differ but
+    compile to the same calendar in the same timezone are shared as well,
+    and the CompiledCalendar tables are shared across timezones.
+
+    The handle returned for a tenant is a FrozenBusinessDuration shared with
+    every tenant that has the same calendar; to change a tenant's calendar,
+    register the tenant again. Registration holds a lock, and lookups and
+    queries can run from any number of threads.
+
+    Args:
+        calendar_cache: Optional CalendarCache passed to every
+            BusinessDuration the registry builds.
+
+    Example:
+        >>> registry = CalendarRegistry()
+        >>> for tenant in ("acme", "globex"):
+        ...     registry.register(
+        ...         tenant,
+        ...         business_hours={"start": "09:00", "end": "17:00"},
+        ...         business_timezone="America/New_York",
+        ...         holidays=["2025-12-25"],
+        ...     )
+        >>> registry.info()
+        RegistryInfo(tenants=2, calendars=1, compiled_calendars=1)
+        >>> registry.calculate_many(["acme", "globex"], starts, ends)
+    """
+
+    calendar_cache: Optional[CalendarCache] = field(default=None, repr=False)
+
+    # Internal fields (initialized in __post_init__)
+    _tenants: Dict[Hashable, str] = field(default=None, init=False, repr=False)
+    _durations: Dict[str, FrozenBusinessDuration] = field(
+        default=None, init=False, repr=False
+    )
+    _key_counts: Dict[str, int] = field(default=None, init=False, repr=False)
+    _shared: "weakref.WeakValueDictionary" = field(
+        default=None, init=False, repr=False
+    )
+    _calendars: "weakref.WeakValueDictionary" = field(
+        default=None, init=False, repr=False
+    )
+    _lock: threading.Lock = field(default=None, init=False, repr=False)
+
+    # -------------------------------------------------------------------------
+    # Initialization
+    # -------------------------------------------------------------------------
+
+    def __post_init__(self):
+        """Create the empty tenant and intern tables."""
+        self._tenants = {}
+        self._durations = {}
+        self._key_counts = {}
+        # Both intern tables drop an entry once no tenant uses it
+        self._shared = weakref.WeakValueDictionary()
+        self._calendars = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    # -------------------------------------------------------------------------
+    # Public Methods
+    # -------------------------------------------------------------------------
+
+    def register(
+        self,
+        tenant_id: Hashable,
+        business_hours,
+        business_timezone,
+        holidays=None,
+        overrides=None,
+    ) -> FrozenBusinessDuration:
+        """Register a tenant's calendar, replacing any previous one.
+
+        Args:
+            tenant_id: Any hashable tenant identifier.
+            business_hours: As passed to BusinessDuration.
+            business_timezone: As passed to BusinessDuration.
+            holidays: As passed to BusinessDuration.
+            overrides: As passed to BusinessDuration.
+
+        Returns:
+            The FrozenBusinessDuration shared by every tenant with this
+            calendar.
+
+        Raises:
+            TypeError: If the inputs have invalid types.
+            ValueError: If the inputs are invalid.
+
+        Example:
+            >>> registry.register(
+            ...     "acme",
+            ...     business_hours={"start": "09:00", "end": "17:00"},
+            ...     business_timezone="America/New_York",
+            ... )
+        """
+        with self._lock:
+            try:
+                key = CalendarCache.key_for(
+                    business_hours, business_timezone, holidays, overrides
+                )
+            except (TypeError, ValueError):
+                # Compile without a content hash; invalid inputs raise here
+                duration = self._build(
+                    business_hours, business_timezone, holidays, overrides
+                )
+                key = f"{id(duration):x}"
+                self._durations[key] = duration
+
+            if key not in self._durations:
+                self._durations[key] = self._build(
+                    business_hours, business_timezone, holidays, overrides
+                )
+
+            # Point the tenant at the new key before releasing the old one
+            # (which may be the same), so lookups never miss the tenant
+            self._key_counts[key] = self._key_counts.get(key, 0) + 1
+            previous = self._tenants.get(tenant_id)
+            self._tenants[tenant_id] = key
+            if previous is not None:
+                self._release(previous)
+            return self._durations[key]
+
+    def unregister(self, tenant_id: Hashable) -> None:
+        """Remove a tenant. Unknown tenants are ignored.
+
+        Calendars that no other tenant uses are released.
+
+        Args:
+            tenant_id: The tenant to remove.
+        """
+        with self._lock:
+            key = self._tenants.pop(tenant_id, None)
+            if key is not None:
+                self._release(key)
+
+    def get(self, tenant_id: Hashable) -> FrozenBusinessDuration:
+        """Get the calendar of a tenant.
+
+        Args:
+            tenant_id: A registered tenant.
+
+        Returns:
+            The tenant's shared FrozenBusinessDuration.
+
+        Raises:
+            KeyError: If the tenant is not registered.
+        """
+        try:
+            return self._durations[self._tenants[tenant_id]]
+        except KeyError:
+            pass
+
+        # The tenant may have been re-registered between the two lookups
+        with self._lock:
+            try:
+                return self._durations[self._tenants[tenant_id]]
+            except KeyError:
+                raise KeyError(f"Unknown tenant: {tenant_id!r}.") from None
+
+    def get_many(
+        self, tenant_ids: Iterable[Hashable]
+    ) -> List[FrozenBusinessDuration]:
+        """Get the calendars of several tenants.
+
+        Args:
+            tenant_ids: Registered tenants.
+
+        Returns:
+            The tenants' shared FrozenBusinessDuration objects, in order.
+
+        Raises:
+            KeyError: If a tenant is not registered.
+        """
+        return [self.get(tenant_id) for tenant_id in tenant_ids]
+
+    def calculate_many(self, tenant_ids, starts, ends):
+        """Calculate business durations for rows belonging to many tenants.
+
+        Rows are grouped by calendar, and each group is evaluated with one
+        BusinessDuration.calculate_many() call, so the cost grows with the
+        number of distinct calendars rather than the number of tenants.
+
+        Args:
+            tenant_ids: One registered tenant ID per row.
+            starts: A numpy datetime64 array or a sequence of datetimes with
+                one entry per row, or a single datetime for every row.
+            ends: Same as starts.
+
+        Returns:
+            A numpy timedelta64[us] array with one duration per row.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            KeyError: If a tenant is not registered.
+            ValueError: If an input does not have one entry per row.
+
+        Example:
+            >>> registry.calculate_many(
+            ...     ["acme", "globex", "acme"], starts, ends
+            ... )
+        """
+        return self._evaluate_many(
+            "calculate_many", "timedelta64[us]", tenant_ids, starts, ends
+        )
+
+    def add_business_time_many(self, tenant_ids, starts, durations):
+        """Find deadlines for rows belonging to many tenants.
+
+        The multi-tenant form of BusinessDuration.add_business_time_many().
+
+        Args:
+            tenant_ids: One registered tenant ID per row.
+            starts: A numpy datetime64 array or a sequence of datetimes with
+                one entry per row, or a single datetime for every row.
+            durations: A numpy timedelta64 array or a sequence of timedeltas
+                with one entry per row, or a single timedelta.
+
+        Returns:
+            A numpy datetime64[us] array of naive deadlines, each in its
+            tenant's business timezone.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            KeyError: If a tenant is not registered.
+            ValueError: If an input does not have one entry per row, or a
+                calendar never accumulates enough business time.
+        """
+        return self._evaluate_many(
+            "add_business_time_many", "datetime64[us]", tenant_ids, starts, durations
+        )
+
+    def info(self) -> RegistryInfo:
+        """Count the tenants and the distinct calendars they share.
+
+        Returns:
+            A RegistryInfo with the number of tenants, of distinct
+            BusinessDuration objects, and of distinct CompiledCalendar tables.
+        """
+        with self._lock:
+            durations = {
+                id(duration): duration for duration in self._durations.values()
+            }
+            tenants = len(self._tenants)
+        compiled = {id(duration.calendar) for duration in durations.values()}
+        return RegistryInfo(
+            tenants=tenants,
+            calendars=len(durations),
+            compiled_calendars=len(compiled),
+        )
+
+    def __contains__(self, tenant_id: Hashable) -> bool:
+        return tenant_id in self._tenants
+
+    def __len__(self) -> int:
+        return len(self._tenants)
+
+    # -------------------------------------------------------------------------
+    # Internal Helpers
+    # -------------------------------------------------------------------------
+
+    def _release(self, key: str) -> None:
+        """Drop one tenant's use of a key, and the calendar if it was the last."""
+        self._key_counts[key] -= 1
+        if not self._key_counts[key]:
+            del self._key_counts[key]
+            del self._durations[key]
+
+    def _build(
+        self, business_hours, business_timezone, holidays, overrides
+    ) -> FrozenBusinessDuration:
+        """Compile a calendar, or reuse an equal one that is already shared.
+
+        Returns:
+            A FrozenBusinessDuration whose compiled tables are interned.
+        """
+        duration = BusinessDuration(
+            business_hours=business_hours,
+            business_timezone=business_timezone,
+            holidays=holidays,
+            overrides=overrides,
+            calendar_cache=self.calendar_cache,
+        )
+
+        shared_key: Tuple[ZoneInfo, CompiledCalendar] = (
+            duration.business_timezone,
+            duration.calendar,
+        )
+        shared = self._shared.get(shared_key)
+        if shared is not None:
+            return shared
+
+        duration._calendar = self._calendars.setdefault(
+            duration.calendar, duration.calendar
+        )
+        frozen = FrozenBusinessDuration.from_duration(duration)
+        self._shared[(frozen.business_timezone, frozen.calendar)] = frozen
+        return frozen
+
+    def _evaluate_many(self, method_name: str, dtype: str, tenant_ids, *columns):
+        """Evaluate a batch method of BusinessDuration per calendar group.
+
+        Args:
+            method_name: The BusinessDuration method to call per group.
+            dtype: The dtype of the result array.
+            tenant_ids: One registered tenant ID per row.
+            *columns: Per-row inputs, or scalars applied to every row.
+
+        Returns:
+            The per-row results, in row order.
+        """
+        np = import_optional("numpy")
+
+        # Kept as Python objects, since NumPy would coerce mixed or tuple IDs
+        if isinstance(tenant_ids, np.ndarray):
+            tenant_ids = tenant_ids.tolist()
+        else:
+            tenant_ids = list(tenant_ids)
+        row_count = len(tenant_ids)
+        columns = [self._as_column(column, row_count) for column in columns]
+
+        # Map each distinct tenant, then each row, to a calendar group
+        groups: Dict[int, int] = {}
+        durations = []
+        group_of_tenant: Dict[Hashable, int] = {}
+        for tenant_id in dict.fromkeys(tenant_ids):
+            duration = self.get(tenant_id)
+            if id(duration) not in groups:
+                groups[id(duration)] = len(durations)
+                durations.append(duration)
+            group_of_tenant[tenant_id] = groups[id(duration)]
+        group_of_row = np.fromiter(
+            (group_of_tenant[tenant_id] for tenant_id in tenant_ids),
+            dtype=np.int64,
+            count=row_count,
+        )
+
+        result = np.empty(row_count, dtype=dtype)
+        order = np.argsort(group_of_row, kind="stable")
+        bounds = np.searchsorted(group_of_row[order], np.arange(len(durations) + 1))
+        for group, duration in enumerate(durations):
+            rows = order[bounds[group] : bounds[group + 1]]
+            result[rows] = getattr(duration, method_name)(
+                *(column if np.ndim(column) == 0 else column[rows] for column in columns)
+            )
+        return result
+
+    @staticmethod
+    def _as_column(values, row_count: int):
+        """Convert a per-row input to an indexable array, keeping scalars.
+
+        Raises:
+            ValueError: If the input does not have one entry per row.
+        """
+        np = import_optional("numpy")
+
+        if not isinstance(values, np.ndarray):
+            if np.ndim(values) == 0 or not isinstance(values, Iterable):
+                return values
+            values = np.array(list(values), dtype=object)
+
+        if values.ndim and len(values) != row_count:
+            raise ValueError(
+                f"Expected {row_count} values, one per tenant ID, got {len(values)}."
+            )
+        return values
@@ -0,0 +1,1076 @@
+"""Compiled business calendar.
+
+This module provides the CompiledCalendar class, an integer representation of
+a weekly schedule plus its per-date exceptions. Times are expressed as
+microseconds of local wall-clock time since 1970-01-01 00:00 in the business
+timezone, which lets whole arrays of timestamps be evaluated at once.
+"""
+
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import date
+from functools import cached_property
+from typing import Callable, Tuple
+
+from bizdurr.utils import EPOCH_ORDINAL, SECONDS_PER_DAY, import_optional
+
+# Time unit conversions (the compiled calendar works in microseconds)
+MICROSECONDS_PER_SECOND = 1_000_000
+MICROSECONDS_PER_DAY = SECONDS_PER_DAY * MICROSECONDS_PER_SECOND
+
+# 1970-01-01 was a Thursday; shifting epoch days by 3 aligns weeks to Monday
+EPOCH_WEEKDAY_SHIFT = 3
+
+# Range of epoch days representable as datetime objects
+MIN_DAY = date.min.toordinal() - EPOCH_ORDINAL
+MAX_DAY = date.max.toordinal() - EPOCH_ORDINAL
+
+# Binary format written by to_bytes(): a header of magic bytes, format
+# version, and the numbers of distinct day schedules, their segments, and
+# exception days, followed by little-endian int64 tables
+FORMAT_MAGIC = b"BZCC"
+FORMAT_VERSION = 1
+FORMAT_HEADER = struct.Struct("<4sIQQQ")
+
+Segment = Tuple[int, int]
+DaySegments = Tuple[Segment, ...]
+
+
+@dataclass(frozen=True)
+class CompiledCalendar:
+    """Integer representation of a business calendar.
+
+    A day is identified by its epoch day number (days since 1970-01-01) and
+    its business hours by a tuple of (start, end) segments in seconds from
+    local midnight. Regular hours come from a 7-entry weekday table; holidays
+    and overrides are stored as exceptions keyed by epoch day.
+
+    Business time is accumulated as a running total from a fixed origin, so
+    the business time between two instants is the difference of two
+    lookups. Each lookup is constant-time arithmetic plus one bisect over
+    the exception days.
+
+    The derived week_prefix holds the running total in seconds at the start
+    of each weekday, and exception_offsets the running total of
+    (actual - regular) seconds before each exception day.
+
+    Instances are immutable, and every query method is lock-free: queries
+    only read the tables, so one calendar can be shared by any number of
+    threads. The NumPy tables used by the array methods are built on first
+    use; two threads that race to build them each get an identical copy.
+
+    Args:
+        weekday_segments: Seven tuples of segments indexed by weekday
+            (Monday == 0).
+        exception_days: Sorted epoch day numbers of holidays and overrides.
+        exception_segments: Segments for each entry of exception_days. An
+            empty tuple marks the day as closed.
+
+    Raises:
+        ValueError: If the weekday table does not have seven entries, the
+            exception tables are misaligned or unsorted, or a segment is
+            empty or falls outside [0, 86400].
+
+    Example:
+        >>> calendar = CompiledCalendar(
+        ...     weekday_segments=(((32400, 61200),),) * 5 + ((), ()),
+        ...     exception_days=(),
+        ...     exception_segments=(),
+        ... )
+        >>> calendar.week_seconds
+        144000
+    """
+
+    weekday_segments: Tuple[DaySegments, ...]
+    exception_days: Tuple[int, ...] = ()
+    exception_segments: Tuple[DaySegments, ...] = ()
+
+    # Derived fields (initialized in __post_init__)
+    weekday_seconds: Tuple[int, ...] = field(default=None, init=False, repr=False)
+    week_seconds: int = field(default=None, init=False, repr=False)
+    week_prefix: Tuple[int, ...] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    exception_offsets: Tuple[int, ...] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # -------------------------------------------------------------------------
+    # Initialization
+    # -------------------------------------------------------------------------
+
+    def __post_init__(self):
+        """Validate the tables and precompute running totals."""
+        self._validate_tables()
+
+        weekday_seconds = tuple(
+            self._segments_seconds(segments) for segments in self.weekday_segments
+        )
+        week_prefix = [0]
+        for seconds in weekday_seconds:
+            week_prefix.append(week_prefix[-1] + seconds)
+
+        # Running total of (actual - regular) seconds over the exception days
+        exception_offsets = [0]
+        for day, segments in zip(self.exception_days, self.exception_segments):
+            regular = weekday_seconds[self.weekday_of(day)]
+            delta = self._segments_seconds(segments) - regular
+            exception_offsets.append(exception_offsets[-1] + delta)
+
+        object.__setattr__(self, "weekday_seconds", weekday_seconds)
+        object.__setattr__(self, "week_seconds", week_prefix[-1])
+        object.__setattr__(self, "week_prefix", tuple(week_prefix))
+        object.__setattr__(self, "exception_offsets", tuple(exception_offsets))
+
+    def _validate_tables(self) -> None:
+        """Ensure the weekday and exception tables are well formed."""
+        if len(self.weekday_segments) != 7:
+            raise ValueError(
+                f"weekday_segments must have 7 entries, got {len(self.weekday_segments)}."
+            )
+
+        if len(self.exception_days) != len(self.exception_segments):
+            raise ValueError(
+                "exception_days and exception_segments must have the same length."
+            )
+
+        if any(a >= b for a, b in zip(self.exception_days, self.exception_days[1:])):
+            raise ValueError("exception_days must be strictly increasing.")
+
+        for segments in self.weekday_segments + self.exception_segments:
+            for start, end in segments:
+                if not 0 <= start < end <= SECONDS_PER_DAY:
+                    raise ValueError(
+                        f"Invalid segment ({start}, {end}). Segments must satisfy "
+                        f"0 <= start < end <= {SECONDS_PER_DAY}."
+                    )
+
+    @staticmethod
+    def _segments_seconds(segments: DaySegments) -> int:
+        """Get the total length of a day's segments in seconds."""
+        return sum(end - start for start, end in segments)
+
+    # -------------------------------------------------------------------------
+    # Public Methods
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def weekday_of(day: int) -> int:
+        """Get the weekday of an epoch day number (Monday == 0)."""
+        return (day + EPOCH_WEEKDAY_SHIFT) % 7
+
+    @property
+    def segment_width(self) -> int:
+        """The largest number of segments on any day (at least 1)."""
+        return max(
+            [len(segments) for segments in self.weekday_segments]
+            + [len(segments) for segments in self.exception_segments]
+            + [1]
+        )
+
+    def segments_for_day(self, day: int) -> DaySegments:
+        """Get the business segments for an epoch day number.
+
+        Args:
+            day: Days since 1970-01-01.
+
+        Returns:
+            A tuple of (start_seconds, end_seconds) segments, empty if closed.
+        """
+        position = bisect_left(self.exception_days, day)
+        if position < len(self.exception_days) and self.exception_days[position] == day:
+            return self.exception_segments[position]
+        return self.weekday_segments[self.weekday_of(day)]
+
+    def is_open(self, local_us: int) -> bool:
+        """Check if a local instant falls within a business segment.
+
+        Args:
+            local_us: Microseconds of local wall-clock time since 1970-01-01.
+
+        Returns:
+            True if some segment of that day contains the instant, treating
+            segments as half-open [start, end).
+        """
+        day, time_of_day = divmod(local_us, MICROSECONDS_PER_DAY)
+        return any(
+            start * MICROSECONDS_PER_SECOND <= time_of_day < end * MICROSECONDS_PER_SECOND
+            for start, end in self.segments_for_day(day)
+        )
+
+    def elapsed(self, local_us: int) -> int:
+        """Get the running business time total at a local instant.
+
+        The origin of the total is arbitrary but fixed, so only differences
+        between two results are meaningful.
+
+        Args:
+            local_us: Microseconds of local wall-clock time since 1970-01-01.
+
+        Returns:
+            The running business time total in microseconds.
+        """
+        day, time_of_day = divmod(local_us, MICROSECONDS_PER_DAY)
+        weeks, weekday = divmod(day + EPOCH_WEEKDAY_SHIFT, 7)
+
+        position = bisect_left(self.exception_days, day)
+        total_seconds = (
+            weeks * self.week_seconds
+            + self.week_prefix[weekday]
+            + self.exception_offsets[position]
+        )
+
+        if position < len(self.exception_days) and self.exception_days[position] == day:
+            segments = self.exception_segments[position]
+        else:
+            segments = self.weekday_segments[weekday]
+
+        return total_seconds * MICROSECONDS_PER_SECOND + self._elapsed_within_day(
+            segments, time_of_day
+        )
+
+    def duration(self, start_us: int, end_us: int) -> int:
+        """Get the business time between two local instants.
+
+        Args:
+            start_us: Interval start in local microseconds since 1970-01-01.
+            end_us: Interval end in local microseconds since 1970-01-01.
+
+        Returns:
+            The business time in microseconds, or 0 if end is not after start.
+        """
+        if end_us <= start_us:
+            return 0
+        return max(self.elapsed(end_us) - self.elapsed(start_us), 0)
+
+    def advance(self, local_us: int, amount_us: int) -> int:
+        """Find the instant a given amount of business time away.
+
+        For a positive amount this is the earliest instant at which amount_us
+        of business time has elapsed since local_us, so a deadline that uses
+        up a day's hours exactly lands on that day's close. For a negative
+        amount it is the latest instant from which -amount_us of business time
+        remains until local_us, which lands on an opening time rather than
+        the previous close.
+
+        The day is located with a galloping binary search over the running
+        day totals, so the cost grows with the logarithm of the distance
+        rather than the number of days.
+
+        Args:
+            local_us: The starting instant in local microseconds since 1970-01-01.
+            amount_us: Business time to add (positive) or subtract (negative).
+
+        Returns:
+            The resulting instant in local microseconds since 1970-01-01.
+
+        Raises:
+            ValueError: If the calendar never accumulates enough business time
+                in the requested direction.
+        """
+        if amount_us == 0:
+            return local_us
+
+        target = self.elapsed(local_us) + amount_us
+        anchor_day = local_us // MICROSECONDS_PER_DAY
+
+        if amount_us > 0:
+            # The day before the first day boundary that reaches the target
+            day = self._find_day(
+                lambda d: self._day_total(d) * MICROSECONDS_PER_SECOND >= target,
+                anchor_day,
+                forward=True,
+            ) - 1
+        else:
+            # The day before the first day boundary that passes the target
+            day = self._find_day(
+                lambda d: self._day_total(d) * MICROSECONDS_PER_SECOND > target,
+                anchor_day + 1,
+                forward=False,
+            ) - 1
+
+        remaining = target - self._day_total(day) * MICROSECONDS_PER_SECOND
+        for start, end in self.segments_for_day(day):
+            length = (end - start) * MICROSECONDS_PER_SECOND
+            if remaining < length or (amount_us > 0 and remaining == length):
+                return (
+                    day * MICROSECONDS_PER_DAY
+                    + start * MICROSECONDS_PER_SECOND
+                    + remaining
+                )
+            remaining -= length
+
+        raise AssertionError("advance() failed to locate the target segment.")
+
+    def next_open(self, local_us: int) -> int:
+        """Find the first instant at or after local_us when business is open.
+
+        Args:
+            local_us: Microseconds of local wall-clock time since 1970-01-01.
+
+        Returns:
+            local_us itself if it falls within business hours, otherwise the
+            start of the next business segment.
+
+        Raises:
+            ValueError: If the calendar never opens again.
+        """
+        # The earliest instant at which one microsecond has been worked ends
+        # the first business microsecond at or after local_us
+        return self.advance(local_us, 1) - 1
+
+    def next_close(self, local_us: int) -> int:
+        """Find the first closing time after local_us.
+
+        Args:
+            local_us: Microseconds of local wall-clock time since 1970-01-01.
+
+        Returns:
+            The end of the business segment in progress at local_us, or of
+            the next one if business is closed at local_us. Segments that
+            meet at midnight, such as the halves of an overnight shift,
+            count as one.
+
+        Raises:
+            ValueError: If the calendar never opens again, or never closes.
+        """
+        return self._continuous_end(self._segment_bounds(self.next_open(local_us))[1])
+
+    def previous_close(self, local_us: int) -> int:
+        """Find the last closing time at or before local_us.
+
+        Args:
+            local_us: Microseconds of local wall-clock time since 1970-01-01.
+
+        Returns:
+            The end of the latest business segment that ended at or before
+            local_us. Segments that meet at midnight count as one.
+
+        Raises:
+            ValueError: If the calendar was never open before local_us.
+        """
+        # The last business microsecond before local_us
+        start, end = self._segment_bounds(self.advance(local_us, -1))
+        end = self._continuous_end(end)
+        if end <= local_us:
+            return end
+        # Business is open at local_us, so look before the current segment
+        start = self._continuous_start(start)
+        return self._segment_bounds(self.advance(start, -1))[1]
+
+    def closed_exception_days(self, first_day: int, last_day: int) -> Tuple[int, ...]:
+        """Get the exception days without business hours in a range.
+
+        These are the holidays: overrides always have business hours. Only
+        the exception days in the range are visited, located by bisect.
+
+        Args:
+            first_day: The first epoch day of the range.
+            last_day: The last epoch day of the range, inclusive.
+
+        Returns:
+            The matching epoch day numbers in increasing order.
+        """
+        closed_days = self._open_day_tables["closed_days"]
+        start = bisect_left(closed_days, first_day)
+        end = bisect_right(closed_days, last_day)
+        return closed_days[start:end]
+
+    def open_day_count(self, first_day: int, last_day: int) -> int:
+        """Count the days with business hours in a range.
+
+        Like elapsed(), this is a difference of two running totals, so the
+        cost does not depend on the length of the range.
+
+        Args:
+            first_day: The first epoch day of the range.
+            last_day: The last epoch day of the range, inclusive.
+
+        Returns:
+            The number of days in the range with at least one segment, or 0
+            if last_day is before first_day.
+        """
+        if last_day < first_day:
+            return 0
+        return self._open_day_total(last_day + 1) - self._open_day_total(first_day)
+
+    def _segment_bounds(self, local_us: int) -> Tuple[int, int]:
+        """Get the business segment containing an open instant.
+
+        Args:
+            local_us: An instant within business hours, in local microseconds.
+
+        Returns:
+            The segment's (start, end) in local microseconds since 1970-01-01.
+        """
+        day, time_of_day = divmod(local_us, MICROSECONDS_PER_DAY)
+        midnight = day * MICROSECONDS_PER_DAY
+
+        for start, end in self.segments_for_day(day):
+            end_us = end * MICROSECONDS_PER_SECOND
+            if time_of_day < end_us:
+                return midnight + start * MICROSECONDS_PER_SECOND, midnight + end_us
+
+        raise AssertionError("_segment_bounds() called outside business hours.")
+
+    def _continuous_start(self, start_us: int) -> int:
+        """Move a segment start at midnight back over segments ending there.
+
+        The halves of an overnight shift meet at midnight, and are one
+        segment as far as opening and closing times are concerned.
+
+        Raises:
+            ValueError: If business is open around the clock before start_us.
+        """
+        while start_us % MICROSECONDS_PER_DAY == 0:
+            day = start_us // MICROSECONDS_PER_DAY - 1
+            segments = self.segments_for_day(day)
+            if not segments or segments[-1][1] != SECONDS_PER_DAY:
+                break
+            if self._is_open_around_the_clock(day, forward=False):
+                raise ValueError("The calendar was never closed before this time.")
+            start_us -= (SECONDS_PER_DAY - segments[-1][0]) * MICROSECONDS_PER_SECOND
+        return start_us
+
+    def _continuous_end(self, end_us: int) -> int:
+        """Move a segment end at midnight on over segments starting there.
+
+        Raises:
+            ValueError: If business is open around the clock after end_us.
+        """
+        while end_us % MICROSECONDS_PER_DAY == 0:
+            day = end_us // MICROSECONDS_PER_DAY
+            segments = self.segments_for_day(day)
+            if not segments or segments[0][0] != 0:
+                break
+            if self._is_open_around_the_clock(day, forward=True):
+                raise ValueError("The calendar never closes after this time.")
+            end_us += segments[0][1] * MICROSECONDS_PER_SECOND
+        return end_us
+
+    def _is_open_around_the_clock(self, day: int, forward: bool) -> bool:
+        """Check if every day after (or before) a day is open all day long."""
+        if self.week_seconds < 7 * SECONDS_PER_DAY:
+            return False
+        if not self.exception_days:
+            return True
+        if forward:
+            return day > self.exception_days[-1]
+        return day < self.exception_days[0]
+
+    @staticmethod
+    def _elapsed_within_day(segments: DaySegments, time_of_day: int) -> int:
+        """Get the business microseconds of a day's segments before a time of day."""
+        total = 0
+        for start, end in segments:
+            start_us = start * MICROSECONDS_PER_SECOND
+            if time_of_day <= start_us:
+                break
+            total += min(time_of_day, end * MICROSECONDS_PER_SECOND) - start_us
+        return total
+
+    def _day_total(self, day: int) -> int:
+        """Get the running business time total in seconds at the start of a day."""
+        weeks, weekday = divmod(day + EPOCH_WEEKDAY_SHIFT, 7)
+        return (
+            weeks * self.week_seconds
+            + self.week_prefix[weekday]
+            + self.exception_offsets[bisect_left(self.exception_days, day)]
+        )
+
+    def _open_day_total(self, day: int) -> int:
+        """Get the running count of days with business hours before a day."""
+        tables = self._open_day_tables
+        weeks, weekday = divmod(day + EPOCH_WEEKDAY_SHIFT, 7)
+        return (
+            weeks * tables["week_prefix"][-1]
+            + tables["week_prefix"][weekday]
+            + tables["exception_offsets"][bisect_left(self.exception_days, day)]
+        )
+
+    @cached_property
+    def _open_day_tables(self):
+        """Running counts of open days, built on first use like week_prefix.
+
+        Returns:
+            A dict with the open weekdays' running count ("week_prefix"), the
+            running total of (open - regularly open) over the exception days
+            ("exception_offsets"), and the sorted closed exception days
+            ("closed_days").
+        """
+        week_prefix = [0]
+        for segments in self.weekday_segments:
+            week_prefix.append(week_prefix[-1] + bool(segments))
+
+        exception_offsets = [0]
+        closed_days = []
+        for day, segments in zip(self.exception_days, self.exception_segments):
+            regular = bool(self.weekday_segments[self.weekday_of(day)])
+            exception_offsets.append(exception_offsets[-1] + bool(segments) - regular)
+            if not segments:
+                closed_days.append(day)
+
+        return {
+            "week_prefix": tuple(week_prefix),
+            "exception_offsets": tuple(exception_offsets),
+            "closed_days": tuple(closed_days),
+        }
+
+    @staticmethod
+    def _find_day(
+        predicate: Callable[[int], bool], anchor: int, forward: bool
+    ) -> int:
+        """Find the first day for which a monotone predicate holds.
+
+        The predicate must be False before some day and True from then on.
+        Searching forward, predicate(anchor) must be False; searching
+        backward, predicate(anchor) must be True. The search gallops away
+        from the anchor in doubling steps and then bisects.
+
+        Args:
+            predicate: A monotone function of the epoch day number.
+            anchor: The day to search from.
+            forward: Whether to search later (True) or earlier (False) days.
+
+        Returns:
+            The smallest day for which the predicate is True.
+
+        Raises:
+            ValueError: If no such day exists within the datetime range.
+        """
+        step = 1
+        if forward:
+            low, high = anchor, min(anchor + 1, MAX_DAY)
+            while not predicate(high):
+                if high == MAX_DAY:
+                    raise ValueError(
+                        "The calendar does not have enough business time after "
+                        "the start to reach the requested amount."
+                    )
+                low, high = high, min(high + step, MAX_DAY)
+                step *= 2
+        else:
+            low, high = max(anchor - 1, MIN_DAY), anchor
+            while predicate(low):
+                if low == MIN_DAY:
+                    raise ValueError(
+                        "The calendar does not have enough business time before "
+                        "the start to cover the requested amount."
+                    )
+                low, high = max(low - step, MIN_DAY), low
+                step *= 2
+
+        # predicate(low) is False and predicate(high) is True
+        while high - low > 1:
+            middle = (low + high) // 2
+            if predicate(middle):
+                high = middle
+            else:
+                low = middle
+        return high
+
+    # -------------------------------------------------------------------------
+    # Serialization
+    # -------------------------------------------------------------------------
+
+    def to_bytes(self) -> bytes:
+        """Encode the calendar in a compact binary format.
+
+        Each distinct day schedule is stored once, and the weekdays and
+        exception days refer to it by position. The encoding also holds the
+        precomputed exception offsets, so from_buffer() can load it without
+        recomputing or revalidating anything. All values are little-endian
+        int64s after a fixed header.
+
+        Returns:
+            The encoded calendar.
+
+        Example:
+            >>> CompiledCalendar.from_buffer(calendar.to_bytes()) == calendar
+            True
+        """
+        positions = {}
+        for segments in self.weekday_segments + self.exception_segments:
+            positions.setdefault(segments, len(positions))
+
+        values = array("q", [len(segments) for segments in positions])
+        for segments in positions:
+            for start, end in segments:
+                values.append(start)
+                values.append(end)
+        values.extend(positions[segments] for segments in self.weekday_segments)
+        values.extend(self.exception_days)
+        values.extend(positions[segments] for segments in self.exception_segments)
+        values.extend(self.exception_offsets)
+
+        if sys.byteorder == "big":
+            values.byteswap()
+
+        header = FORMAT_HEADER.pack(
+            FORMAT_MAGIC,
+            FORMAT_VERSION,
+            len(positions),
+            sum(len(segments) for segments in positions),
+            len(self.exception_days),
+        )
+        return header + values.tobytes()
+
+    def __reduce__(self):
+        """Pickle as the compact to_bytes() encoding."""
+        return (self.__class__.from_buffer, (self.to_bytes(),))
+
+    @classmethod
+    def from_buffer(cls, buffer) -> "CompiledCalendar":
+        """Load a calendar encoded by to_bytes().
+
+        The buffer may be any object supporting the buffer protocol, such as
+        bytes or a read-only mmap of a file written with to_bytes(). Its
+        contents are copied, so it can be closed afterwards.
+
+        Args:
+            buffer: The encoded calendar.
+
+        Returns:
+            The decoded CompiledCalendar.
+
+        Raises:
+            ValueError: If the buffer is not an encoded calendar or was
+                written by an incompatible version.
+        """
+        # Released explicitly so an mmap can be closed even after an error
+        with memoryview(buffer) as view:
+            if len(view) < FORMAT_HEADER.size:
+                raise ValueError("Buffer is too short to hold a compiled calendar.")
+
+            magic, version, schedule_count, segment_count, exception_count = (
+                FORMAT_HEADER.unpack_from(view)
+            )
+            if magic != FORMAT_MAGIC:
+                raise ValueError("Buffer does not hold a compiled calendar.")
+            if version != FORMAT_VERSION:
+                raise ValueError(
+                    f"Unsupported compiled calendar format version {version}; "
+                    f"expected {FORMAT_VERSION}."
+                )
+
+            value_count = (
+                schedule_count + 2 * segment_count + 7 + 3 * exception_count + 1
+            )
+            if len(view) != FORMAT_HEADER.size + 8 * value_count:
+                raise ValueError("Compiled calendar buffer has the wrong length.")
+
+            values = array("q")
+            values.frombytes(view[FORMAT_HEADER.size :])
+
+        if sys.byteorder == "big":
+            values.byteswap()
+        values = values.tolist()
+
+        schedules = []
+        position = schedule_count
+        for length in values[:schedule_count]:
+            end = position + 2 * length
+            schedules.append(
+                tuple(zip(values[position:end:2], values[position + 1 : end : 2]))
+            )
+            position = end
+
+        def take(count):
+            nonlocal position
+            position += count
+            return values[position - count : position]
+
+        try:
+            weekday_segments = tuple(map(schedules.__getitem__, take(7)))
+            exception_days = tuple(take(exception_count))
+            exception_segments = tuple(
+                map(schedules.__getitem__, take(exception_count))
+            )
+        except IndexError:
+            raise ValueError("Compiled calendar buffer refers to a missing schedule.")
+        exception_offsets = tuple(take(exception_count + 1))
+
+        return cls._from_tables(
+            weekday_segments, exception_days, exception_segments, exception_offsets
+        )
+
+    @classmethod
+    def _from_tables(
+        cls,
+        weekday_segments: Tuple[DaySegments, ...],
+        exception_days: Tuple[int, ...],
+        exception_segments: Tuple[DaySegments, ...],
+        exception_offsets: Tuple[int, ...],
+    ) -> "CompiledCalendar":
+        """Build a calendar from tables that were already validated.
+
+        Skips __post_init__, which would revalidate every segment and rebuild
+        exception_offsets one exception day at a time.
+        """
+        calendar = cls.__new__(cls)
+
+        weekday_seconds = tuple(
+            cls._segments_seconds(segments) for segments in weekday_segments
+        )
+        week_prefix = [0]
+        for seconds in weekday_seconds:
+            week_prefix.append(week_prefix[-1] + seconds)
+
+        object.__setattr__(calendar, "weekday_segments", weekday_segments)
+        object.__setattr__(calendar, "exception_days", exception_days)
+        object.__setattr__(calendar, "exception_segments", exception_segments)
+        object.__setattr__(calendar, "weekday_seconds", weekday_seconds)
+        object.__setattr__(calendar, "week_seconds", week_prefix[-1])
+        object.__setattr__(calendar, "week_prefix", tuple(week_prefix))
+        object.__setattr__(calendar, "exception_offsets", exception_offsets)
+        return calendar
+
+    # -------------------------------------------------------------------------
+    # Array Methods (require NumPy)
+    # -------------------------------------------------------------------------
+
+    def elapsed_array(self, local_us):
+        """Vectorized elapsed() over an int64 array of local microseconds.
+
+        Args:
+            local_us: A NumPy int64 array of local wall-clock microseconds
+                since 1970-01-01.
+
+        Returns:
+            An int64 array of running business time totals in microseconds.
+        """
+        np = import_optional("numpy")
+
+        local_us = np.asarray(local_us, dtype=np.int64)
+        day, time_of_day = np.divmod(local_us, MICROSECONDS_PER_DAY)
+
+        total = self._day_total_array(day) * MICROSECONDS_PER_SECOND
+        starts, ends = self._day_segments_array(day)
+
+        partial = np.clip(time_of_day[..., None], starts, ends) - starts
+        return total + partial.sum(axis=-1)
+
+    def is_open_array(self, local_us):
+        """Vectorized is_open() over an int64 array of local microseconds.
+
+        Args:
+            local_us: A NumPy int64 array of local wall-clock microseconds
+                since 1970-01-01.
+
+        Returns:
+            A boolean array, True where the instant is within business hours.
+        """
+        np = import_optional("numpy")
+
+        local_us = np.asarray(local_us, dtype=np.int64)
+        day, time_of_day = np.divmod(local_us, MICROSECONDS_PER_DAY)
+        starts, ends = self._day_segments_array(day)
+
+        time_of_day = time_of_day[..., None]
+        return ((starts <= time_of_day) & (time_of_day < ends)).any(axis=-1)
+
+    def duration_array(self, start_us, end_us):
+        """Vectorized duration() over int64 arrays of local microseconds.
+
+        Args:
+            start_us: Interval starts in local microseconds since 1970-01-01.
+            end_us: Interval ends, broadcastable against start_us.
+
+        Returns:
+            An int64 array of business time in microseconds, zero where end
+            is not after start.
+        """
+        np = import_optional("numpy")
+
+        start_us, end_us = np.broadcast_arrays(
+            np.asarray(start_us, dtype=np.int64), np.asarray(end_us, dtype=np.int64)
+        )
+        durations = self.elapsed_array(end_us) - self.elapsed_array(start_us)
+        return np.where(end_us > start_us, np.maximum(durations, 0), 0)
+
+    def advance_array(self, local_us, amount_us):
+        """Vectorized advance() over int64 arrays of local microseconds.
+
+        Rather than searching day by day, the running day totals are inverted
+        in closed form: a bisect over the exception days picks the stretch of
+        regular weeks containing each target, and the week and weekday follow
+        by division and a search over week_prefix.
+
+        Args:
+            local_us: Starting instants in local microseconds since 1970-01-01.
+            amount_us: Business time to add (positive) or subtract (negative)
+                in microseconds, broadcastable against local_us.
+
+        Returns:
+            An int64 array of resulting instants in local microseconds.
+
+        Raises:
+            ValueError: If the calendar never accumulates enough business time
+                for some element.
+        """
+        np = import_optional("numpy")
+
+        local_us, amount_us = np.broadcast_arrays(
+            np.asarray(local_us, dtype=np.int64), np.asarray(amount_us, dtype=np.int64)
+        )
+        result = local_us.copy()
+
+        # A zero amount stays put, as in advance()
+        moving = amount_us != 0
+        result[moving] = self._advance_moving(local_us[moving], amount_us[moving])
+        return result
+
+    def _advance_moving(self, local_us, amount_us):
+        """advance_array() for 1-D arrays of non-zero amounts."""
+        np = import_optional("numpy")
+
+        forward = amount_us > 0
+        target = self.elapsed_array(local_us) + amount_us
+
+        # The same day predicates as advance(), as whole-second day totals:
+        # forward looks for total >= target, backward for total > target
+        threshold = np.where(
+            forward,
+            -(-target // MICROSECONDS_PER_SECOND),
+            target // MICROSECONDS_PER_SECOND + 1,
+        )
+        day = self._first_day_reaching_array(threshold) - 1
+
+        starts, ends = self._day_segments_array(day)
+        lengths = ends - starts
+        cumulative = np.cumsum(lengths, axis=-1)
+        remaining = target - self._day_total_array(day) * MICROSECONDS_PER_SECOND
+
+        # Forward deadlines may end exactly on a close; backward ones open
+        fits = np.where(
+            forward[:, None],
+            cumulative >= remaining[:, None],
+            cumulative > remaining[:, None],
+        )
+        slot = np.argmax(fits, axis=-1)[:, None]
+        segment_start = np.take_along_axis(starts, slot, axis=-1)[:, 0]
+        used_before = np.take_along_axis(cumulative - lengths, slot, axis=-1)[:, 0]
+
+        return day * MICROSECONDS_PER_DAY + segment_start + remaining - used_before
+
+    def next_open_array(self, local_us):
+        """Vectorized next_open() over an int64 array of local microseconds."""
+        return self.advance_array(local_us, 1) - 1
+
+    def next_close_array(self, local_us):
+        """Vectorized next_close() over an int64 array of local microseconds."""
+        return self._continuous_end_array(
+            self._segment_bounds_array(self.next_open_array(local_us))[1]
+        )
+
+    def previous_close_array(self, local_us):
+        """Vectorized previous_close() over an int64 array of local microseconds."""
+        np = import_optional("numpy")
+
+        local_us = np.asarray(local_us, dtype=np.int64)
+        starts, ends = self._segment_bounds_array(self.advance_array(local_us, -1))
+        ends = self._continuous_end_array(ends)
+
+        # Where business is open at local_us, look before the current segment
+        is_open = ends > local_us
+        if is_open.any():
+            ends[is_open] = self._segment_bounds_array(
+                self.advance_array(self._continuous_start_array(starts[is_open]), -1)
+            )[1]
+        return ends
+
+    def _segment_bounds_array(self, local_us):
+        """Vectorized _segment_bounds() over an int64 array of open instants."""
+        np = import_optional("numpy")
+
+        local_us = np.asarray(local_us, dtype=np.int64)
+        day, time_of_day = np.divmod(local_us, MICROSECONDS_PER_DAY)
+        starts, ends = self._day_segments_array(day)
+
+        # Padded (0, 0) slots sort last, so the first end after the instant wins
+        slot = np.argmax(ends > time_of_day[..., None], axis=-1)[..., None]
+        midnight = day * MICROSECONDS_PER_DAY
+        return (
+            midnight + np.take_along_axis(starts, slot, axis=-1)[..., 0],
+            midnight + np.take_along_axis(ends, slot, axis=-1)[..., 0],
+        )
+
+    def _continuous_start_array(self, start_us):
+        """Vectorized _continuous_start() over an int64 array."""
+        np = import_optional("numpy")
+
+        shape = np.shape(start_us)
+        start_us = np.array(start_us, dtype=np.int64).reshape(-1)
+        pending = np.flatnonzero(start_us % MICROSECONDS_PER_DAY == 0)
+        while pending.size:
+            day = start_us[pending] // MICROSECONDS_PER_DAY - 1
+            starts, ends = self._day_segments_array(day)
+            # The last segment of the day, ignoring the (0, 0) padding
+            last = np.maximum(np.count_nonzero(ends, axis=-1) - 1, 0)[:, None]
+            last_start = np.take_along_axis(starts, last, axis=-1)[:, 0]
+            continues = np.take_along_axis(ends, last, axis=-1)[:, 0] == (
+                MICROSECONDS_PER_DAY
+            )
+            if continues.any() and self._is_open_around_the_clock(
+                int(day[continues].min()), forward=False
+            ):
+                raise ValueError("The calendar was never closed before this time.")
+
+            pending = pending[continues]
+            start_us[pending] -= MICROSECONDS_PER_DAY - last_start[continues]
+            pending = pending[start_us[pending] % MICROSECONDS_PER_DAY == 0]
+        return start_us.reshape(shape)
+
+    def _continuous_end_array(self, end_us):
+        """Vectorized _continuous_end() over an int64 array."""
+        np = import_optional("numpy")
+
+        shape = np.shape(end_us)
+        end_us = np.array(end_us, dtype=np.int64).reshape(-1)
+        pending = np.flatnonzero(end_us % MICROSECONDS_PER_DAY == 0)
+        while pending.size:
+            day = end_us[pending] // MICROSECONDS_PER_DAY
+            starts, ends = self._day_segments_array(day)
+            continues = (starts[:, 0] == 0) & (ends[:, 0] > 0)
+            if continues.any() and self._is_open_around_the_clock(
+                int(day[continues].max()), forward=True
+            ):
+                raise ValueError("The calendar never closes after this time.")
+
+            pending = pending[continues]
+            end_us[pending] += ends[continues, 0]
+            pending = pending[end_us[pending] % MICROSECONDS_PER_DAY == 0]
+        return end_us.reshape(shape)
+
+    def _day_total_array(self, day):
+        """Vectorized _day_total() over an int64 array of epoch days."""
+        np = import_optional("numpy")
+        tables = self._array_tables
+
+        weeks, weekday = np.divmod(day + EPOCH_WEEKDAY_SHIFT, 7)
+        position = np.searchsorted(tables["exception_days"], day, side="left")
+        return (
+            weeks * self.week_seconds
+            + tables["week_prefix"][weekday]
+            + tables["exception_offsets"][position]
+        )
+
+    def _day_segments_array(self, day):
+        """Look up padded segment starts and ends for an array of epoch days.
+
+        Args:
+            day: An int64 array of epoch days.
+
+        Returns:
+            Two int64 arrays with a trailing axis of segment_width slots,
+            holding segment starts and ends in microseconds from midnight.
+        """
+        np = import_optional("numpy")
+        tables = self._array_tables
+
+        weekday = (day + EPOCH_WEEKDAY_SHIFT) % 7
+        starts = tables["weekday_starts"][weekday]
+        ends = tables["weekday_ends"][weekday]
+
+        if len(self.exception_days):
+            position = np.searchsorted(tables["exception_days"], day, side="left")
+            clamped = np.minimum(position, len(self.exception_days) - 1)
+            is_exception = tables["exception_days"][clamped] == day
+            starts = np.where(
+                is_exception[..., None], tables["exception_starts"][clamped], starts
+            )
+            ends = np.where(
+                is_exception[..., None], tables["exception_ends"][clamped], ends
+            )
+
+        return starts, ends
+
+    def _first_day_reaching_array(self, threshold):
+        """Find the first day whose running total reaches each threshold.
+
+        Between two exception days the running total is the regular weekly
+        total plus a constant offset, which can be inverted directly. The
+        days after exception k start at the boundary total stored in
+        exception_boundaries, so a search over those picks the stretch.
+
+        Args:
+            threshold: An int64 array of running totals in seconds.
+
+        Returns:
+            An int64 array holding, for each threshold, the smallest epoch
+            day whose _day_total() is at least the threshold.
+
+        Raises:
+            ValueError: If the result falls outside the datetime range.
+        """
+        np = import_optional("numpy")
+        tables = self._array_tables
+        exception_count = len(self.exception_days)
+
+        stretch = np.searchsorted(
+            tables["exception_boundaries"], threshold, side="left"
+        )
+        regular_threshold = threshold - tables["exception_offsets"][stretch]
+
+        if self.week_seconds:
+            # The week whose end is the first to reach the threshold
+            weeks = -(-regular_threshold // self.week_seconds) - 1
+            weekday = np.searchsorted(
+                tables["week_prefix"],
+                regular_threshold - weeks * self.week_seconds,
+                side="left",
+            )
+            day = weeks * 7 + weekday - EPOCH_WEEKDAY_SHIFT
+        else:
+            # Without regular hours, only the exception days add time
+            day = np.where(regular_threshold <= 0, MIN_DAY - 1, MAX_DAY + 2)
+
+        if exception_count:
+            days = tables["exception_days"]
+            lower = np.where(
+                stretch > 0, days[np.maximum(stretch - 1, 0)] + 2, MIN_DAY - 1
+            )
+            upper = np.where(
+                stretch < exception_count,
+                days[np.minimum(stretch, exception_count - 1)] + 1,
+                MAX_DAY + 2,
+            )
+            day = np.clip(day, lower, upper)
+
+        if day.size and (day.min() - 1 < MIN_DAY or day.max() - 1 > MAX_DAY):
+            raise ValueError(
+                "The calendar does not have enough business time to reach the "
+                "requested amount."
+            )
+        return day
+
+    @cached_property
+    def _array_tables(self):
+        """NumPy copies of the lookup tables, with segments padded to equal width."""
+        np = import_optional("numpy")
+
+        width = self.segment_width
+
+        def padded(rows, column):
+            table = np.zeros((max(len(rows), 1), width), dtype=np.int64)
+            for i, segments in enumerate(rows):
+                for j, segment in enumerate(segments):
+                    table[i, j] = segment[column]
+            return table * MICROSECONDS_PER_SECOND
+
+        return {
+            "week_prefix": np.array(self.week_prefix, dtype=np.int64),
+            "exception_boundaries": np.array(
+                [self._day_total(day + 1) for day in self.exception_days],
+                dtype=np.int64,
+            ),
+            "exception_days": np.array(self.exception_days, dtype=np.int64),
+            "exception_offsets": np.array(self.exception_offsets, dtype=np.int64),
+            "weekday_starts": padded(self.weekday_segments, 0),
+            "weekday_ends": padded(self.weekday_segments, 1),
+            "exception_starts": padded(self.exception_segments, 0),
+            "exception_ends": padded(self.exception_segments, 1),
+        }
@@ -0,0 +1,102 @@
+"""Immutable business duration calculator.
+
+This module provides the FrozenBusinessDuration class, a BusinessDuration that
+cannot be changed once built, so that one instance can be shared by every
+thread of a server.
+"""
+
+from dataclasses import FrozenInstanceError, fields
+
+from bizdurr.BusinessDuration import BusinessDuration
+
+
+class FrozenBusinessDuration(BusinessDuration):
+    """A BusinessDuration that cannot be modified after construction.
+
+    Takes the same arguments as BusinessDuration. Once built, assigning or
+    deleting any attribute raises dataclasses.FrozenInstanceError, so the
+    schedule, the settings, and the index stay fixed for the life of the
+    instance. build_index() and clear_index() raise as well: build the index
+    on a BusinessDuration and freeze it with from_duration().
+
+    Every query method can be called from many threads at once without
+    external locking. The queries read only the immutable CompiledCalendar
+    and the shared ZoneTransitions table, and take no locks unless the table
+    must grow to cover new years. The memo (if memo_size is set) and the
+    interval cache of get_business_intervals_utc() are LRUCaches, which hold
+    a short internal lock for their bookkeeping.
+
+    Raises:
+        TypeError: If business_hours or overrides are invalid types.
+        ValueError: If business_timezone is invalid or holiday dates are malformed.
+
+    Example:
+        >>> calendar = FrozenBusinessDuration(
+        ...     business_hours={"start": "09:00", "end": "17:00"},
+        ...     business_timezone="America/New_York",
+        ... )
+        >>> calendar.holidays = ["2025-12-25"]
+        Traceback (most recent call last):
+        dataclasses.FrozenInstanceError: cannot assign to field 'holidays'
+    """
+
+    # Set on the instance once it is fully built
+    _frozen = False
+
+    # -------------------------------------------------------------------------
+    # Initialization
+    # -------------------------------------------------------------------------
+
+    def __post_init__(self):
+        """Validate and normalize all inputs, then freeze."""
+        super().__post_init__()
+        object.__setattr__(self, "_frozen", True)
+
+    def __setattr__(self, name, value):
+        """Reject assignments once the instance is built."""
+        if self._frozen:
+            raise FrozenInstanceError(f"cannot assign to field {name!r}")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name):
+        """Reject deletions once the instance is built."""
+        if self._frozen:
+            raise FrozenInstanceError(f"cannot delete field {name!r}")
+        super().__delattr__(name)
+
+    @classmethod
+    def from_duration(cls, duration: BusinessDuration) -> "FrozenBusinessDuration":
+        """Freeze a BusinessDuration without compiling it again.
+
+        The compiled calendar and the index, which are never modified, are
+        shared with duration. The caches start empty. Later changes to
+        duration do not affect the frozen copy.
+
+        Args:
+            duration: The calendar to freeze.
+
+        Returns:
+            A FrozenBusinessDuration with the same schedule and settings.
+
+        Example:
+            >>> duration.build_index("2025-01-01", "2030-12-31")
+            >>> shared = FrozenBusinessDuration.from_duration(duration)
+        """
+        frozen = cls.__new__(cls)
+        for duration_field in fields(BusinessDuration):
+            value = getattr(duration, duration_field.name)
+            # Bypasses __setattr__, which would compile the schedule again
+            object.__setattr__(frozen, duration_field.name, value)
+        if duration.holidays is not None:
+            object.__setattr__(frozen, "holidays", list(duration.holidays))
+
+        frozen._create_caches()
+        object.__setattr__(frozen, "_frozen", True)
+        return frozen
+
+    @classmethod
+    def _from_calendar(cls, calendar, business_timezone, **settings):
+        """Build a frozen instance around an already compiled calendar."""
+        duration = super()._from_calendar(calendar, business_timezone, **settings)
+        object.__setattr__(duration, "_frozen", True)
+        return duration
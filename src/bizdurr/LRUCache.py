@@ -0,0 +1,157 @@
+"""Bounded least-recently-used cache.
+
+This module provides the LRUCache class, a small mapping that evicts the least
+recently used entry once it is full, optionally expires entries by age, and
+counts hits, misses, and evictions so that its size can be tuned against real
+traffic. It is safe to share between threads.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable, NamedTuple, Optional, Tuple
+
+
+class CacheInfo(NamedTuple):
+    """Statistics reported by LRUCache.info()."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: Optional[int]
+    expirations: int = 0
+
+
+@dataclass
+class LRUCache:
+    """A mapping with least-recently-used eviction and hit statistics.
+
+    Args:
+        maxsize: The maximum number of entries. None means unbounded and 0
+            disables caching (every lookup is a miss and nothing is stored).
+        max_age: Optional lifetime of an entry in seconds. Expired entries
+            are dropped when next looked up and count as misses.
+        clock: Returns the current time in seconds; time.monotonic by default.
+
+    Lookups and updates hold an internal lock, so the cache can be shared
+    between threads. compute() runs outside the lock; two threads that miss
+    the same key at once may both compute it, and the later result is kept.
+
+    Raises:
+        ValueError: If maxsize is negative or max_age is not positive.
+
+    Example:
+        >>> cache = LRUCache(maxsize=2)
+        >>> cache.get_or_compute("a", lambda: 1)
+        1
+        >>> cache.get_or_compute("a", lambda: 2)
+        1
+        >>> cache.info()
+        CacheInfo(hits=1, misses=1, evictions=0, size=1, maxsize=2, expirations=0)
+    """
+
+    maxsize: Optional[int] = 1024
+    max_age: Optional[float] = None
+    clock: Callable[[], float] = field(default=time.monotonic, repr=False)
+
+    # Internal fields (initialized in __post_init__)
+    _entries: "OrderedDict[Hashable, Tuple[Any, float]]" = field(
+        default=None, init=False, repr=False
+    )
+    _lock: threading.Lock = field(default=None, init=False, repr=False, compare=False)
+    _hits: int = field(default=0, init=False, repr=False)
+    _misses: int = field(default=0, init=False, repr=False)
+    _evictions: int = field(default=0, init=False, repr=False)
+    _expirations: int = field(default=0, init=False, repr=False)
+
+    # -------------------------------------------------------------------------
+    # Initialization
+    # -------------------------------------------------------------------------
+
+    def __post_init__(self):
+        """Validate the size and create the entry store."""
+        if self.maxsize is not None and self.maxsize < 0:
+            raise ValueError(f"maxsize must be None or >= 0, got {self.maxsize}.")
+
+        if self.max_age is not None and self.max_age <= 0:
+            raise ValueError(f"max_age must be None or > 0, got {self.max_age}.")
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    # -------------------------------------------------------------------------
+    # Public Methods
+    # -------------------------------------------------------------------------
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Get the value for key, computing and storing it on a miss.
+
+        Args:
+            key: The cache key.
+            compute: Called with no arguments to produce the value on a miss.
+
+        Returns:
+            The cached or newly computed value.
+        """
+        now = self.clock() if self.max_age is not None else 0.0
+
+        with self._lock:
+            try:
+                value, stored_at = self._entries[key]
+            except KeyError:
+                self._misses += 1
+            else:
+                if self.max_age is None or now - stored_at < self.max_age:
+                    self._hits += 1
+                    self._entries.move_to_end(key)
+                    return value
+
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+
+        value = compute()
+        with self._lock:
+            self._store(key, value, now)
+        return value
+
+    def info(self) -> CacheInfo:
+        """Get the hit, miss, eviction, and expiration counts and the size."""
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                maxsize=self.maxsize,
+                expirations=self._expirations,
+            )
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # -------------------------------------------------------------------------
+    # Internal Helpers
+    # -------------------------------------------------------------------------
+
+    def _store(self, key: Hashable, value: Any, stored_at: float) -> None:
+        """Insert an entry, evicting the least recently used ones if full.
+
+        Must be called with the lock held.
+        """
+        if self.maxsize == 0:
+            return
+
+        self._entries[key] = (value, stored_at)
+        if self.maxsize is not None:
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
@@ -0,0 +1,216 @@
+"""pandas accessors for business duration calculations.
+
+This module provides register_pandas_accessor(), which attaches a
+BusinessDuration to pandas DataFrame, Series, and Index objects under an
+accessor name (``df.bizdurr`` by default). Columns are converted to the
+business timezone in bulk and evaluated with BusinessDuration.calculate_many(),
+so no per-row Python calls are made.
+"""
+
+import warnings
+from datetime import datetime
+
+from bizdurr.BusinessDuration import BusinessDuration
+from bizdurr.utils import import_optional
+
+pd = import_optional("pandas")
+np = import_optional("numpy")
+
+
+def register_pandas_accessor(
+    business_duration: BusinessDuration, name: str = "bizdurr"
+) -> None:
+    """Register DataFrame, Series, and Index accessors bound to a calendar.
+
+    Registering a second calendar under the same name replaces the first;
+    use different names to work with several calendars at once.
+
+    Args:
+        business_duration: The calendar the accessors evaluate against.
+        name: The accessor attribute name.
+
+    Raises:
+        TypeError: If business_duration is not a BusinessDuration.
+
+    Example:
+        >>> register_pandas_accessor(duration)
+        >>> df["business_duration"] = df.bizdurr.duration("start_time", "end_time")
+        >>> df["start_time"].bizdurr.duration(df["end_time"])
+    """
+    if not isinstance(business_duration, BusinessDuration):
+        raise TypeError(
+            "business_duration must be a BusinessDuration, "
+            f"got {type(business_duration).__name__}."
+        )
+
+    attributes = {"business_duration": business_duration}
+    registrations = (
+        (pd.DataFrame, pd.api.extensions.register_dataframe_accessor, DataFrameAccessor),
+        (pd.Series, pd.api.extensions.register_series_accessor, SeriesAccessor),
+        (pd.Index, pd.api.extensions.register_index_accessor, IndexAccessor),
+    )
+
+    for pandas_type, register, accessor in registrations:
+        bound_accessor = type(accessor.__name__, (accessor,), attributes)
+        existing = getattr(pandas_type, name, None)
+
+        with warnings.catch_warnings():
+            # pandas warns on every override; replacing our own accessor is expected
+            if isinstance(existing, type) and issubclass(
+                existing, _BusinessDurationAccessor
+            ):
+                warnings.simplefilter("ignore", UserWarning)
+            register(name)(bound_accessor)
+
+
+class _BusinessDurationAccessor:
+    """Shared conversion logic for the pandas accessors."""
+
+    business_duration: BusinessDuration
+
+    def __init__(self, pandas_obj):
+        self._obj = pandas_obj
+
+    def _to_local_datetime64(self, values):
+        """Convert datetimes to naive datetime64[us] values in the business timezone.
+
+        Naive values are assumed to already be in the business timezone, as in
+        BusinessDuration.calculate(). Aware values are converted in bulk.
+
+        Args:
+            values: A Series, Index, numpy datetime64 array, or a single
+                datetime or Timestamp.
+
+        Returns:
+            A numpy datetime64[us] array (or scalar for scalar input).
+
+        Raises:
+            TypeError: If values do not have a datetime dtype.
+        """
+        time_zone = self.business_duration.business_timezone.key
+
+        if isinstance(values, (datetime, pd.Timestamp)):
+            timestamp = pd.Timestamp(values)
+            if timestamp.tz is not None:
+                timestamp = timestamp.tz_convert(time_zone).tz_localize(None)
+            return np.datetime64(timestamp.as_unit("us").asm8, "us")
+
+        if not isinstance(values, (pd.Series, pd.Index)):
+            values = pd.Index(values)
+
+        if not pd.api.types.is_datetime64_any_dtype(values.dtype):
+            raise TypeError(f"Expected datetime values, got dtype {values.dtype}.")
+
+        if isinstance(values, pd.Series):
+            if values.dt.tz is not None:
+                values = values.dt.tz_convert(time_zone).dt.tz_localize(None)
+        elif values.tz is not None:
+            values = values.tz_convert(time_zone).tz_localize(None)
+
+        return values.to_numpy(dtype="datetime64[us]")
+
+    def _durations(self, starts, ends):
+        """Business durations between two sets of datetimes as timedelta64[us]."""
+        return self.business_duration.calculate_many(
+            self._to_local_datetime64(starts), self._to_local_datetime64(ends)
+        )
+
+
+class DataFrameAccessor(_BusinessDurationAccessor):
+    """Business duration methods for DataFrames (``df.bizdurr``)."""
+
+    def duration(self, start, end) -> "pd.Series":
+        """Business duration between two datetime columns.
+
+        Args:
+            start: Column name of the interval starts, or a Series, array, or
+                single datetime.
+            end: Same as start, for the interval ends.
+
+        Returns:
+            A timedelta64[us] Series aligned with the DataFrame's index.
+            Rows where start >= end are zero and rows with missing values
+            are NaT.
+
+        Example:
+            >>> df.bizdurr.duration("start_time", "end_time")
+        """
+        return pd.Series(
+            self._durations(self._column(start), self._column(end)),
+            index=self._obj.index,
+        )
+
+    def _column(self, key):
+        """Resolve a column name to the column; pass other values through."""
+        if isinstance(key, str):
+            return self._obj[key]
+        return key
+
+
+class SeriesAccessor(_BusinessDurationAccessor):
+    """Business duration methods for datetime Series (``series.bizdurr``)."""
+
+    def duration(self, end) -> "pd.Series":
+        """Business duration from each value in the Series to end.
+
+        Args:
+            end: A Series, array, or single datetime marking the interval ends.
+
+        Returns:
+            A timedelta64[us] Series with the same index.
+
+        Example:
+            >>> df["start_time"].bizdurr.duration(df["end_time"])
+        """
+        return pd.Series(
+            self._durations(self._obj, end), index=self._obj.index, name=self._obj.name
+        )
+
+    def is_within_business_hours(self) -> "pd.Series":
+        """Flag the values in the Series that fall within business hours.
+
+        Returns:
+            A bool Series with the same index, False where the value is missing.
+
+        Example:
+            >>> events["in_hours"] = events["timestamp"].bizdurr.is_within_business_hours()
+        """
+        return pd.Series(
+            self.business_duration.is_within_business_hours_many(
+                self._to_local_datetime64(self._obj)
+            ),
+            index=self._obj.index,
+            name=self._obj.name,
+        )
+
+
+class IndexAccessor(_BusinessDurationAccessor):
+    """Business duration methods for a DatetimeIndex (``index.bizdurr``)."""
+
+    def duration(self, end) -> "pd.TimedeltaIndex":
+        """Business duration from each value in the index to end.
+
+        Args:
+            end: An Index, Series, array, or single datetime marking the
+                interval ends.
+
+        Returns:
+            A TimedeltaIndex of business durations.
+
+        Example:
+            >>> df.index.bizdurr.duration(datetime(2025, 12, 31))
+        """
+        return pd.TimedeltaIndex(self._durations(self._obj, end), name=self._obj.name)
+
+    def is_within_business_hours(self) -> "np.ndarray":
+        """Flag the values in the index that fall within business hours.
+
+        Returns:
+            A numpy bool array, False where the value is missing.
+
+        Example:
+            >>> df.index.bizdurr.is_within_business_hours()
+        """
+        return self.business_duration.is_within_business_hours_many(
+            self._to_local_datetime64(self._obj)
+        )
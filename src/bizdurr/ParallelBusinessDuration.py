@@ -0,0 +1,283 @@
+"""Parallel batch calculations.
+
+This module provides the ParallelBusinessDuration class, which splits large
+batches into chunks and evaluates them on a pool of worker processes or
+threads. Each worker process receives the compiled calendar once, through the
+pool initializer, so tasks only carry int64 arrays of local microseconds;
+worker threads share the caller's calendar.
+"""
+
+import functools
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from bizdurr.BusinessDuration import NAT_INT64, BusinessDuration
+from bizdurr.CompiledCalendar import CompiledCalendar
+from bizdurr.utils import import_optional
+
+# The calendar installed in each worker process by _initialize_worker()
+_worker_calendar: Optional[CompiledCalendar] = None
+
+EXECUTORS = ("process", "thread")
+
+
+@dataclass
+class ParallelBusinessDuration:
+    """Evaluate batches of a BusinessDuration on a process or thread pool.
+
+    Inputs are converted to local microseconds in the calling process,
+    split into chunks of chunk_size rows, and evaluated in parallel. Results
+    match BusinessDuration.calculate_many() and add_business_time_many().
+
+    With executor="thread", the chunks are evaluated by threads sharing the
+    calendar, whose queries are lock-free (see CompiledCalendar). Threads
+    avoid copying the calendar and the chunks between processes, and scale
+    across cores on free-threaded Python builds; NumPy also releases the
+    GIL for much of the work on regular builds.
+
+    The pool is started on first use and reused until close() is called, so
+    use the instance as a context manager or keep it for the life of a job.
+    Every call evaluates the current calendar of business_duration: if its
+    schedule is reassigned, the process pool is restarted with the new one.
+
+    Args:
+        business_duration: The calendar to evaluate against.
+        max_workers: Number of workers. Defaults to the default of
+            ProcessPoolExecutor or ThreadPoolExecutor.
+        chunk_size: Rows per task. Larger chunks amortize the per-task
+            overhead; smaller ones balance load across workers.
+        start_method: The multiprocessing start method for the workers.
+            Defaults to "forkserver" where available and "spawn" elsewhere,
+            since forking a process that already runs threads (as NumPy,
+            Arrow, and Polars do) can deadlock. Ignored for threads.
+        executor: "process" for a process pool or "thread" for a thread pool.
+
+    Raises:
+        TypeError: If business_duration is not a BusinessDuration.
+        ValueError: If chunk_size is not positive or executor is unknown.
+
+    Example:
+        >>> with ParallelBusinessDuration(duration, max_workers=32) as parallel:
+        ...     durations = parallel.calculate_many(starts, ends)
+    """
+
+    business_duration: BusinessDuration
+    max_workers: Optional[int] = None
+    chunk_size: int = 1_000_000
+    start_method: Optional[str] = None
+    executor: str = "process"
+
+    # Internal fields
+    _executor: Optional[Executor] = field(default=None, init=False, repr=False)
+    _pool_calendar: Optional[CompiledCalendar] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    # -------------------------------------------------------------------------
+    # Initialization
+    # -------------------------------------------------------------------------
+
+    def __post_init__(self):
+        """Validate the inputs."""
+        if not isinstance(self.business_duration, BusinessDuration):
+            raise TypeError(
+                "business_duration must be a BusinessDuration, "
+                f"got {type(self.business_duration).__name__}."
+            )
+
+        if self.chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {self.chunk_size}.")
+
+        if self.executor not in EXECUTORS:
+            raise ValueError(
+                f"executor must be one of {EXECUTORS}, got {self.executor!r}."
+            )
+
+        if self.start_method is None:
+            available = multiprocessing.get_all_start_methods()
+            self.start_method = (
+                "forkserver" if "forkserver" in available else "spawn"
+            )
+
+    def __enter__(self) -> "ParallelBusinessDuration":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # -------------------------------------------------------------------------
+    # Public Methods
+    # -------------------------------------------------------------------------
+
+    def calculate_many(self, starts, ends):
+        """Parallel form of BusinessDuration.calculate_many().
+
+        Args:
+            starts: A numpy datetime64 array, a sequence of datetimes, or a
+                single datetime.
+            ends: Same as starts.
+
+        Returns:
+            A numpy timedelta64[us] array of business durations, with NaT
+            where either input is missing.
+        """
+        np = import_optional("numpy")
+
+        start_us, end_us = np.broadcast_arrays(
+            self.business_duration._to_local_microseconds_array(starts),
+            self.business_duration._to_local_microseconds_array(ends),
+        )
+        missing = (start_us == NAT_INT64) | (end_us == NAT_INT64)
+
+        durations = self._map(
+            _duration_chunk,
+            np.where(missing, 0, start_us),
+            np.where(missing, 0, end_us),
+        )
+
+        result = durations.astype("timedelta64[us]")
+        result[missing] = np.timedelta64("NaT", "us")
+        return result
+
+    def add_business_time_many(self, starts, durations):
+        """Parallel form of BusinessDuration.add_business_time_many().
+
+        Args:
+            starts: A numpy datetime64 array, a sequence of datetimes, or a
+                single datetime.
+            durations: A numpy timedelta64 array, a sequence of timedeltas, or
+                a single timedelta.
+
+        Returns:
+            A numpy datetime64[us] array of naive deadlines in the business
+            timezone, with NaT where either input is missing.
+
+        Raises:
+            ValueError: If the calendar never accumulates enough business
+                time for some element.
+        """
+        np = import_optional("numpy")
+
+        start_us, amount_us = np.broadcast_arrays(
+            self.business_duration._to_local_microseconds_array(starts),
+            self.business_duration._to_microseconds_array(durations),
+        )
+        missing = (start_us == NAT_INT64) | (amount_us == NAT_INT64)
+
+        deadlines = self._map(
+            _advance_chunk,
+            np.where(missing, 0, start_us),
+            np.where(missing, 0, amount_us),
+        )
+
+        result = deadlines.astype("datetime64[us]")
+        result[missing] = np.datetime64("NaT", "us")
+        return result
+
+    def close(self) -> None:
+        """Shut down the worker pool, if it was started."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    # -------------------------------------------------------------------------
+    # Internal Helpers
+    # -------------------------------------------------------------------------
+
+    def _get_executor(self, calendar: CompiledCalendar) -> Executor:
+        """Start the worker pool on first use, or when the calendar changed.
+
+        Worker processes hold the calendar they were started with, so the
+        process pool is replaced when the schedule of business_duration is
+        reassigned, as threads would see the new calendar too.
+        """
+        with self._lock:
+            stale = None
+            if self.executor == "process" and self._pool_calendar is not calendar:
+                stale, self._executor = self._executor, None
+
+            if self._executor is None and self.executor == "thread":
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="bizdurr"
+                )
+            elif self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context(self.start_method),
+                    initializer=_initialize_worker,
+                    initargs=(calendar,),
+                )
+                self._pool_calendar = calendar
+            executor = self._executor
+
+        if stale is not None:
+            stale.shutdown()
+        return executor
+
+    def _map(self, task, first, second):
+        """Run a chunk task over two equal-shape arrays and join the results.
+
+        Args:
+            task: A module-level function taking two 1-D int64 chunks.
+            first: The first int64 argument array.
+            second: The second int64 argument array.
+
+        Returns:
+            An int64 array with the shape of the inputs.
+        """
+        np = import_optional("numpy")
+
+        shape = first.shape
+        first, second = first.ravel(), second.ravel()
+        if not first.size:
+            return np.zeros(shape, dtype=np.int64)
+
+        calendar = self.business_duration.calendar
+        if self.executor == "thread":
+            task = functools.partial(task, calendar=calendar)
+
+        results = self._get_executor(calendar).map(
+            task, self._split(first), self._split(second)
+        )
+        return np.concatenate(list(results)).reshape(shape)
+
+    def _split(self, array) -> List:
+        """Split a 1-D array into chunk_size views."""
+        return [
+            array[offset : offset + self.chunk_size]
+            for offset in range(0, len(array), self.chunk_size)
+        ]
+
+
+# -----------------------------------------------------------------------------
+# Worker Functions
+# -----------------------------------------------------------------------------
+
+
+def _initialize_worker(calendar: CompiledCalendar) -> None:
+    """Install the compiled calendar in a worker process."""
+    global _worker_calendar
+    _worker_calendar = calendar
+
+
+def _duration_chunk(start_us, end_us, calendar=None):
+    """Evaluate CompiledCalendar.duration_array() on one chunk.
+
+    Worker threads pass the shared calendar; worker processes use the one
+    installed by _initialize_worker().
+    """
+    calendar = _worker_calendar if calendar is None else calendar
+    return calendar.duration_array(start_us, end_us)
+
+
+def _advance_chunk(start_us, amount_us, calendar=None):
+    """Evaluate CompiledCalendar.advance_array() on one chunk."""
+    calendar = _worker_calendar if calendar is None else calendar
+    return calendar.advance_array(start_us, amount_us)
@@ -0,0 +1,322 @@
+"""Polars expressions for business duration calculations.
+
+This module provides the PolarsBusinessDuration class, which turns a
+BusinessDuration into native Polars expressions. The calendar lookups are
+expressed with Polars arithmetic, gather, and search_sorted operations, so
+they run vectorized inside eager, lazy, and streaming queries without calling
+back into Python for every row.
+"""
+
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import List, Tuple, Union
+
+from bizdurr.BusinessDuration import BusinessDuration
+from bizdurr.CompiledCalendar import (
+    EPOCH_WEEKDAY_SHIFT,
+    MICROSECONDS_PER_DAY,
+    MICROSECONDS_PER_SECOND,
+)
+from bizdurr.utils import import_optional
+
+pl = import_optional("polars")
+
+IntoExpr = Union[str, "pl.Expr"]
+
+
+@dataclass
+class PolarsBusinessDuration:
+    """Build Polars expressions from a BusinessDuration.
+
+    Columns may be given by name or as expressions and must have a Datetime
+    dtype. Naive columns are assumed to be in the business timezone, as in
+    BusinessDuration.calculate(). Time zone aware columns are converted to the
+    business timezone in bulk. Null inputs produce null outputs.
+
+    Args:
+        business_duration: The calendar to evaluate against.
+
+    Raises:
+        TypeError: If business_duration is not a BusinessDuration.
+
+    Example:
+        >>> pbd = PolarsBusinessDuration(duration)
+        >>> df.with_columns(
+        ...     business_duration=pbd.duration("start_time", "end_time"),
+        ...     opened_in_hours=pbd.is_within_business_hours("start_time"),
+        ... )
+    """
+
+    business_duration: BusinessDuration
+
+    # Internal fields (initialized in __post_init__)
+    _weekday_starts: List["pl.Series"] = field(default=None, init=False, repr=False)
+    _weekday_ends: List["pl.Series"] = field(default=None, init=False, repr=False)
+    _exception_starts: List["pl.Series"] = field(default=None, init=False, repr=False)
+    _exception_ends: List["pl.Series"] = field(default=None, init=False, repr=False)
+
+    # -------------------------------------------------------------------------
+    # Initialization
+    # -------------------------------------------------------------------------
+
+    def __post_init__(self):
+        """Validate the input and convert the calendar tables to Series."""
+        if not isinstance(self.business_duration, BusinessDuration):
+            raise TypeError(
+                "business_duration must be a BusinessDuration, "
+                f"got {type(self.business_duration).__name__}."
+            )
+
+        calendar = self.business_duration.calendar
+        width = calendar.segment_width
+        self._weekday_starts, self._weekday_ends = self._segment_columns(
+            calendar.weekday_segments, width
+        )
+        self._exception_starts, self._exception_ends = self._segment_columns(
+            calendar.exception_segments, width
+        )
+
+    @staticmethod
+    def _segment_columns(
+        rows, width: int
+    ) -> Tuple[List["pl.Series"], List["pl.Series"]]:
+        """Split per-day segments into one start and one end Series per slot.
+
+        Days with fewer than width segments are padded with empty (0, 0)
+        segments, which never contain an instant and add no business time.
+
+        Args:
+            rows: Per-day tuples of (start_seconds, end_seconds) segments.
+            width: The number of segment slots.
+
+        Returns:
+            Two lists of width Int64 Series, in microseconds.
+        """
+        starts, ends = [], []
+
+        for slot in range(width):
+            padded = [
+                segments[slot] if slot < len(segments) else (0, 0) for segments in rows
+            ]
+            starts.append(
+                pl.Series(
+                    [start * MICROSECONDS_PER_SECOND for start, _ in padded],
+                    dtype=pl.Int64,
+                )
+            )
+            ends.append(
+                pl.Series(
+                    [end * MICROSECONDS_PER_SECOND for _, end in padded], dtype=pl.Int64
+                )
+            )
+
+        return starts, ends
+
+    # -------------------------------------------------------------------------
+    # Public Methods
+    # -------------------------------------------------------------------------
+
+    def duration(self, start: IntoExpr, end: IntoExpr) -> "pl.Expr":
+        """Expression for the business duration between two Datetime columns.
+
+        Args:
+            start: The interval start column (name or expression).
+            end: The interval end column (name or expression).
+
+        Returns:
+            A Duration("us") expression. Rows where start >= end evaluate to
+            zero.
+
+        Example:
+            >>> df.with_columns(
+            ...     business_duration=pbd.duration("start_time", "end_time")
+            ... )
+        """
+        start_us = self._local_microseconds(start)
+        end_us = self._local_microseconds(end)
+
+        elapsed = self._elapsed(end_us) - self._elapsed(start_us)
+        return (
+            pl.when(end_us > start_us)
+            .then(elapsed.clip(lower_bound=0))
+            .when(end_us <= start_us)
+            .then(0)
+            .cast(pl.Duration("us"))
+        )
+
+    def is_within_business_hours(self, column: IntoExpr) -> "pl.Expr":
+        """Expression flagging Datetime values that fall within business hours.
+
+        Args:
+            column: The Datetime column to check (name or expression).
+
+        Returns:
+            A Boolean expression.
+
+        Example:
+            >>> df.with_columns(
+            ...     opened_in_hours=pbd.is_within_business_hours("start_time")
+            ... )
+        """
+        local_us = self._local_microseconds(column)
+        day, time_of_day, weekday = self._split_day(local_us)
+        starts, ends = self._day_segments(day, weekday)
+
+        return pl.any_horizontal(
+            (time_of_day >= seg_start) & (time_of_day < seg_end)
+            for seg_start, seg_end in zip(starts, ends)
+        )
+
+    def add_business_time(
+        self, start: IntoExpr, duration: Union[IntoExpr, timedelta]
+    ) -> "pl.Expr":
+        """Expression for the deadline a duration of business time after start.
+
+        The vectorized form of BusinessDuration.add_business_time(). Each
+        batch is handed to the compiled calendar as a NumPy array, so the
+        deadlines are located with array operations rather than per row.
+
+        Args:
+            start: The Datetime column the clock starts at (name or expression).
+            duration: A Duration column (name or expression) or a single
+                timedelta. Negative durations go back in time.
+
+        Returns:
+            A naive Datetime("us") expression holding the deadline as wall
+            time in the business timezone.
+
+        Raises:
+            ValueError: At evaluation, if the calendar never accumulates
+                enough business time for some row.
+
+        Example:
+            >>> df.with_columns(
+            ...     due_at=pbd.add_business_time("opened_at", timedelta(hours=8))
+            ... )
+        """
+        calendar = self.business_duration.calendar
+        start_us = self._local_microseconds(start)
+
+        if isinstance(duration, timedelta):
+            duration = pl.lit(duration)
+        elif isinstance(duration, str):
+            duration = pl.col(duration)
+        amount_us = duration.cast(pl.Duration("us")).cast(pl.Int64)
+
+        def advance(batch: "pl.Series") -> "pl.Series":
+            local_us = batch.struct.field("start").fill_null(0).to_numpy()
+            amounts = batch.struct.field("amount").fill_null(0).to_numpy()
+            return pl.Series(calendar.advance_array(local_us, amounts), dtype=pl.Int64)
+
+        deadline_us = pl.struct(start=start_us, amount=amount_us).map_batches(
+            advance, return_dtype=pl.Int64, is_elementwise=True
+        )
+        return (
+            pl.when(start_us.is_not_null() & amount_us.is_not_null())
+            .then(deadline_us)
+            .cast(pl.Datetime("us"))
+        )
+
+    # -------------------------------------------------------------------------
+    # Internal Expression Builders
+    # -------------------------------------------------------------------------
+
+    def _local_microseconds(self, column: IntoExpr) -> "pl.Expr":
+        """Convert a Datetime column to local wall-clock microseconds.
+
+        Args:
+            column: The Datetime column (name or expression).
+
+        Returns:
+            An Int64 expression of microseconds since 1970-01-01 in the
+            business timezone.
+        """
+        time_zone = self.business_duration.business_timezone.key
+
+        def to_local(series: "pl.Series") -> "pl.Series":
+            if not isinstance(series.dtype, pl.Datetime):
+                raise TypeError(f"Expected a Datetime column, got {series.dtype}.")
+            if series.dtype.time_zone is not None:
+                series = series.dt.convert_time_zone(time_zone).dt.replace_time_zone(
+                    None
+                )
+            return series.dt.epoch("us")
+
+        expr = pl.col(column) if isinstance(column, str) else column
+        return expr.map_batches(to_local, return_dtype=pl.Int64, is_elementwise=True)
+
+    @staticmethod
+    def _split_day(local_us: "pl.Expr") -> Tuple["pl.Expr", "pl.Expr", "pl.Expr"]:
+        """Split local microseconds into epoch day, time of day, and weekday."""
+        day = local_us // MICROSECONDS_PER_DAY
+        time_of_day = local_us - day * MICROSECONDS_PER_DAY
+        weekday = (day + EPOCH_WEEKDAY_SHIFT) % 7
+        return day, time_of_day, weekday
+
+    def _day_segments(
+        self, day: "pl.Expr", weekday: "pl.Expr"
+    ) -> Tuple[List["pl.Expr"], List["pl.Expr"]]:
+        """Look up the business segments for each row's day.
+
+        Args:
+            day: Epoch day numbers.
+            weekday: The matching weekdays (Monday == 0).
+
+        Returns:
+            Lists of segment start and end expressions in microseconds from
+            local midnight, one per segment slot.
+        """
+        starts = [pl.lit(series).gather(weekday) for series in self._weekday_starts]
+        ends = [pl.lit(series).gather(weekday) for series in self._weekday_ends]
+
+        exception_days = self.business_duration.calendar.exception_days
+        if not exception_days:
+            return starts, ends
+
+        position = self._exception_position(day).clip(
+            upper_bound=len(exception_days) - 1
+        )
+        is_exception = (
+            pl.lit(pl.Series(exception_days, dtype=pl.Int64)).gather(position) == day
+        )
+
+        starts = [
+            pl.when(is_exception).then(pl.lit(series).gather(position)).otherwise(start)
+            for series, start in zip(self._exception_starts, starts)
+        ]
+        ends = [
+            pl.when(is_exception).then(pl.lit(series).gather(position)).otherwise(end)
+            for series, end in zip(self._exception_ends, ends)
+        ]
+        return starts, ends
+
+    def _exception_position(self, day: "pl.Expr") -> "pl.Expr":
+        """Index of the first exception day on or after each row's day."""
+        exception_days = pl.Series(
+            self.business_duration.calendar.exception_days, dtype=pl.Int64
+        )
+        return pl.lit(exception_days).search_sorted(day, side="left")
+
+    def _elapsed(self, local_us: "pl.Expr") -> "pl.Expr":
+        """Expression form of CompiledCalendar.elapsed()."""
+        calendar = self.business_duration.calendar
+        day, time_of_day, weekday = self._split_day(local_us)
+
+        week_prefix = pl.Series(calendar.week_prefix[:7], dtype=pl.Int64)
+        weeks = (day + EPOCH_WEEKDAY_SHIFT) // 7
+        total_seconds = weeks * calendar.week_seconds + pl.lit(week_prefix).gather(
+            weekday
+        )
+
+        if calendar.exception_days:
+            offsets = pl.Series(calendar.exception_offsets, dtype=pl.Int64)
+            total_seconds = total_seconds + pl.lit(offsets).gather(
+                self._exception_position(day)
+            )
+
+        starts, ends = self._day_segments(day, weekday)
+        partial = pl.sum_horizontal(
+            time_of_day.clip(seg_start, seg_end) - seg_start
+            for seg_start, seg_end in zip(starts, ends)
+        )
+        return total_seconds * MICROSECONDS_PER_SECOND + partial
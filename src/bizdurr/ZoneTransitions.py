@@ -0,0 +1,434 @@
+"""UTC offset transition tables for bulk timezone conversion.
+
+This module provides the ZoneTransitions class, which extracts the UTC offset
+changes of a time zone once and then converts whole arrays of timestamps
+between UTC and local wall-clock time with a binary search, instead of calling
+datetime.astimezone() per element.
+"""
+
+import os
+import struct
+import threading
+import zoneinfo
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from importlib import resources
+from typing import ClassVar, Dict, List, NamedTuple, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from bizdurr.LRUCache import LRUCache
+from bizdurr.utils import NAT_INT64, import_optional
+
+# The table grows in aligned blocks of about a year of UTC seconds
+BLOCK_SECONDS = 1 << 25
+
+# Where the zone file does not list the transitions, offsets are sampled and
+# each change is bisected to the second. After the last listed transition a
+# zone follows a POSIX TZ rule, whose (at most two) changes a year fall on
+# different dates, so daily samples find them all. Zones without a file are
+# sampled hourly, which finds every change at least an hour after the last;
+# no zone in the tz database has changes closer together than two days.
+RULE_SAMPLE_SECONDS = 86_400
+SAMPLE_SECONDS = 3_600
+
+# Number of zones without a key (from ZoneInfo.from_file()) whose tables are
+# kept for sharing; zones with a key share one table per key
+UNKEYED_ZONE_CACHE_SIZE = 64
+
+# Local and UTC times are less than two days apart in any zone
+LOCAL_MARGIN_SECONDS = 2 * 86_400
+
+# Header of a TZif zone file (RFC 8536): magic bytes, version, 15 unused
+# bytes, and the counts of its six data tables
+TZIF_HEADER = struct.Struct(">4s1s15x6l")
+
+# Instants whose local time stays within datetime's range in every zone
+MIN_SECONDS = int(datetime(1, 1, 3, tzinfo=timezone.utc).timestamp())
+MAX_SECONDS = int(datetime(9999, 12, 29, tzinfo=timezone.utc).timestamp())
+
+MICROSECONDS = timedelta(microseconds=1)
+
+
+class TransitionTable(NamedTuple):
+    """An immutable snapshot of the transitions within a range of UTC seconds.
+
+    Transitions are in microseconds. offsets[i] applies before
+    transitions[i] and after the previous transition, so there is one more
+    offset than there are transitions.
+    """
+
+    start: int
+    end: int
+    transitions: Tuple[int, ...]
+    local_transitions: Tuple[int, ...]
+    offsets: Tuple[int, ...]
+
+
+@dataclass
+class ZoneTransitions:
+    """The UTC offset transitions of a time zone, as searchable arrays.
+
+    The instants of the transitions are read from the zone's TZif file
+    (where the ZoneInfo found it: zoneinfo.TZPATH or the tzdata package),
+    and the offsets are asked of the ZoneInfo itself, so conversions agree
+    with datetime.astimezone(). Beyond the transitions the file lists, and
+    for zones without a file, transitions are found by sampling the offset
+    (see SAMPLE_SECONDS). The table covers only the years that have been
+    converted so far and grows on demand. Use for_timezone() to share one
+    table per time zone.
+
+    Conversions are safe to run from many threads. Growing the table takes
+    a lock and publishes a new immutable TransitionTable, so conversions
+    within the covered years never wait for a lock.
+
+    Args:
+        tz: The time zone.
+
+    Example:
+        >>> transitions = ZoneTransitions.for_timezone(ZoneInfo("America/New_York"))
+        >>> utc_us = np.array(["2025-03-09T07:30"], dtype="datetime64[us]").view(np.int64)
+        >>> transitions.to_local_array(utc_us).astype("datetime64[us]")
+        array(['2025-03-09T03:30:00.000000'], dtype='datetime64[us]')
+    """
+
+    tz: ZoneInfo
+
+    _shared: ClassVar[Dict[str, "ZoneTransitions"]] = {}
+    _shared_unkeyed: ClassVar[LRUCache] = LRUCache(maxsize=UNKEYED_ZONE_CACHE_SIZE)
+
+    # Internal fields (initialized in __post_init__)
+    _table: TransitionTable = field(default=None, init=False, repr=False)
+    _arrays: Optional[Tuple] = field(default=None, init=False, repr=False)
+    _listed: Optional[Tuple[int, ...]] = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default=None, init=False, repr=False, compare=False)
+
+    # -------------------------------------------------------------------------
+    # Initialization
+    # -------------------------------------------------------------------------
+
+    def __post_init__(self):
+        """Start with an empty table at the Unix epoch."""
+        self._table = TransitionTable(0, 0, (), (), (self._offset_at(0),))
+        self._arrays = None
+        self._listed = _read_zone_file(self.tz.key) if self.tz.key else None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_timezone(cls, tz: ZoneInfo) -> "ZoneTransitions":
+        """Get the table shared by every calendar in a time zone.
+
+        Tables are shared by zone key, so ZoneInfo.no_cache() instances of
+        one zone share a table too. Zones without a key compare by identity;
+        only the most recently used of those are kept (see
+        UNKEYED_ZONE_CACHE_SIZE).
+
+        Args:
+            tz: The time zone.
+
+        Returns:
+            The ZoneTransitions for tz, created on first use.
+        """
+        if tz.key is None:
+            return cls._shared_unkeyed.get_or_compute(tz, lambda: cls(tz))
+
+        transitions = cls._shared.get(tz.key)
+        if transitions is None:
+            transitions = cls._shared.setdefault(tz.key, cls(tz))
+        return transitions
+
+    # -------------------------------------------------------------------------
+    # Public Methods
+    # -------------------------------------------------------------------------
+
+    def to_local(self, utc_us: int) -> int:
+        """Convert a UTC instant to local wall-clock time.
+
+        Args:
+            utc_us: Microseconds since 1970-01-01 UTC.
+
+        Returns:
+            Local wall-clock microseconds since 1970-01-01.
+        """
+        table = self._cover(utc_us, utc_us, margin=0)
+        return utc_us + table.offsets[bisect_right(table.transitions, utc_us)]
+
+    def to_utc(self, local_us: int) -> int:
+        """Convert a local wall-clock time to a UTC instant.
+
+        Wall times are resolved as in to_utc_array().
+
+        Args:
+            local_us: Local wall-clock microseconds since 1970-01-01.
+
+        Returns:
+            Microseconds since 1970-01-01 UTC.
+        """
+        table = self._cover(local_us, local_us, margin=LOCAL_MARGIN_SECONDS)
+        return local_us - table.offsets[bisect_right(table.local_transitions, local_us)]
+
+    def to_local_array(self, utc_us):
+        """Vectorized to_local() over an int64 array.
+
+        Args:
+            utc_us: A NumPy int64 array of microseconds since 1970-01-01 UTC.
+                NAT_INT64 entries are passed through.
+
+        Returns:
+            An int64 array of local wall-clock microseconds since 1970-01-01.
+        """
+        np = import_optional("numpy")
+
+        utc_us = np.asarray(utc_us, dtype=np.int64)
+        missing = utc_us == NAT_INT64
+        table = self._cover_array(utc_us[~missing], margin=0)
+
+        transitions_us, _, offsets_us = self._table_arrays(table)
+        index = np.searchsorted(transitions_us, utc_us, side="right")
+        return np.where(missing, NAT_INT64, utc_us + offsets_us[index])
+
+    def to_utc_array(self, local_us):
+        """Convert local wall-clock times to UTC instants.
+
+        Wall times are resolved like datetime.replace(tzinfo=tz) with
+        fold=0: an ambiguous time in a fold takes its first occurrence,
+        and a time skipped by a gap uses the offset from before the gap
+        (so 02:30 on a spring-forward night is 03:30 after the change).
+
+        Args:
+            local_us: A NumPy int64 array of local wall-clock microseconds
+                since 1970-01-01. NAT_INT64 entries are passed through.
+
+        Returns:
+            An int64 array of microseconds since 1970-01-01 UTC.
+        """
+        np = import_optional("numpy")
+
+        local_us = np.asarray(local_us, dtype=np.int64)
+        missing = local_us == NAT_INT64
+        table = self._cover_array(local_us[~missing], margin=LOCAL_MARGIN_SECONDS)
+
+        _, local_transitions_us, offsets_us = self._table_arrays(table)
+        index = np.searchsorted(local_transitions_us, local_us, side="right")
+        return np.where(missing, NAT_INT64, local_us - offsets_us[index])
+
+    # -------------------------------------------------------------------------
+    # Internal Helpers
+    # -------------------------------------------------------------------------
+
+    def _cover_array(self, values_us, margin: int) -> TransitionTable:
+        """Get a table covering an int64 array without NAT_INT64."""
+        if not values_us.size:
+            return self._table
+        return self._cover(int(values_us.min()), int(values_us.max()), margin)
+
+    def _cover(self, first_us: int, last_us: int, margin: int) -> TransitionTable:
+        """Get a table covering a range of instants, growing it if needed.
+
+        Args:
+            first_us: The earliest instant in microseconds.
+            last_us: The latest instant in microseconds.
+            margin: Extra seconds to cover on either side.
+
+        Returns:
+            The current table, which covers the range.
+        """
+        first = first_us // 1_000_000 - margin
+        last = last_us // 1_000_000 + margin
+
+        table = self._table
+        if table.start <= first and last <= table.end:
+            return table
+
+        with self._lock:
+            table = self._table
+            if not (table.start <= first and last <= table.end):
+                table = self._extend(table, first, last)
+                self._table = table
+            return table
+
+    def _extend(self, table: TransitionTable, first: int, last: int) -> TransitionTable:
+        """Build a table that also covers the UTC seconds [first, last].
+
+        Ranges are rounded out to whole blocks, so that nearby conversions
+        don't each grow the table.
+        """
+        start = max(first // BLOCK_SECONDS * BLOCK_SECONDS, MIN_SECONDS)
+        end = min(-(-last // BLOCK_SECONDS) * BLOCK_SECONDS, MAX_SECONDS)
+        transitions = list(table.transitions)
+        offsets = list(table.offsets)
+
+        if start < table.start:
+            earlier = self._find_transitions(start, table.start)
+            transitions[:0] = [moment * 1_000_000 for moment, _ in earlier]
+            # The last change found leads into the offset already held
+            new_offsets = [self._offset_at(start)] + [offset for _, offset in earlier]
+            offsets[:0] = new_offsets[:-1]
+        else:
+            start = table.start
+
+        if end > table.end:
+            later = self._find_transitions(table.end, end)
+            transitions.extend(moment * 1_000_000 for moment, _ in later)
+            offsets.extend(offset for _, offset in later)
+        else:
+            end = table.end
+
+        # A transition's local time is where fold=0 wall times switch to the
+        # new offset: the later of its two wall times
+        local_transitions = [
+            moment + max(before, after)
+            for moment, before, after in zip(transitions, offsets, offsets[1:])
+        ]
+        return TransitionTable(
+            start, end, tuple(transitions), tuple(local_transitions), tuple(offsets)
+        )
+
+    def _table_arrays(self, table: TransitionTable) -> Tuple:
+        """Get a table as NumPy arrays, building them on first use.
+
+        Returns:
+            (UTC transitions, local transitions, offsets) as int64
+            microseconds.
+        """
+        np = import_optional("numpy")
+
+        cached = self._arrays
+        if cached is None or cached[0] is not table:
+            arrays = (
+                np.array(table.transitions, dtype=np.int64),
+                np.array(table.local_transitions, dtype=np.int64),
+                np.array(table.offsets, dtype=np.int64),
+            )
+            cached = self._arrays = (table, arrays)
+        return cached[1]
+
+    def _find_transitions(self, start: int, end: int) -> List[Tuple[int, int]]:
+        """Find the offset changes in the UTC seconds (start, end].
+
+        Returns:
+            A list of (UTC second of the change, new offset in microseconds).
+        """
+        if self._listed is None:
+            return self._sample_transitions(start, end, SAMPLE_SECONDS)
+
+        found = []
+        previous_offset = self._offset_at(start)
+        listed = self._listed
+        last_listed = listed[-1] if listed else start
+        for moment in listed[bisect_right(listed, start) : bisect_right(listed, end)]:
+            # Changes of abbreviation or daylight flag alone are listed too
+            offset = self._offset_at(moment)
+            if offset != previous_offset:
+                found.append((moment, offset))
+                previous_offset = offset
+
+        if end > last_listed:
+            found += self._sample_transitions(
+                max(start, last_listed), end, RULE_SAMPLE_SECONDS
+            )
+        return found
+
+    def _sample_transitions(
+        self, start: int, end: int, step: int
+    ) -> List[Tuple[int, int]]:
+        """Find the offset changes in (start, end] by sampling every step seconds."""
+        found = []
+        previous_moment, previous_offset = start, self._offset_at(start)
+        moment = start
+        while moment < end:
+            moment = min(moment + step, end)
+            offset = self._offset_at(moment)
+            if offset != previous_offset:
+                found.append((self._bisect(previous_moment, moment, offset), offset))
+            previous_moment, previous_offset = moment, offset
+        return found
+
+    def _bisect(self, before: int, after: int, offset: int) -> int:
+        """Find the first second in (before, after] with the given offset."""
+        while after - before > 1:
+            middle = (before + after) // 2
+            if self._offset_at(middle) == offset:
+                after = middle
+            else:
+                before = middle
+        return after
+
+    def _offset_at(self, moment: int) -> int:
+        """Get the UTC offset in microseconds at a UTC second."""
+        local = datetime.fromtimestamp(moment, self.tz)
+        return local.utcoffset() // MICROSECONDS
+
+
+# -----------------------------------------------------------------------------
+# Zone Files
+# -----------------------------------------------------------------------------
+
+
+def _read_zone_file(key: str) -> Optional[Tuple[int, ...]]:
+    """Read the transition instants of a zone from its TZif file.
+
+    The file is looked up like ZoneInfo(key) does: in each directory of
+    zoneinfo.TZPATH, then in the tzdata package.
+
+    Returns:
+        The listed transitions in UTC seconds, in increasing order, or None
+        if the file cannot be found or read.
+    """
+    data = None
+    for directory in zoneinfo.TZPATH:
+        path = os.path.join(directory, key)
+        if os.path.isfile(path):
+            try:
+                with open(path, "rb") as zone_file:
+                    data = zone_file.read()
+            except OSError:
+                return None
+            break
+    else:
+        try:
+            resource = resources.files("tzdata").joinpath("zoneinfo")
+            for part in key.split("/"):
+                resource = resource.joinpath(part)
+            data = resource.read_bytes()
+        except (ImportError, OSError):
+            return None
+
+    try:
+        return _parse_zone_file(data)
+    except (ValueError, struct.error):
+        return None
+
+
+def _parse_zone_file(data: bytes) -> Tuple[int, ...]:
+    """Get the transition instants of TZif data (RFC 8536).
+
+    Raises:
+        ValueError: If data is not TZif data.
+    """
+    magic, version, *counts = TZIF_HEADER.unpack_from(data)
+    if magic != b"TZif":
+        raise ValueError("Not a TZif zone file.")
+
+    time_size = 4
+    offset = TZIF_HEADER.size
+    if version >= b"2":
+        # Skip the 32-bit data to the 64-bit header and data that follow
+        utc_count, std_count, leap_count, time_count, type_count, char_count = counts
+        offset += (
+            time_count * 5
+            + type_count * 6
+            + char_count
+            + leap_count * 8
+            + std_count
+            + utc_count
+        )
+        _, _, *counts = TZIF_HEADER.unpack_from(data, offset)
+        offset += TZIF_HEADER.size
+        time_size = 8
+
+    time_count = counts[3]
+    times = struct.unpack_from(
+        f">{time_count}{'q' if time_size == 8 else 'l'}", data, offset
+    )
+    return tuple(sorted(moment for moment in times if MIN_SECONDS < moment < MAX_SECONDS))
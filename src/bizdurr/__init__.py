@@ -24,11 +24,23 @@ Example:
 from bizdurr.BusinessDuration import BusinessDuration
 from bizdurr.BusinessHours import BusinessHours
 from bizdurr.BusinessHoursOverrides import BusinessHoursOverrides
+from bizdurr.BusinessTimeIndex import BusinessTimeIndex
+from bizdurr.CalendarCache import CalendarCache
+from bizdurr.CalendarRegistry import CalendarRegistry
+from bizdurr.FrozenBusinessDuration import FrozenBusinessDuration
+from bizdurr.ParallelBusinessDuration import ParallelBusinessDuration
+from bizdurr.cli import main
 
 __all__ = [
     "BusinessDuration",
     "BusinessHours",
     "BusinessHoursOverrides",
+    "BusinessTimeIndex",
+    "CalendarCache",
+    "CalendarRegistry",
+    "FrozenBusinessDuration",
+    "ParallelBusinessDuration",
+    "main",
 ]
 
 __version__ = "1.0.0"
@@ -0,0 +1,292 @@
+"""Apache Arrow compute functions for business duration calculations.
+
+This module evaluates a BusinessDuration against pyarrow timestamp arrays.
+Each chunk's int64 buffer is viewed as a NumPy array and evaluated against the
+compiled calendar, so no Python datetime objects are created.
+"""
+
+from datetime import timedelta
+from typing import Iterator, Tuple, Union
+
+from bizdurr.BusinessDuration import BusinessDuration
+from bizdurr.utils import import_optional
+
+pa = import_optional("pyarrow")
+pc = import_optional("pyarrow.compute")
+np = import_optional("numpy")
+
+ArrowTimestamps = Union["pa.Array", "pa.ChunkedArray"]
+
+
+def calculate_arrow(
+    business_duration: BusinessDuration,
+    starts: ArrowTimestamps,
+    ends: ArrowTimestamps,
+) -> ArrowTimestamps:
+    """Calculate business durations for pyarrow timestamp arrays.
+
+    Semantics match BusinessDuration.calculate(): timestamps without a time
+    zone are assumed to be in the business timezone, and timestamps with one
+    are converted to it. ChunkedArrays are processed chunk by chunk; if the
+    two inputs are chunked differently, zero-copy slices are taken so that
+    chunks line up.
+
+    Args:
+        business_duration: The calendar to evaluate against.
+        starts: A timestamp Array or ChunkedArray of interval starts.
+        ends: A timestamp Array or ChunkedArray of interval ends, with the
+            same length as starts.
+
+    Returns:
+        A duration("us") Array, or a ChunkedArray if either input is chunked.
+        Intervals where start >= end are zero and rows where either input is
+        null are null.
+
+    Raises:
+        TypeError: If an input is not a timestamp array.
+        ValueError: If starts and ends differ in length.
+
+    Example:
+        >>> table = pq.read_table("tickets.parquet")
+        >>> durations = calculate_arrow(
+        ...     duration, table["opened_at"], table["closed_at"]
+        ... )
+        >>> table = table.append_column("business_duration", durations)
+    """
+    if len(starts) != len(ends):
+        raise ValueError(
+            f"starts and ends must have the same length, got {len(starts)} and {len(ends)}."
+        )
+
+    if isinstance(starts, pa.ChunkedArray) or isinstance(ends, pa.ChunkedArray):
+        return pa.chunked_array(
+            [
+                _calculate_chunk(business_duration, start_chunk, end_chunk)
+                for start_chunk, end_chunk in _aligned_chunks(starts, ends)
+            ],
+            type=pa.duration("us"),
+        )
+
+    return _calculate_chunk(business_duration, starts, ends)
+
+
+def add_business_time_arrow(
+    business_duration: BusinessDuration,
+    starts: ArrowTimestamps,
+    durations: Union[ArrowTimestamps, timedelta],
+) -> ArrowTimestamps:
+    """Calculate deadlines for pyarrow timestamp arrays.
+
+    The Arrow form of BusinessDuration.add_business_time_many().
+
+    Args:
+        business_duration: The calendar to evaluate against.
+        starts: A timestamp Array or ChunkedArray of start times.
+        durations: A duration Array or ChunkedArray with the same length as
+            starts, or a single timedelta applied to every row.
+
+    Returns:
+        A timestamp("us") Array, or a ChunkedArray if an input is chunked.
+        Naive starts give naive deadlines in the business timezone; starts
+        with a time zone give deadlines in that time zone. Rows where either
+        input is null are null.
+
+    Raises:
+        TypeError: If an input has the wrong type.
+        ValueError: If the inputs differ in length, or the calendar never
+            accumulates enough business time for some row.
+
+    Example:
+        >>> due_at = add_business_time_arrow(
+        ...     duration, table["opened_at"], timedelta(hours=8)
+        ... )
+    """
+    if isinstance(durations, timedelta):
+        durations = pa.repeat(pa.scalar(durations, type=pa.duration("us")), len(starts))
+
+    if len(starts) != len(durations):
+        raise ValueError(
+            "starts and durations must have the same length, "
+            f"got {len(starts)} and {len(durations)}."
+        )
+
+    result_type = pa.timestamp("us", tz=starts.type.tz)
+    if isinstance(starts, pa.ChunkedArray) or isinstance(durations, pa.ChunkedArray):
+        return pa.chunked_array(
+            [
+                _advance_chunk(business_duration, start_chunk, duration_chunk)
+                for start_chunk, duration_chunk in _aligned_chunks(starts, durations)
+            ],
+            type=result_type,
+        )
+
+    return _advance_chunk(business_duration, starts, durations)
+
+
+def is_within_business_hours_arrow(
+    business_duration: BusinessDuration, timestamps: ArrowTimestamps
+) -> ArrowTimestamps:
+    """Flag pyarrow timestamps that fall within business hours.
+
+    Args:
+        business_duration: The calendar to evaluate against.
+        timestamps: A timestamp Array or ChunkedArray.
+
+    Returns:
+        A boolean Array, or a ChunkedArray for chunked input. Null timestamps
+        give null flags.
+
+    Raises:
+        TypeError: If the input is not a timestamp array.
+
+    Example:
+        >>> opened_in_hours = is_within_business_hours_arrow(
+        ...     duration, table["opened_at"]
+        ... )
+    """
+    if isinstance(timestamps, pa.ChunkedArray):
+        return pa.chunked_array(
+            [_is_open_chunk(business_duration, chunk) for chunk in timestamps.chunks],
+            type=pa.bool_(),
+        )
+
+    return _is_open_chunk(business_duration, timestamps)
+
+
+# -----------------------------------------------------------------------------
+# Internal Helpers
+# -----------------------------------------------------------------------------
+
+
+def _calculate_chunk(
+    business_duration: BusinessDuration, starts: "pa.Array", ends: "pa.Array"
+) -> "pa.Array":
+    """Calculate business durations for a pair of equal-length arrays."""
+    start_us = _to_local_microseconds(business_duration, starts)
+    end_us = _to_local_microseconds(business_duration, ends)
+
+    durations = business_duration.calendar.duration_array(start_us, end_us)
+
+    if starts.null_count or ends.null_count:
+        valid = pc.and_(starts.is_valid(), ends.is_valid())
+        return pa.array(
+            durations,
+            type=pa.duration("us"),
+            mask=np.logical_not(valid.to_numpy(zero_copy_only=False)),
+        )
+    return pa.array(durations, type=pa.duration("us"))
+
+
+def _advance_chunk(
+    business_duration: BusinessDuration, starts: "pa.Array", durations: "pa.Array"
+) -> "pa.Array":
+    """Calculate deadlines for a pair of equal-length arrays."""
+    if not pa.types.is_duration(durations.type):
+        raise TypeError(f"Expected a duration array, got {durations.type}.")
+
+    start_us = _to_local_microseconds(business_duration, starts)
+    amounts = durations.cast(pa.duration("us")).view(pa.int64())
+    amount_us = amounts.fill_null(0).to_numpy(zero_copy_only=False)
+
+    valid = pc.and_(starts.is_valid(), durations.is_valid())
+    valid_mask = valid.to_numpy(zero_copy_only=False)
+
+    deadlines = business_duration.calendar.advance_array(
+        np.where(valid_mask, start_us, 0), np.where(valid_mask, amount_us, 0)
+    )
+    mask = np.logical_not(valid_mask)
+    if starts.type.tz is None:
+        return pa.array(deadlines, type=pa.timestamp("us"), mask=mask)
+
+    # Resolve the local wall times as the scalar API does, then relabel
+    utc_us = business_duration.zone_transitions.to_utc_array(deadlines)
+    result = pa.array(utc_us, type=pa.timestamp("us", tz="UTC"), mask=mask)
+    return result.cast(pa.timestamp("us", tz=starts.type.tz))
+
+
+def _is_open_chunk(
+    business_duration: BusinessDuration, timestamps: "pa.Array"
+) -> "pa.Array":
+    """Flag the timestamps of one array that fall within business hours."""
+    local_us = _to_local_microseconds(business_duration, timestamps)
+    is_open = business_duration.calendar.is_open_array(local_us)
+
+    if timestamps.null_count:
+        return pa.array(
+            is_open,
+            type=pa.bool_(),
+            mask=np.logical_not(timestamps.is_valid().to_numpy(zero_copy_only=False)),
+        )
+    return pa.array(is_open, type=pa.bool_())
+
+
+def _to_local_microseconds(
+    business_duration: BusinessDuration, array: "pa.Array"
+) -> "np.ndarray":
+    """View a timestamp array as int64 local wall-clock microseconds.
+
+    Args:
+        business_duration: Supplies the business timezone.
+        array: A timestamp array of any unit, with or without a time zone.
+
+    Returns:
+        A NumPy int64 array. Null slots hold an arbitrary value.
+
+    Raises:
+        TypeError: If the array is not a timestamp array.
+    """
+    if not pa.types.is_timestamp(array.type):
+        raise TypeError(f"Expected a timestamp array, got {array.type}.")
+
+    if array.type.tz is not None:
+        time_zone = business_duration.business_timezone.key
+        array = pc.local_timestamp(
+            array.cast(pa.timestamp(array.type.unit, tz=time_zone))
+        )
+
+    if array.type.unit != "us":
+        array = array.cast(pa.timestamp("us"), safe=False)
+
+    values = array.view(pa.int64())
+    if values.null_count:
+        values = values.fill_null(0)
+    return values.to_numpy(zero_copy_only=False)
+
+
+def _aligned_chunks(
+    starts: ArrowTimestamps, ends: ArrowTimestamps
+) -> Iterator[Tuple["pa.Array", "pa.Array"]]:
+    """Yield pairs of equal-length slices covering two (chunked) arrays.
+
+    Slices are cut at every chunk boundary of either input, so both sides of
+    each pair are zero-copy views of a single chunk.
+    """
+    start_chunks = _chunks(starts)
+    end_chunks = _chunks(ends)
+    start_index = end_index = 0
+    start_offset = end_offset = 0
+
+    while start_index < len(start_chunks) and end_index < len(end_chunks):
+        start_chunk = start_chunks[start_index]
+        end_chunk = end_chunks[end_index]
+        length = min(len(start_chunk) - start_offset, len(end_chunk) - end_offset)
+
+        if length:
+            yield (
+                start_chunk.slice(start_offset, length),
+                end_chunk.slice(end_offset, length),
+            )
+
+        start_offset += length
+        end_offset += length
+        if start_offset == len(start_chunk):
+            start_index, start_offset = start_index + 1, 0
+        if end_offset == len(end_chunk):
+            end_index, end_offset = end_index + 1, 0
+
+
+def _chunks(array: ArrowTimestamps) -> list:
+    """Get the chunks of a ChunkedArray, or a plain Array as a single chunk."""
+    if isinstance(array, pa.ChunkedArray):
+        return array.chunks
+    return [array]
@@ -0,0 +1,516 @@
+"""Command-line tool for enriching files with business time columns.
+
+This module implements the ``bizdurr`` console script. It reads a calendar
+config, streams an input file (CSV, Parquet, or JSON Lines) in record batches,
+adds business duration, deadline, and within-hours columns, and writes each
+batch out before reading the next, so memory use is bounded by the batch size
+regardless of the file size.
+
+Example:
+    $ bizdurr --config calendar.json tickets.csv enriched.parquet \\
+        --duration business_duration=opened_at,closed_at \\
+        --deadline due_at=opened_at,8h \\
+        --within opened_in_hours=opened_at
+"""
+
+import argparse
+import json
+import re
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from bizdurr.BusinessDuration import BusinessDuration
+from bizdurr.utils import import_optional
+
+# File extensions recognized when --input-format/--output-format are omitted
+FORMAT_EXTENSIONS = {
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+}
+
+# Keys accepted in the calendar config, matching BusinessDuration's arguments
+CONFIG_KEYS = ("business_hours", "business_timezone", "holidays", "overrides")
+
+# Literal durations for --deadline, e.g. "8h", "90m", or "3600s"
+DURATION_PATTERN = re.compile(r"^(\d+(?:\.\d+)?)([hms])$")
+DURATION_UNITS = {"h": "hours", "m": "minutes", "s": "seconds"}
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the bizdurr command-line tool.
+
+    Args:
+        argv: Command-line arguments, excluding the program name. Defaults
+            to sys.argv[1:].
+
+    Returns:
+        The process exit code: 0 on success, 2 on usage or input errors.
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    if not (args.duration or args.deadline or args.within):
+        parser.error("at least one of --duration, --deadline, or --within is required")
+    if args.batch_size <= 0:
+        parser.error(f"--batch-size must be positive, got {args.batch_size}")
+
+    try:
+        business_duration = load_config(args.config)
+        input_format = args.input_format or _infer_format(args.input)
+        output_format = args.output_format or _infer_format(args.output)
+        rows = enrich_file(
+            business_duration,
+            args.input,
+            args.output,
+            input_format=input_format,
+            output_format=output_format,
+            durations=args.duration or [],
+            deadlines=args.deadline or [],
+            within=args.within or [],
+            batch_size=args.batch_size,
+        )
+    except (ImportError, OSError, TypeError, ValueError) as error:
+        print(f"bizdurr: error: {error}", file=sys.stderr)
+        return 2
+
+    print(f"bizdurr: wrote {rows} rows to {args.output}", file=sys.stderr)
+    return 0
+
+
+def load_config(path: Path) -> BusinessDuration:
+    """Build a BusinessDuration from a JSON or TOML calendar config.
+
+    The config holds the same values BusinessDuration accepts: a
+    business_hours schedule, a business_timezone, and optional holidays and
+    overrides.
+
+    Args:
+        path: A .json or .toml file.
+
+    Returns:
+        The configured BusinessDuration.
+
+    Raises:
+        ValueError: If the file cannot be parsed or has unknown keys.
+        ImportError: For TOML files on Python versions without tomllib.
+
+    Example:
+        >>> load_config(Path("calendar.json"))
+        BusinessDuration(business_hours=BusinessHours(...), ...)
+    """
+    path = Path(path)
+
+    if path.suffix.lower() == ".toml":
+        try:
+            import tomllib
+        except ImportError:
+            raise ImportError("TOML configs require Python 3.11 or newer.") from None
+        with path.open("rb") as config_file:
+            config = tomllib.load(config_file)
+    else:
+        with path.open("r", encoding="utf-8") as config_file:
+            try:
+                config = json.load(config_file)
+            except json.JSONDecodeError as error:
+                raise ValueError(f"Invalid JSON in {path}: {error}")
+
+    if not isinstance(config, dict):
+        raise ValueError(f"{path} must contain an object of calendar settings.")
+
+    unknown = sorted(set(config) - set(CONFIG_KEYS))
+    if unknown:
+        raise ValueError(
+            f"Unknown key(s) in {path}: {', '.join(unknown)}. "
+            f"Valid keys are: {', '.join(CONFIG_KEYS)}."
+        )
+
+    return BusinessDuration(**config)
+
+
+def enrich_file(
+    business_duration: BusinessDuration,
+    input_path: Path,
+    output_path: Path,
+    input_format: str,
+    output_format: str,
+    durations: List[Tuple[str, str, str]] = (),
+    deadlines: List[Tuple[str, str, str]] = (),
+    within: List[Tuple[str, str]] = (),
+    batch_size: int = 65_536,
+) -> int:
+    """Stream a file through the calendar, adding business time columns.
+
+    Timestamp columns are parsed by bizdurr rather than by the reader's type
+    inference: values without a UTC offset are taken to be in the business
+    timezone and values with one are converted, as in calculate().
+
+    Text outputs (CSV and JSON Lines) have no duration type, so business
+    durations are written to them as seconds. Parquet keeps durations.
+
+    Args:
+        business_duration: The calendar to evaluate against.
+        input_path: The file to read.
+        output_path: The file to write.
+        input_format: "csv", "parquet", or "jsonl".
+        output_format: "csv", "parquet", or "jsonl".
+        durations: (output, start_column, end_column) business durations.
+        deadlines: (output, start_column, sla) deadlines, where sla is a
+            column of durations or seconds, or a literal such as "8h".
+        within: (output, column) within-business-hours flags.
+        batch_size: Rows per record batch.
+
+    Returns:
+        The number of rows written.
+
+    Raises:
+        ValueError: If a column is missing or cannot be parsed.
+    """
+    timestamp_columns = {start for _, start, _ in durations}
+    timestamp_columns |= {end for _, _, end in durations}
+    timestamp_columns |= {start for _, start, _ in deadlines}
+    timestamp_columns |= {column for _, column in within}
+
+    rows = 0
+    writer = None
+    try:
+        for batch in _read_batches(
+            input_path, input_format, batch_size, sorted(timestamp_columns)
+        ):
+            batch = _enrich_batch(
+                business_duration, batch, durations, deadlines, within, output_format
+            )
+            if writer is None:
+                writer = _open_writer(output_path, output_format, batch.schema)
+            writer.write_batch(batch)
+            rows += batch.num_rows
+
+        if writer is None:
+            raise ValueError(f"{input_path} contains no rows.")
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return rows
+
+
+# -----------------------------------------------------------------------------
+# Argument Parsing
+# -----------------------------------------------------------------------------
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Create the argument parser for main()."""
+    parser = argparse.ArgumentParser(
+        prog="bizdurr",
+        description=(
+            "Add business duration, deadline, and within-hours columns to a "
+            "CSV, Parquet, or JSON Lines file, streaming it in record batches."
+        ),
+    )
+    parser.add_argument("input", type=Path, help="input file")
+    parser.add_argument("output", type=Path, help="output file")
+    parser.add_argument(
+        "--config",
+        type=Path,
+        required=True,
+        help="JSON or TOML calendar config with business_hours, "
+        "business_timezone, and optional holidays and overrides",
+    )
+    parser.add_argument(
+        "--duration",
+        action="append",
+        type=_column_spec(2),
+        metavar="NAME=START,END",
+        help="add the business duration between two timestamp columns",
+    )
+    parser.add_argument(
+        "--deadline",
+        action="append",
+        type=_column_spec(2),
+        metavar="NAME=START,SLA",
+        help="add the deadline SLA business time after START; SLA is a "
+        "duration or seconds column, or a literal such as 8h, 90m, or 3600s",
+    )
+    parser.add_argument(
+        "--within",
+        action="append",
+        type=_column_spec(1),
+        metavar="NAME=COLUMN",
+        help="flag whether a timestamp column falls within business hours",
+    )
+    parser.add_argument(
+        "--input-format",
+        choices=sorted(set(FORMAT_EXTENSIONS.values())),
+        help="input format (default: from the file extension)",
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=sorted(set(FORMAT_EXTENSIONS.values())),
+        help="output format (default: from the file extension)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=65_536,
+        help="rows per record batch (default: %(default)s)",
+    )
+    return parser
+
+
+def _column_spec(arity: int):
+    """Build an argparse type for NAME=COLUMN[,COLUMN] specifications."""
+
+    def parse(value: str) -> Tuple[str, ...]:
+        name, separator, columns = value.partition("=")
+        parts = tuple(part.strip() for part in columns.split(","))
+        if not separator or not name.strip() or len(parts) != arity or not all(parts):
+            expected = "NAME=" + ",".join(["COLUMN"] * arity)
+            raise argparse.ArgumentTypeError(
+                f"expected {expected}, got {value!r}"
+            )
+        return (name.strip(),) + parts
+
+    return parse
+
+
+def _infer_format(path: Path) -> str:
+    """Infer a file format from its extension."""
+    file_format = FORMAT_EXTENSIONS.get(Path(path).suffix.lower())
+    if file_format is None:
+        raise ValueError(
+            f"Cannot infer the format of {path}; use --input-format or "
+            "--output-format."
+        )
+    return file_format
+
+
+# -----------------------------------------------------------------------------
+# Batch Processing
+# -----------------------------------------------------------------------------
+
+
+def _read_batches(
+    path: Path, file_format: str, batch_size: int, timestamp_columns: List[str]
+):
+    """Yield record batches from a file, reading timestamp columns as text.
+
+    Args:
+        path: The file to read.
+        file_format: "csv", "parquet", or "jsonl".
+        batch_size: Rows per batch (approximate for CSV and JSON Lines,
+            whose readers split on byte blocks).
+        timestamp_columns: Columns to keep as strings for _to_timestamps().
+    """
+    pa = import_optional("pyarrow")
+
+    # Rough bytes per row, used to size the text readers' blocks
+    block_size = max(batch_size * 128, 1 << 20)
+
+    if file_format == "parquet":
+        pq = import_optional("pyarrow.parquet")
+        yield from pq.ParquetFile(path).iter_batches(batch_size=batch_size)
+
+    elif file_format == "csv":
+        csv = import_optional("pyarrow.csv")
+        reader = csv.open_csv(
+            path,
+            read_options=csv.ReadOptions(block_size=block_size),
+            convert_options=csv.ConvertOptions(
+                column_types={column: pa.string() for column in timestamp_columns},
+                strings_can_be_null=True,
+            ),
+        )
+        yield from reader
+
+    elif file_format == "jsonl":
+        json_reader = import_optional("pyarrow.json")
+        schema = pa.schema([(column, pa.string()) for column in timestamp_columns])
+        reader = json_reader.open_json(
+            path,
+            read_options=json_reader.ReadOptions(block_size=block_size),
+            parse_options=json_reader.ParseOptions(explicit_schema=schema),
+        )
+        yield from reader
+
+    else:
+        raise ValueError(f"Unsupported format: {file_format!r}.")
+
+
+def _enrich_batch(
+    business_duration: BusinessDuration,
+    batch,
+    durations: List[Tuple[str, str, str]],
+    deadlines: List[Tuple[str, str, str]],
+    within: List[Tuple[str, str]],
+    output_format: str,
+):
+    """Append the requested business time columns to one record batch."""
+    pa = import_optional("pyarrow")
+    pc = import_optional("pyarrow.compute")
+    from bizdurr import arrow
+
+    columns = dict(zip(batch.schema.names, batch.columns))
+    timestamps: Dict[str, object] = {}
+
+    def timestamp_column(name: str):
+        if name not in timestamps:
+            timestamps[name] = _to_timestamps(_get_column(columns, name), name)
+        return timestamps[name]
+
+    new_columns = {}
+
+    for output, start, end in durations:
+        result = arrow.calculate_arrow(
+            business_duration, timestamp_column(start), timestamp_column(end)
+        )
+        if output_format != "parquet":
+            # Text formats have no duration type; write seconds instead
+            seconds = result.cast(pa.int64()).cast(pa.float64())
+            result = pc.divide(seconds, 1_000_000)
+        new_columns[output] = result
+
+    for output, start, sla in deadlines:
+        new_columns[output] = arrow.add_business_time_arrow(
+            business_duration, timestamp_column(start), _to_durations(columns, sla)
+        )
+
+    for output, column in within:
+        new_columns[output] = arrow.is_within_business_hours_arrow(
+            business_duration, timestamp_column(column)
+        )
+
+    names = list(batch.schema.names)
+    arrays = list(batch.columns)
+    for output, array in new_columns.items():
+        if output in columns:
+            arrays[names.index(output)] = array
+        else:
+            names.append(output)
+            arrays.append(array)
+
+    return pa.RecordBatch.from_arrays(arrays, names=names)
+
+
+def _get_column(columns: Dict[str, object], name: str):
+    """Look up a column of the current batch by name."""
+    try:
+        return columns[name]
+    except KeyError:
+        raise ValueError(
+            f"Column {name!r} not found. Available columns: {', '.join(columns)}."
+        )
+
+
+def _to_timestamps(array, name: str):
+    """Convert a string or timestamp column to a timestamp array.
+
+    Strings without UTC offsets become naive timestamps, and strings that
+    all carry offsets become UTC timestamps.
+
+    Raises:
+        ValueError: If the strings are not ISO 8601 timestamps, or mix values
+            with and without offsets.
+    """
+    pa = import_optional("pyarrow")
+
+    if pa.types.is_timestamp(array.type):
+        return array
+    if pa.types.is_date(array.type):
+        return array.cast(pa.timestamp("us"))
+    if not (pa.types.is_string(array.type) or pa.types.is_large_string(array.type)):
+        raise ValueError(
+            f"Column {name!r} must hold timestamps or ISO 8601 strings, "
+            f"got {array.type}."
+        )
+
+    for target in (pa.timestamp("us"), pa.timestamp("us", tz="UTC")):
+        try:
+            return array.cast(target)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            continue
+
+    raise ValueError(
+        f"Column {name!r} contains values that are not ISO 8601 timestamps, "
+        "or mixes values with and without UTC offsets."
+    )
+
+
+def _to_durations(columns: Dict[str, object], sla: str):
+    """Resolve a --deadline SLA to a duration column or a single timedelta.
+
+    Args:
+        columns: The current batch's columns by name.
+        sla: A column name (durations or numeric seconds) or a literal such
+            as "8h", "90m", or "3600s".
+
+    Raises:
+        ValueError: If sla is neither a known column nor a valid literal.
+    """
+    pa = import_optional("pyarrow")
+
+    if sla not in columns:
+        match = DURATION_PATTERN.match(sla)
+        if match is None:
+            raise ValueError(
+                f"SLA {sla!r} is neither a column nor a duration such as 8h, "
+                "90m, or 3600s."
+            )
+        amount, unit = match.groups()
+        return timedelta(**{DURATION_UNITS[unit]: float(amount)})
+
+    array = columns[sla]
+    if pa.types.is_duration(array.type):
+        return array
+    if pa.types.is_integer(array.type) or pa.types.is_floating(array.type):
+        pc = import_optional("pyarrow.compute")
+        microseconds = pc.round(pc.multiply(array.cast(pa.float64()), 1_000_000))
+        return microseconds.cast(pa.int64()).cast(pa.duration("us"))
+
+    raise ValueError(
+        f"SLA column {sla!r} must hold durations or numeric seconds, got {array.type}."
+    )
+
+
+# -----------------------------------------------------------------------------
+# Writers
+# -----------------------------------------------------------------------------
+
+
+def _open_writer(path: Path, file_format: str, schema):
+    """Open a batch writer for the output format."""
+    if file_format == "parquet":
+        pq = import_optional("pyarrow.parquet")
+        return pq.ParquetWriter(path, schema)
+    if file_format == "csv":
+        csv = import_optional("pyarrow.csv")
+        return csv.CSVWriter(path, schema)
+    if file_format == "jsonl":
+        return _JsonLinesWriter(path)
+    raise ValueError(f"Unsupported format: {file_format!r}.")
+
+
+class _JsonLinesWriter:
+    """Write record batches as JSON Lines (pyarrow has no JSON writer)."""
+
+    def __init__(self, path: Path):
+        self._file = open(path, "w", encoding="utf-8")
+
+    def write_batch(self, batch) -> None:
+        for row in batch.to_pylist():
+            self._file.write(json.dumps(row, default=self._to_json) + "\n")
+
+    def close(self) -> None:
+        self._file.close()
+
+    @staticmethod
+    def _to_json(value):
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        if isinstance(value, timedelta):
+            return value.total_seconds()
+        raise TypeError(f"Cannot write {type(value).__name__} to JSON.")
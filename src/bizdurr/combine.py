@@ -0,0 +1,206 @@
+"""Set operations on business calendars.
+
+This module combines compiled calendars, each in its own timezone, into a
+single CompiledCalendar in a chosen timezone: the union (open when any
+calendar is open), the intersection (open when every calendar is open), and
+the difference (open when the first calendar is open and no other is).
+"""
+
+from collections import Counter
+from datetime import date
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from bizdurr.CompiledCalendar import MICROSECONDS_PER_SECOND, CompiledCalendar
+from bizdurr.ZoneTransitions import ZoneTransitions
+from bizdurr.utils import SECONDS_PER_DAY, merge_intervals
+
+# Default range of dates combined exactly when no range is given
+DEFAULT_FIRST_DATE = date(2000, 1, 1)
+DEFAULT_LAST_DATE = date(2050, 12, 31)
+
+# Whether the combined calendar is open, given which operands are open
+OPERATIONS: Dict[str, Callable[[List[bool]], bool]] = {
+    "union": any,
+    "intersection": all,
+    "difference": lambda open_: open_[0] and not any(open_[1:]),
+}
+
+# Extra days of each operand to convert, since two UTC offsets can differ by
+# more than a day
+OPERAND_MARGIN_DAYS = 2
+
+Operand = Tuple[CompiledCalendar, ZoneTransitions]
+Interval = Tuple[int, int]
+
+
+def combine_calendars(
+    operation: str,
+    operands: Sequence[Operand],
+    zone: ZoneTransitions,
+    first_day: int,
+    last_day: int,
+) -> CompiledCalendar:
+    """Combine calendars in different timezones into one compiled calendar.
+
+    Each operand's business hours from first_day to last_day are converted
+    to UTC, combined instant by instant, and converted to local wall-clock
+    time in zone. The days of that range become the new calendar: the most
+    common segments of each weekday form the weekly schedule, and every day
+    that differs from it becomes an exception. Outside the range the new
+    calendar repeats the weekly schedule.
+
+    Args:
+        operation: "union", "intersection", or "difference".
+        operands: (calendar, zone transitions) pairs, one per calendar. For a
+            difference, the first operand minus all the others.
+        zone: The zone transitions of the timezone of the result.
+        first_day: The first epoch day of the range combined exactly.
+        last_day: The last epoch day of the range, inclusive.
+
+    Returns:
+        The combined CompiledCalendar, in wall-clock time of zone.
+
+    Raises:
+        ValueError: If the operation is unknown or there are no operands.
+
+    Example:
+        >>> combine_calendars(
+        ...     "union",
+        ...     [(new_york.calendar, new_york.zone_transitions),
+        ...      (london.calendar, london.zone_transitions)],
+        ...     new_york.zone_transitions,
+        ...     first_day=20089,
+        ...     last_day=20453,
+        ... )
+    """
+    if operation not in OPERATIONS:
+        raise ValueError(
+            f"operation must be one of {tuple(OPERATIONS)}, got {operation!r}."
+        )
+    if not operands:
+        raise ValueError("At least one calendar is required.")
+
+    utc_intervals = [
+        _utc_intervals(calendar, transitions, first_day, last_day)
+        for calendar, transitions in operands
+    ]
+    combined = _sweep(utc_intervals, OPERATIONS[operation])
+
+    local_intervals = merge_intervals(
+        (_convert(zone.to_local, start), _convert(zone.to_local, end))
+        for start, end in combined
+    )
+    return _compile_days(_split_days(local_intervals), first_day, last_day)
+
+
+# -----------------------------------------------------------------------------
+# Internal Helpers
+# -----------------------------------------------------------------------------
+
+
+def _convert(convert: Callable[[int], int], seconds: int) -> int:
+    """Apply a ZoneTransitions conversion to a time in seconds."""
+    return convert(seconds * MICROSECONDS_PER_SECOND) // MICROSECONDS_PER_SECOND
+
+
+def _utc_intervals(
+    calendar: CompiledCalendar,
+    transitions: ZoneTransitions,
+    first_day: int,
+    last_day: int,
+) -> Tuple[Interval, ...]:
+    """Get a calendar's business hours around a range of days in UTC seconds."""
+    local = []
+    for day in range(first_day - OPERAND_MARGIN_DAYS, last_day + OPERAND_MARGIN_DAYS + 1):
+        midnight = day * SECONDS_PER_DAY
+        local.extend(
+            (midnight + start, midnight + end)
+            for start, end in calendar.segments_for_day(day)
+        )
+
+    # Merged first, so overnight shifts are converted as one interval
+    return merge_intervals(
+        (_convert(transitions.to_utc, start), _convert(transitions.to_utc, end))
+        for start, end in merge_intervals(local)
+    )
+
+
+def _sweep(
+    interval_lists: Sequence[Tuple[Interval, ...]],
+    is_open: Callable[[List[bool]], bool],
+) -> List[Interval]:
+    """Combine disjoint sorted interval lists with a predicate on their states.
+
+    Args:
+        interval_lists: One tuple of disjoint, non-touching intervals per
+            operand, as returned by merge_intervals().
+        is_open: Given whether each operand is open, whether the result is.
+
+    Returns:
+        The disjoint intervals in which is_open holds, in ascending order.
+    """
+    events = sorted(
+        (moment, position, opening)
+        for position, intervals in enumerate(interval_lists)
+        for start, end in intervals
+        for moment, opening in ((start, True), (end, False))
+    )
+
+    state = [False] * len(interval_lists)
+    combined = []
+    opened_at = None
+    for index, (moment, position, opening) in enumerate(events):
+        state[position] = opening
+        # Apply every event at the same moment before checking the state
+        if index + 1 < len(events) and events[index + 1][0] == moment:
+            continue
+
+        if is_open(state):
+            if opened_at is None:
+                opened_at = moment
+        elif opened_at is not None:
+            combined.append((opened_at, moment))
+            opened_at = None
+    return combined
+
+
+def _split_days(intervals: Sequence[Interval]) -> Dict[int, List[Interval]]:
+    """Split local intervals in seconds into segments per epoch day."""
+    day_segments: Dict[int, List[Interval]] = {}
+    for start, end in intervals:
+        while start < end:
+            day, start_of_day = divmod(start, SECONDS_PER_DAY)
+            stop = min(end, (day + 1) * SECONDS_PER_DAY)
+            day_segments.setdefault(day, []).append(
+                (start_of_day, stop - day * SECONDS_PER_DAY)
+            )
+            start = stop
+    return day_segments
+
+
+def _compile_days(
+    day_segments: Dict[int, List[Interval]], first_day: int, last_day: int
+) -> CompiledCalendar:
+    """Compile the segments of a range of days into weekly schedule and exceptions."""
+    days = range(first_day, last_day + 1)
+    segments_of_day = [tuple(day_segments.get(day, ())) for day in days]
+
+    counts = [Counter() for _ in range(7)]
+    for day, segments in zip(days, segments_of_day):
+        counts[CompiledCalendar.weekday_of(day)][segments] += 1
+    weekday_segments = tuple(
+        count.most_common(1)[0][0] if count else () for count in counts
+    )
+
+    exception_days = []
+    exception_segments = []
+    for day, segments in zip(days, segments_of_day):
+        if segments != weekday_segments[CompiledCalendar.weekday_of(day)]:
+            exception_days.append(day)
+            exception_segments.append(segments)
+
+    return CompiledCalendar(
+        weekday_segments=weekday_segments,
+        exception_days=tuple(exception_days),
+        exception_segments=tuple(exception_segments),
+    )
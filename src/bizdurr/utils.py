@@ -1,10 +1,25 @@
 """Shared utility functions for the bizdurr library."""
 
-from datetime import date, time, datetime
-from typing import Union
+import importlib
+from datetime import date, time, datetime, timedelta
+from types import ModuleType
+from typing import Iterable, Tuple, TypeVar, Union
 from zoneinfo import ZoneInfo
 from zoneinfo._common import ZoneInfoNotFoundError
 
+# Ordinal of 1970-01-01, used to convert dates to epoch day numbers
+EPOCH = datetime(1970, 1, 1)
+EPOCH_ORDINAL = EPOCH.toordinal()
+
+# Length of a calendar day in wall-clock seconds
+SECONDS_PER_DAY = 86_400
+
+# Integer value NumPy uses to represent NaT in datetime64/timedelta64 arrays
+NAT_INT64 = -(2**63)
+
+# Any ordered value used as an interval bound (time objects or seconds)
+Bound = TypeVar("Bound")
+
 
 def parse_time_string(time_str: str) -> time:
     """Parse a time string in 'HH:MM' format into a datetime.time object.
@@ -50,6 +65,127 @@ def parse_time_string(time_str: str) -> time:
     return time(hour=hour, minute=minute)
 
 
+def merge_intervals(
+    intervals: Iterable[Tuple[Bound, Bound]],
+) -> Tuple[Tuple[Bound, Bound], ...]:
+    """Sort (start, end) intervals and merge those that overlap or touch.
+
+    Intervals whose end is not after their start cover nothing and are
+    dropped.
+
+    Args:
+        intervals: Intervals with comparable bounds.
+
+    Returns:
+        A tuple of disjoint intervals in ascending order.
+
+    Examples:
+        >>> merge_intervals([(13, 17), (9, 12), (11, 12), (17, 18)])
+        ((9, 12), (13, 18))
+    """
+    merged = []
+    for start, end in sorted(intervals):
+        if end <= start:
+            continue
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return tuple(merged)
+
+
+def normalize_intervals(
+    intervals: Iterable[Tuple[Bound, Bound]],
+) -> Tuple[Tuple[Bound, Bound], ...]:
+    """Sort a day's intervals, merging same-day intervals that overlap.
+
+    Overnight intervals (start after end) are kept as given, since they
+    only overlap the same-day ones once split at midnight.
+
+    Args:
+        intervals: Intervals with comparable bounds and start != end.
+
+    Returns:
+        A sorted tuple of the merged same-day and the overnight intervals.
+
+    Examples:
+        >>> normalize_intervals([(22, 6), (13, 17), (9, 14)])
+        ((9, 17), (22, 6))
+    """
+    intervals = list(intervals)
+    overnight = [(start, end) for start, end in intervals if start > end]
+    return tuple(sorted(merge_intervals(intervals) + tuple(overnight)))
+
+
+def split_overnight(
+    intervals: Iterable[Tuple[int, int]],
+) -> Tuple[Tuple[Tuple[int, int], ...], Tuple[Tuple[int, int], ...]]:
+    """Split a day's intervals in seconds from midnight at the next midnight.
+
+    An overnight interval (start after end) runs from start until midnight
+    and continues on the next day from midnight until end.
+
+    Args:
+        intervals: (start_seconds, end_seconds) intervals of one day.
+
+    Returns:
+        A (same_day, next_day) pair of sorted, merged segment tuples.
+
+    Examples:
+        >>> split_overnight([(32400, 61200), (79200, 21600)])
+        (((32400, 61200), (79200, 86400)), ((0, 21600),))
+    """
+    same_day = []
+    next_day = []
+    for start, end in intervals:
+        if start > end:
+            same_day.append((start, SECONDS_PER_DAY))
+            next_day.append((0, end))
+        else:
+            same_day.append((start, end))
+    return merge_intervals(same_day), merge_intervals(next_day)
+
+
+def wall_clock_microseconds(dt: datetime) -> int:
+    """Get the wall-clock time of a datetime as microseconds since 1970-01-01.
+
+    Any tzinfo is ignored; only the date and time fields are used.
+
+    Args:
+        dt: The datetime.
+
+    Returns:
+        The number of microseconds from 1970-01-01 00:00 to the wall-clock
+        time of dt.
+
+    Examples:
+        >>> wall_clock_microseconds(datetime(1970, 1, 2, 0, 0, 1))
+        86401000000
+    """
+    seconds = (dt.toordinal() - EPOCH_ORDINAL) * 86400 + (
+        dt.hour * 3600 + dt.minute * 60 + dt.second
+    )
+    return seconds * 1_000_000 + dt.microsecond
+
+
+def from_wall_clock_microseconds(microseconds: int) -> datetime:
+    """Build a naive datetime from microseconds since 1970-01-01.
+
+    This is the inverse of wall_clock_microseconds().
+
+    Args:
+        microseconds: Microseconds from 1970-01-01 00:00.
+
+    Returns:
+        A naive datetime.
+
+    Examples:
+        >>> from_wall_clock_microseconds(86401000000)
+        datetime.datetime(1970, 1, 2, 0, 0, 1)
+    """
+    return EPOCH + timedelta(microseconds=microseconds)
+
+
 def parse_date_string(date_input: Union[str, date]) -> date:
     """Parse a date string or date object into a datetime.date object.
 
@@ -124,3 +260,27 @@ def resolve_timezone(timezone_input: Union[str, ZoneInfo]) -> ZoneInfo:
     raise TypeError(
         f"Timezone must be a string or ZoneInfo object, got {type(timezone_input).__name__}."
     )
+
+
+def import_optional(module_name: str) -> ModuleType:
+    """Import an optional dependency, with an install hint if it is missing.
+
+    Args:
+        module_name: The top-level module to import (e.g., 'numpy').
+
+    Returns:
+        The imported module.
+
+    Raises:
+        ImportError: If the module is not installed.
+
+    Examples:
+        >>> np = import_optional("numpy")
+    """
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        raise ImportError(
+            f"This feature requires {module_name!r}, which is not installed. "
+            f"Install it with 'pip install {module_name}'."
+        ) from None
@@ -0,0 +1,42 @@
+from datetime import datetime
+
+import pytest
+
+from bizdurr.BusinessDuration import BusinessDuration
+
+
+@pytest.fixture
+def calendar_settings():
+    """New York weekdays 09:00-17:00, closed on Christmas, noon close on the 24th."""
+    return {
+        "business_timezone": "America/New_York",
+        "business_hours": {"start": "09:00", "end": "17:00"},
+        "holidays": ["2025-12-25"],
+        "overrides": {"2025-12-24": {"start": "09:00", "end": "12:00"}},
+    }
+
+
+@pytest.fixture
+def bd(calendar_settings):
+    return BusinessDuration(**calendar_settings)
+
+
+@pytest.fixture
+def intervals():
+    """Naive (start, end) columns: same day, overnight, across the holiday,
+    reversed, and a missing start."""
+    starts = [
+        datetime(2025, 12, 8, 9, 0),
+        datetime(2025, 12, 8, 16, 0),
+        datetime(2025, 12, 24, 10, 0),
+        datetime(2025, 12, 12, 11, 0),
+        None,
+    ]
+    ends = [
+        datetime(2025, 12, 8, 12, 0),
+        datetime(2025, 12, 9, 10, 0),
+        datetime(2025, 12, 26, 10, 0),
+        datetime(2025, 12, 12, 10, 0),
+        datetime(2025, 12, 12, 10, 0),
+    ]
+    return starts, ends
@@ -0,0 +1,141 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from bizdurr.arrow import (
+    add_business_time_arrow,
+    calculate_arrow,
+    is_within_business_hours_arrow,
+)
+from bizdurr.BusinessDuration import BusinessDuration
+
+# Business time of each row of the shared intervals fixture
+EXPECTED = [
+    timedelta(hours=3),
+    timedelta(hours=2),
+    timedelta(hours=3),  # 2h on the 24th, holiday, 1h on the 26th
+    timedelta(0),
+    None,
+]
+
+
+def test_calculate_arrow_plain_arrays(bd, intervals):
+    starts, ends = intervals
+    start_array = pa.array(starts, type=pa.timestamp("us"))
+    end_array = pa.array(ends, type=pa.timestamp("ns"))
+    result = calculate_arrow(bd, start_array, end_array)
+    assert result.type == pa.duration("us")
+    assert result.to_pylist() == EXPECTED
+
+
+def test_calculate_arrow_misaligned_chunks(bd, intervals):
+    starts, ends = intervals
+    start_array = pa.chunked_array([starts[:2], starts[2:]], type=pa.timestamp("us"))
+    end_array = pa.chunked_array(
+        [ends[:1], ends[1:4], ends[4:]], type=pa.timestamp("us")
+    )
+    result = calculate_arrow(bd, start_array, end_array)
+    assert isinstance(result, pa.ChunkedArray)
+    assert result.to_pylist() == EXPECTED
+
+
+def test_calculate_arrow_converts_aware_timestamps(bd):
+    starts = pa.array([datetime(2025, 12, 8, 15, 0)], type=pa.timestamp("s", tz="UTC"))
+    ends = pa.array([datetime(2025, 12, 8, 20, 0)], type=pa.timestamp("ms", tz="UTC"))
+    # 10 AM to 3 PM Eastern
+    result = calculate_arrow(bd, starts, ends)
+    assert result.to_pylist() == [timedelta(hours=5)]
+
+
+def test_calculate_arrow_matches_calculate(bd):
+    starts = [datetime(2025, 11, 3, 8, 13) + timedelta(hours=7 * i) for i in range(50)]
+    ends = [start + timedelta(hours=5 * i) for i, start in enumerate(starts)]
+    result = calculate_arrow(
+        bd, pa.array(starts, pa.timestamp("us")), pa.array(ends, pa.timestamp("us"))
+    )
+    assert result.to_pylist() == [bd.calculate(s, e) for s, e in zip(starts, ends)]
+
+
+def test_calculate_arrow_rejects_non_timestamps(bd):
+    with pytest.raises(TypeError, match="Expected a timestamp array"):
+        calculate_arrow(bd, pa.array([1]), pa.array([2]))
+
+
+def test_calculate_arrow_rejects_length_mismatch(bd, intervals):
+    starts, ends = intervals
+    start_array = pa.array(starts[:2], type=pa.timestamp("us"))
+    end_array = pa.array(ends[:1], type=pa.timestamp("us"))
+    with pytest.raises(ValueError):
+        calculate_arrow(bd, start_array, end_array)
+
+
+def test_add_business_time_arrow_matches_add_business_time(bd):
+    starts = [datetime(2025, 12, 20, 8, 13) + timedelta(hours=7 * i) for i in range(30)]
+    durations = [timedelta(minutes=45 * i) for i in range(30)]
+    result = add_business_time_arrow(
+        bd,
+        pa.chunked_array([starts[:10], starts[10:]], type=pa.timestamp("us")),
+        pa.array(durations, type=pa.duration("us")),
+    )
+    assert isinstance(result, pa.ChunkedArray)
+    assert result.to_pylist() == [
+        bd.add_business_time(s, d) for s, d in zip(starts, durations)
+    ]
+
+
+def test_add_business_time_arrow_timedelta_and_nulls(bd, intervals):
+    starts = pa.array(intervals[0], type=pa.timestamp("us"))
+    result = add_business_time_arrow(bd, starts, timedelta(hours=8))
+    assert result.type == pa.timestamp("us")
+    assert result.to_pylist() == [
+        datetime(2025, 12, 8, 17, 0),
+        datetime(2025, 12, 9, 16, 0),
+        datetime(2025, 12, 26, 15, 0),
+        datetime(2025, 12, 15, 11, 0),
+        None,
+    ]
+
+
+def test_add_business_time_arrow_keeps_input_time_zone(bd):
+    # 10 AM Eastern plus 8 business hours is 10 AM the next day
+    starts = pa.array([datetime(2025, 12, 8, 15, 0)], type=pa.timestamp("s", tz="UTC"))
+    result = add_business_time_arrow(bd, starts, timedelta(hours=8))
+    assert result.type == pa.timestamp("us", tz="UTC")
+    assert result.to_pylist()[0].replace(tzinfo=None) == datetime(2025, 12, 9, 15, 0)
+
+
+def test_add_business_time_arrow_deadline_in_daylight_saving_gap():
+    bd = BusinessDuration(
+        business_timezone="America/New_York",
+        business_hours={"sunday": {"start": "00:00", "end": "23:59"}},
+    )
+    # 01:00 plus 90 minutes is 02:30, which the spring-forward gap skips
+    start = datetime(2025, 3, 9, 1, 0, tzinfo=bd.business_timezone)
+    starts = pa.array([start], type=pa.timestamp("us", tz="America/New_York"))
+
+    result = add_business_time_arrow(bd, starts, timedelta(minutes=90))
+
+    expected = bd.add_business_time(start, timedelta(minutes=90))
+    deadline = result.cast(pa.timestamp("us", tz="UTC")).to_pylist()[0]
+    assert deadline == expected.astimezone(timezone.utc)
+    assert deadline == datetime(2025, 3, 9, 7, 30, tzinfo=timezone.utc)
+
+
+def test_add_business_time_arrow_rejects_non_durations(bd, intervals):
+    starts = pa.array(intervals[0][:1], type=pa.timestamp("us"))
+    with pytest.raises(TypeError, match="Expected a duration array"):
+        add_business_time_arrow(bd, starts, pa.array([1]))
+
+
+def test_is_within_business_hours_arrow(bd, intervals):
+    timestamps = pa.chunked_array(
+        [
+            intervals[0][3:],
+            [datetime(2025, 12, 25, 10, 0), datetime(2025, 12, 8, 17, 0)],
+        ],
+        type=pa.timestamp("us"),
+    )
+    result = is_within_business_hours_arrow(bd, timestamps)
+    assert result.to_pylist() == [True, None, False, False]
@@ -1,4 +1,6 @@
-from datetime import datetime, timedelta
+import pickle
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
 
 import pytest
 
@@ -404,6 +406,23 @@ def test_is_within_business_hours_at_exact_end():
     assert not bd.is_within_business_hours(datetime(2025, 12, 8, 17, 0))
 
 
+def test_is_within_business_hours_uses_local_date_for_exceptions():
+    """Test that holidays and overrides apply to the business-local date."""
+    from zoneinfo import ZoneInfo
+
+    bd = BusinessDuration(
+        business_timezone="America/New_York",
+        business_hours={"start": "09:00", "end": "21:00"},
+        holidays=["2025-12-09"],
+        overrides={"2025-12-10": {"start": "09:00", "end": "10:00"}},
+    )
+    utc = ZoneInfo("UTC")
+    # Monday 8 PM in New York is already Tuesday (a holiday) in UTC
+    assert bd.is_within_business_hours(datetime(2025, 12, 9, 1, 0, tzinfo=utc))
+    # Tuesday 8 PM in New York falls on the holiday itself
+    assert not bd.is_within_business_hours(datetime(2025, 12, 10, 1, 0, tzinfo=utc))
+
+
 def test_override_extends_hours_on_normally_closed_day():
     """Test that override can add hours to a day not in the regular schedule."""
     bd = BusinessDuration(
@@ -475,3 +494,1003 @@ def test_interval_entirely_after_business_hours():
     start = datetime(2025, 12, 8, 19, 0)
     end = datetime(2025, 12, 8, 22, 0)
     assert bd.calculate(start, end) == timedelta(0)
+
+
+# =============================================================================
+# Long Intervals
+# =============================================================================
+
+
+def test_calculate_full_year_uses_weekly_totals():
+    """A year of Mon-Fri 09:00-17:00 is 52 weeks of 40 hours."""
+    bd = BusinessDuration(
+        business_timezone="UTC",
+        business_hours={"start": "09:00", "end": "17:00"},
+    )
+    start = datetime(2025, 1, 6, 0, 0)  # Monday
+    end = datetime(2026, 1, 5, 0, 0)  # Monday, 52 weeks later
+    assert bd.calculate(start, end) == timedelta(hours=52 * 40)
+
+
+def test_calculate_full_year_with_partial_first_and_last_days():
+    """Partial first and last days are trimmed on long intervals."""
+    bd = BusinessDuration(
+        business_timezone="UTC",
+        business_hours={"start": "09:00", "end": "17:00"},
+    )
+    start = datetime(2025, 1, 6, 13, 0)  # Monday, 4h left
+    end = datetime(2026, 1, 5, 11, 0)  # Monday, 2h elapsed
+    assert bd.calculate(start, end) == timedelta(hours=52 * 40 - 4 + 2)
+
+
+def test_calculate_full_year_adjusts_for_exceptions_in_range():
+    """Holidays and overrides inside a long interval replace regular hours."""
+    bd = BusinessDuration(
+        business_timezone="UTC",
+        business_hours={"start": "09:00", "end": "17:00"},
+        holidays=[
+            "2025-07-04",  # Friday: -8h
+            "2025-07-05",  # Saturday: already closed
+            "2025-12-25",  # Thursday: -8h
+            "2027-01-01",  # Out of range
+        ],
+        overrides={
+            "2025-12-24": {"start": "09:00", "end": "12:00"},  # Wednesday: -5h
+            "2025-12-13": {"start": "10:00", "end": "14:00"},  # Saturday: +4h
+        },
+    )
+    start = datetime(2025, 1, 6, 0, 0)
+    end = datetime(2026, 1, 5, 0, 0)
+    assert bd.calculate(start, end) == timedelta(hours=52 * 40 - 8 - 8 - 5 + 4)
+
+
+def test_calculate_partial_weeks_match_day_by_day_sum():
+    """Ranges that are not whole weeks sum the remaining weekdays."""
+    bd = BusinessDuration(
+        business_timezone="UTC",
+        business_hours={
+            "monday": {"start": "09:00", "end": "17:00"},
+            "wednesday": {"start": "10:00", "end": "12:00"},
+            "saturday": {"start": "08:00", "end": "09:30"},
+        },
+    )
+    # Thursday Dec 4, 2025 to Wednesday Dec 17, 2025 (13 days)
+    start = datetime(2025, 12, 4, 0, 0)
+    end = datetime(2025, 12, 17, 11, 0)
+    # Sat 6: 1.5h, Mon 8: 8h, Wed 10: 2h, Sat 13: 1.5h, Mon 15: 8h, Wed 17: 1h
+    assert bd.calculate(start, end) == timedelta(hours=22)
+
+
+# =============================================================================
+# Batch Calculation
+# =============================================================================
+
+
+def test_calculate_many_datetime64_arrays():
+    np = pytest.importorskip("numpy")
+    bd = BusinessDuration(
+        business_timezone="America/New_York",
+        business_hours={"start": "09:00", "end": "17:00"},
+        holidays=["2025-12-25"],
+    )
+    starts = np.array(
+        ["2025-12-08T09:00", "2025-12-08T16:00", "2025-12-24T10:00", "2025-12-09T10:00"],
+        dtype="datetime64[us]",
+    )
+    ends = np.array(
+        ["2025-12-08T12:00", "2025-12-09T10:00", "2025-12-26T10:00", "2025-12-09T09:00"],
+        dtype="datetime64[us]",
+    )
+    result = bd.calculate_many(starts, ends)
+    assert result.dtype == np.dtype("timedelta64[us]")
+    assert result.tolist() == [
+        timedelta(hours=3),
+        timedelta(hours=2),
+        timedelta(hours=8),  # 7h on the 24th, holiday, 1h on the 26th
+        timedelta(0),  # start after end
+    ]
+
+
+def test_calculate_many_matches_calculate_for_datetime_sequences():
+    pytest.importorskip("numpy")
+    from zoneinfo import ZoneInfo
+
+    bd = BusinessDuration(
+        business_timezone="America/New_York",
+        business_hours={"start": "09:00", "end": "17:00"},
+        overrides={"2025-12-24": {"start": "09:00", "end": "12:00"}},
+    )
+    pacific = ZoneInfo("America/Los_Angeles")
+    starts = [
+        datetime(2025, 12, 8, 7, 0, tzinfo=pacific),
+        datetime(2025, 12, 22, 13, 30, 15, 500),
+    ]
+    ends = [
+        datetime(2025, 12, 8, 12, 0, tzinfo=pacific),
+        datetime(2026, 3, 2, 11, 0),
+    ]
+    expected = [bd.calculate(s, e) for s, e in zip(starts, ends)]
+    assert bd.calculate_many(starts, ends).tolist() == expected
+
+
+def test_calculate_many_broadcasts_scalar_start():
+    np = pytest.importorskip("numpy")
+    bd = BusinessDuration(
+        business_timezone="UTC",
+        business_hours={"start": "09:00", "end": "17:00"},
+    )
+    ends = np.array(["2025-12-08T10:00", "2025-12-09T10:00"], dtype="datetime64[s]")
+    result = bd.calculate_many(datetime(2025, 12, 8, 9, 0), ends)
+    assert result.tolist() == [timedelta(hours=1), timedelta(hours=9)]
+
+
+def test_calculate_many_missing_values_are_nat():
+    np = pytest.importorskip("numpy")
+    bd = BusinessDuration(
+        business_timezone="UTC",
+        business_hours={"start": "09:00", "end": "17:00"},
+    )
+    starts = np.array(["2025-12-08T09:00", "NaT"], dtype="datetime64[us]")
+    ends = [datetime(2025, 12, 8, 10, 0), None]
+    result = bd.calculate_many(starts, ends)
+    assert result[0] == np.timedelta64(1, "h")
+    assert np.isnat(result[1])
+
+
+def test_is_within_business_hours_many_matches_scalar():
+    np = pytest.importorskip("numpy")
+    bd = BusinessDuration(
+        business_timezone="America/New_York",
+        business_hours={"start": "09:00", "end": "17:00"},
+        holidays=["2025-12-25"],
+        overrides={"2025-12-24": {"start": "09:00", "end": "12:00"}},
+    )
+    values = np.array(
+        [
+            "2025-12-22T08:59:59",
+            "2025-12-22T09:00",
+            "2025-12-22T17:00",
+            "2025-12-24T13:00",
+            "2025-12-25T10:00",
+            "2025-12-27T10:00",
+            "NaT",
+        ],
+        dtype="datetime64[us]",
+    )
+    result = bd.is_within_business_hours_many(values)
+    assert result.dtype == np.bool_
+    assert result.tolist() == [False, True, False, False, False, False, False]
+    assert result[:6].tolist() == [
+        bd.is_within_business_hours(value) for value in values[:6].tolist()
+    ]
+
+
+def test_is_within_business_hours_many_converts_aware_datetimes():
+    pytest.importorskip("numpy")
+    bd = BusinessDuration(
+        business_timezone="America/New_York",
+        business_hours={"start": "09:00", "end": "17:00"},
+    )
+    values = [
+        datetime(2025, 12, 22, 14, 30, tzinfo=timezone.utc),  # 09:30 Eastern
+        datetime(2025, 12, 22, 13, 30, tzinfo=timezone.utc),  # 08:30 Eastern
+        None,
+    ]
+    assert bd.is_within_business_hours_many(values).tolist() == [True, False, False]
+    assert bd.is_within_business_hours_many(values[0]).item() is True
+
+
+def test_to_business_timezone_many_round_trips_through_dst():
+    np = pytest.importorskip("numpy")
+    bd = BusinessDuration(
+        business_timezone="America/New_York",
+        business_hours={"start": "09:00", "end": "17:00"},
+    )
+    utc = np.array(
+        ["2025-03-09T06:59", "2025-03-09T07:00", "2025-12-22T15:00", "NaT"],
+        dtype="datetime64[us]",
+    )
+    local = bd.to_business_timezone_many(utc)
+    assert local.astype(str).tolist() == [
+        "2025-03-09T01:59:00.000000",
+        "2025-03-09T03:00:00.000000",
+        "2025-12-22T10:00:00.000000",
+        "NaT",
+    ]
+    assert np.array_equal(bd.to_utc_many(local), utc, equal_nan=True)
+    # A time skipped by the gap is read with the offset from before it
+    assert bd.to_utc_many(np.datetime64("2025-03-09T02:30", "us")) == np.datetime64(
+        "2025-03-09T07:30", "us"
+    )
+
+
+def test_calculate_many_with_aware_datetimes_matches_calculate():
+    pytest.importorskip("numpy")
+    bd = BusinessDuration(
+        business_timezone="America/New_York",
+        business_hours={"start": "09:00", "end": "17:00"},
+    )
+    tokyo = ZoneInfo("Asia/Tokyo")
+    starts = [
+        datetime(2025, 3, 7, 20, 0, tzinfo=timezone.utc),
+        datetime(2025, 11, 3, 0, 30, tzinfo=tokyo),
+        datetime(2025, 11, 3, 9, 0),
+    ]
+    ends = [start + timedelta(days=3, hours=5) for start in starts]
+    assert bd.calculate_many(starts, ends).tolist() == [
+        bd.calculate(start, end) for start, end in zip(starts, ends)
+    ]
+
+
+# =============================================================================
+# Deadlines
+# =============================================================================
+
+
+def test_add_business_time_within_day():
+    bd = BusinessDuration(
+        business_timezone="UTC",
+        business_hours={"start": "09:00", "end": "17:00"},
+    )
+    start = datetime(2025, 12, 8, 10, 0)  # Monday
+    assert bd.add_business_time(start, timedelta(hours=4)) == datetime(
+        2025, 12, 8, 14, 0
+    )
+
+
+def test_add_business_time_rolls_over_nights_weekends_and_holidays():
+    bd = BusinessDuration(
+        business_timezone="UTC",
+        business_hours={"start": "09:00", "end": "17:00"},
+        holidays=["2025-12-15"],  # Monday
+    )
+    start = datetime(2025, 12, 12, 15, 0)  # Friday
+    # Friday 2h, weekend and Monday holiday skipped, Tuesday 2h
+    assert bd.add_business_time(start, timedelta(hours=4)) == datetime(
+        2025, 12, 16, 11, 0
+    )
+
+
+def test_add_business_time_ending_at_close_returns_close():
+    bd = BusinessDuration(
+        business_timezone="UTC",
+        business_hours={"start": "09:00", "end": "17:00"},
+    )
+    start = datetime(2025, 12, 8, 9, 0)
+    assert bd.add_business_time(start, timedelta(hours=8)) == datetime(
+        2025, 12, 8, 17, 0
+    )
+
+
+def test_add_business_time_from_outside_hours():
+    bd = BusinessDuration(
+        business_timezone="UTC",
+        business_hours={"start": "09:00", "end": "17:00"},
+        overrides={"2025-12-13": {"start": "10:00", "end": "12:00"}},  # Saturday
+    )
+    start = datetime(2025, 12, 12, 20, 0)  # Friday evening
+    assert bd.add_business_time(start, timedelta(hours=3)) == datetime(
+        2025, 12, 15, 10, 0
+    )
+
+
+def test_add_business_time_thirty_business_days():
+    bd = BusinessDuration(
+        business_timezone="UTC",
+        business_hours={"start": "09:00", "end": "17:00"},
+    )
+    start = datetime(2025, 12, 8, 9, 0)
+    deadline = bd.add_business_time(start, timedelta(hours=30 * 8))
+    assert deadline == datetime(2026, 1, 16, 17, 0)
+    assert bd.calculate(start, deadline) == timedelta(hours=240)
+
+
+def test_add_business_time_aware_start_keeps_timezone():
+    from zoneinfo import ZoneInfo
+
+    bd = BusinessDuration(
+        business_timezone="America/New_York",
+        business_hours={"start": "09:00", "end": "17:00"},
+    )
+    pacific = ZoneInfo("America/Los_Angeles")
+    start = datetime(2025, 12, 8, 12, 0, tzinfo=pacific)  # 3 PM Eastern
+    deadline = bd.add_business_time(start, timedelta(hours=4))
+    assert deadline.tzinfo is pacific
+    assert deadline == datetime(2025, 12, 9, 8, 0, tzinfo=pacific)  # 11 AM Eastern
+
+
+def test_add_business_time_zero_returns_start():
+    bd = BusinessDuration(
+        business_timezone="UTC",
+        business_hours={"start": "09:00", "end": "17:00"},
+    )
+    start = datetime(2025, 12, 6, 10, 0)  # Saturday
+    assert bd.add_business_time(start, timedelta(0)) == start
+
+
+def test_subtract_business_time():
+    bd = BusinessDuration(
+        business_timezone="UTC",
+        business_hours={"start": "09:00", "end": "17:00"},
+    )
+    end = datetime(2025, 12, 8, 11, 0)  # Monday
+    assert bd.subtract_business_time(end, timedelta(hours=4)) == datetime(
+        2025, 12, 5, 15, 0
+    )
+    # Landing exactly on an opening returns the opening
+    assert bd.subtract_business_time(end, timedelta(hours=2)) == datetime(
+        2025, 12, 8, 9, 0
+    )
+
+
+def test_add_business_time_unreachable_raises():
+    bd = BusinessDuration(business_timezone="UTC", business_hours={})
+    with pytest.raises(ValueError):
+        bd.add_business_time(datetime(2025, 12, 8, 9, 0), timedelta(hours=1))
+
+
+def test_add_business_time_many_matches_add_business_time():
+    np = pytest.importorskip("numpy")
+    bd = BusinessDuration(
+        business_timezone="America/New_York",
+        business_hours={"start": "09:00", "end": "17:00"},
+        holidays=["2025-12-25"],
+        overrides={"2025-12-24": {"start": "09:00", "end": "12:00"}},
+    )
+    starts = np.array(
+        ["2025-12-22T15:00", "2025-12-24T11:00", "2025-12-27T10:00", "2025-12-08T09:00"],
+        dtype="datetime64[us]",
+    )
+    durations = np.array([4, 2, 1, 240], dtype="timedelta64[h]")
+    result = bd.add_business_time_many(starts, durations)
+    assert result.dtype == np.dtype("datetime64[us]")
+    assert result.tolist() == [
+        bd.add_business_time(s, d)
+        for s, d in zip(starts.tolist(), durations.astype("timedelta64[us]").tolist())
+    ]
+
+
+def test_add_business_time_many_broadcasts_and_propagates_missing():
+    np = pytest.importorskip("numpy")
+    bd = BusinessDuration(
+        business_timezone="UTC",
+        business_hours={"start": "09:00", "end": "17:00"},
+    )
+    starts = [datetime(2025, 12, 12, 15, 0), None]
+    result = bd.add_business_time_many(starts, timedelta(hours=4))
+    assert result[0] == np.datetime64("2025-12-15T11:00", "us")
+    assert np.isnat(result[1])
+
+    result = bd.add_business_time_many(
+        datetime(2025, 12, 8, 9, 0), [timedelta(hours=8), None]
+    )
+    assert result[0] == np.datetime64("2025-12-08T17:00", "us")
+    assert np.isnat(result[1])
+
+
+def test_subtract_business_time_many():
+    np = pytest.importorskip("numpy")
+    bd = BusinessDuration(
+        business_timezone="UTC",
+        business_hours={"start": "09:00", "end": "17:00"},
+    )
+    ends = np.array(["2025-12-08T11:00", "2025-12-08T11:00"], dtype="datetime64[us]")
+    durations = np.array([4, 2], dtype="timedelta64[h]")
+    assert bd.subtract_business_time_many(ends, durations).tolist() == [
+        datetime(2025, 12, 5, 15, 0),
+        datetime(2025, 12, 8, 9, 0),
+    ]
+
+
+# =============================================================================
+# Epoch Timestamps
+# =============================================================================
+
+
+def _epoch_ns(dt):
+    elapsed = dt - datetime(1970, 1, 1, tzinfo=timezone.utc)
+    return elapsed // timedelta(microseconds=1) * 1000
+
+
+def test_calculate_epoch_matches_calculate():
+    bd = BusinessDuration(
+        business_timezone="America/New_York",
+        business_hours={"start": "09:00", "end": "17:00"},
+        holidays=["2025-12-25"],
+    )
+    start = datetime(2025, 3, 7, 15, 30, 0, 250, tzinfo=timezone.utc)
+    for hours in (0, 2, 30, 80, 1000):
+        end = start + timedelta(hours=hours, minutes=13)
+        expected = bd.calculate(start, end) // timedelta(microseconds=1) * 1000
+        assert bd.calculate_epoch(_epoch_ns(start), _epoch_ns(end)) == expected
+    assert bd.calculate_epoch(_epoch_ns(start), _epoch_ns(start) - 1) == 0
+
+
+def test_add_business_time_epoch_matches_add_business_time():
+    bd = BusinessDuration(
+        business_timezone="America/New_York",
+        business_hours={"start": "09:00", "end": "17:00"},
+    )
+    start = datetime(2025, 10, 31, 20, 0, tzinfo=timezone.utc)  # Friday 16:00 EDT
+    for hours in (1, 4, 9, -3):
+        expected = bd.add_business_time(start, timedelta(hours=hours))
+        assert bd.add_business_time_epoch(
+            _epoch_ns(start), hours * 3_600 * 10**9
+        ) == _epoch_ns(expected)
+    assert bd.subtract_business_time_epoch(
+        _epoch_ns(start), 3_600 * 10**9
+    ) == _epoch_ns(bd.subtract_business_time(start, timedelta(hours=1)))
+
+
+def test_is_within_business_hours_epoch():
+    bd = BusinessDuration(
+        business_timezone="America/New_York",
+        business_hours={"start": "09:00", "end": "17:00"},
+    )
+    assert bd.is_within_business_hours_epoch(
+        _epoch_ns(datetime(2025, 12, 22, 14, 0, tzinfo=timezone.utc))
+    )
+    assert not bd.is_within_business_hours_epoch(
+        _epoch_ns(datetime(2025, 12, 22, 13, 59, 59, tzinfo=timezone.utc))
+    )
+
+
+# =============================================================================
+# Opening and Closing Times
+# =============================================================================
+
+
+def test_next_business_open():
+    bd = BusinessDuration(
+        business_timezone="UTC",
+        business_hours={"start": "09:00", "end": "17:00"},
+        holidays=["2025-12-25"],
+    )
+    # Within hours returns the same instant
+    assert bd.next_business_open(datetime(2025, 12, 24, 10, 0)) == datetime(
+        2025, 12, 24, 10, 0
+    )
+    # The close itself is outside business hours; the 25th is a holiday
+    assert bd.next_business_open(datetime(2025, 12, 24, 17, 0)) == datetime(
+        2025, 12, 26, 9, 0
+    )
+
+
+def test_next_and_previous_business_close():
+    bd = BusinessDuration(
+        business_timezone="UTC",
+        business_hours={"start": "09:00", "end": "17:00"},
+        overrides={"2025-12-24": {"start": "09:00", "end": "12:00"}},
+    )
+    assert bd.next_business_close(datetime(2025, 12, 24, 10, 0)) == datetime(
+        2025, 12, 24, 12, 0
+    )
+    assert bd.next_business_close(datetime(2025, 12, 20, 10, 0)) == datetime(
+        2025, 12, 22, 17, 0
+    )
+    assert bd.previous_business_close(datetime(2025, 12, 22, 10, 0)) == datetime(
+        2025, 12, 19, 17, 0
+    )
+    assert bd.previous_business_close(datetime(2025, 12, 24, 12, 0)) == datetime(
+        2025, 12, 24, 12, 0
+    )
+
+
+def test_next_business_open_aware_keeps_timezone():
+    from zoneinfo import ZoneInfo
+
+    bd = BusinessDuration(
+        business_timezone="America/New_York",
+        business_hours={"start": "09:00", "end": "17:00"},
+    )
+    utc = ZoneInfo("UTC")
+    result = bd.next_business_open(datetime(2025, 12, 8, 23, 0, tzinfo=utc))
+    assert result == datetime(2025, 12, 9, 14, 0, tzinfo=utc)
+    assert result.tzinfo is utc
+
+
+def test_open_close_many_match_scalar():
+    np = pytest.importorskip("numpy")
+    bd = BusinessDuration(
+        business_timezone="UTC",
+        business_hours={"start": "09:00", "end": "17:00"},
+        holidays=["2025-12-25"],
+    )
+    values = [
+        datetime(2025, 12, 24, 10, 0),
+        datetime(2025, 12, 24, 17, 0),
+        datetime(2025, 12, 27, 12, 0),
+        None,
+    ]
+    for scalar, many in (
+        (bd.next_business_open, bd.next_business_open_many),
+        (bd.next_business_close, bd.next_business_close_many),
+        (bd.previous_business_close, bd.previous_business_close_many),
+    ):
+        result = many(values)
+        assert result[:3].tolist() == [scalar(value) for value in values[:3]]
+        assert np.isnat(result[3])
+
+
+# =============================================================================
+# UTC Interval Cache
+# =============================================================================
+
+
+def test_get_business_intervals_utc_is_dst_correct():
+    from datetime import date, timezone
+
+    bd = BusinessDuration(
+        business_timezone="America/New_York",
+        business_hours={"start": "09:00", "end": "17:00"},
+        holidays=["2025-12-25"],
+    )
+    # Before and after the March 9 daylight saving change
+    assert bd.get_business_intervals_utc("2025-03-07") == (
+        (
+            datetime(2025, 3, 7, 14, 0, tzinfo=timezone.utc),
+            datetime(2025, 3, 7, 22, 0, tzinfo=timezone.utc),
+        ),
+    )
+    assert bd.get_business_intervals_utc(date(2025, 3, 10)) == (
+        (
+            datetime(2025, 3, 10, 13, 0, tzinfo=timezone.utc),
+            datetime(2025, 3, 10, 21, 0, tzinfo=timezone.utc),
+        ),
+    )
+    assert bd.get_business_intervals_utc("2025-12-25") == ()
+
+
+def test_interval_cache_statistics_and_eviction():
+    bd = BusinessDuration(
+        business_timezone="UTC",
+        business_hours={"start": "09:00", "end": "17:00"},
+        interval_cache_size=2,
+    )
+    for day in ("2025-12-08", "2025-12-08", "2025-12-09", "2025-12-10"):
+        bd.get_business_intervals_utc(day)
+
+    info = bd.interval_cache_info()
+    assert (info.hits, info.misses, info.evictions, info.size) == (1, 3, 1, 2)
+
+    bd.clear_interval_cache()
+    assert bd.interval_cache_info().size == 0
+
+
+# =============================================================================
+# Result Memoization
+# =============================================================================
+
+
+def test_memo_is_disabled_by_default():
+    bd = BusinessDuration(
+        business_timezone="UTC",
+        business_hours={"start": "09:00", "end": "17:00"},
+    )
+    bd.calculate(datetime(2025, 12, 8, 9, 0), datetime(2025, 12, 8, 12, 0))
+    assert bd.memo_info().misses == 0
+    assert bd.memo_info().size == 0
+
+
+def test_memo_keys_on_normalized_instants():
+    from zoneinfo import ZoneInfo
+
+    bd = BusinessDuration(
+        business_timezone="America/New_York",
+        business_hours={"start": "09:00", "end": "17:00"},
+        memo_size=16,
+    )
+    utc = ZoneInfo("UTC")
+    naive = bd.calculate(datetime(2025, 12, 8, 9, 0), datetime(2025, 12, 8, 12, 0))
+    aware = bd.calculate(
+        datetime(2025, 12, 8, 14, 0, tzinfo=utc), datetime(2025, 12, 8, 17, 0, tzinfo=utc)
+    )
+    assert naive == aware == timedelta(hours=3)
+    assert bd.is_within_business_hours(datetime(2025, 12, 8, 10, 0))
+    assert bd.is_within_business_hours(datetime(2025, 12, 8, 15, 0, tzinfo=utc))
+
+    info = bd.memo_info()
+    assert (info.hits, info.misses, info.size) == (2, 2, 2)
+
+
+def test_memo_size_and_age_are_configurable():
+    bd = BusinessDuration(
+        business_timezone="UTC",
+        business_hours={"start": "09:00", "end": "17:00"},
+        memo_size=1,
+        memo_max_age=60,
+    )
+    bd.calculate(datetime(2025, 12, 8, 9, 0), datetime(2025, 12, 8, 12, 0))
+    bd.calculate(datetime(2025, 12, 8, 9, 0), datetime(2025, 12, 8, 13, 0))
+
+    info = bd.memo_info()
+    assert (info.maxsize, info.size, info.evictions) == (1, 1, 1)
+    assert bd._memo.max_age == 60
+
+
+def test_reassigning_holidays_recompiles_and_clears_memo():
+    bd = BusinessDuration(
+        business_timezone="UTC",
+        business_hours={"start": "09:00", "end": "17:00"},
+        memo_size=16,
+    )
+    bd.build_index("2025-12-01", "2025-12-31")
+    start, end = datetime(2025, 12, 24, 9, 0), datetime(2025, 12, 26, 9, 0)
+    assert bd.calculate(start, end) == timedelta(hours=16)
+
+    bd.holidays = ["2025-12-25"]
+    assert bd.memo_info().size == 0
+    assert bd.calculate(start, end) == timedelta(hours=8)
+    assert not bd.is_within_business_hours(datetime(2025, 12, 25, 10, 0))
+
+    bd.overrides = {"2025-12-24": {"start": "09:00", "end": "12:00"}}
+    assert isinstance(bd.overrides, BusinessHoursOverrides)
+    assert bd.calculate(start, end) == timedelta(hours=3)
+
+
+def _make_shipped_duration():
+    return BusinessDuration(
+        business_timezone="America/New_York",
+        business_hours={"start": "09:00", "end": "17:30"},
+        holidays=["2025-12-25"],
+        overrides={"2025-12-24": {"start": "09:00", "end": "12:15"}},
+        memo_size=8,
+    )
+
+
+def test_to_bytes_round_trip():
+    bd = _make_shipped_duration()
+    restored = BusinessDuration.from_bytes(bd.to_bytes())
+
+    assert restored.calendar == bd.calendar
+    assert restored.business_timezone == bd.business_timezone
+    assert restored.memo_size == 8
+    assert restored.holidays == [date(2025, 12, 25)]
+    assert restored.overrides == {date(2025, 12, 24): {"start": "09:00", "end": "12:15"}}
+    assert restored.business_hours["friday"] == {"start": "09:00", "end": "17:30"}
+
+    start, end = datetime(2025, 12, 22, 10, 0), datetime(2025, 12, 29, 10, 0)
+    assert restored.calculate(start, end) == bd.calculate(start, end)
+    assert restored.get_business_intervals_utc("2025-12-24") == (
+        bd.get_business_intervals_utc("2025-12-24")
+    )
+
+    # The rebuilt inputs compile to the same calendar
+    restored.holidays = list(restored.holidays)
+    assert restored.calendar == bd.calendar
+
+
+def test_pickle_ships_compiled_state():
+    bd = _make_shipped_duration()
+    bd.calculate(datetime(2025, 12, 22, 10, 0), datetime(2025, 12, 23, 10, 0))
+
+    payload = pickle.dumps(bd)
+    assert bd.to_bytes() in payload
+
+    restored = pickle.loads(payload)
+    assert restored.calendar == bd.calendar
+    assert restored.memo_info().size == 0
+
+
+def test_from_bytes_rejects_invalid_data():
+    with pytest.raises(ValueError, match="too short"):
+        BusinessDuration.from_bytes(b"BZ")
+    with pytest.raises(ValueError, match="does not hold"):
+        BusinessDuration.from_bytes(b"XXXX" + _make_shipped_duration().to_bytes()[4:])
+
+
+def test_holidays_and_business_days_between():
+    bd = BusinessDuration(
+        business_timezone="UTC",
+        business_hours={"start": "09:00", "end": "17:00"},
+        holidays=["2025-12-25", "2025-12-27", "2026-01-01"],
+        overrides={"2025-12-28": {"start": "10:00", "end": "12:00"}},
+    )
+
+    assert bd.holidays_between("2025-12-01", "2025-12-31") == [
+        date(2025, 12, 25),
+        date(2025, 12, 27),
+    ]
+    assert bd.holidays_between(date(2026, 1, 1), date(2026, 1, 1)) == [
+        date(2026, 1, 1)
+    ]
+    # Mon-Fri less Christmas, plus the Sunday override
+    assert bd.business_days_between("2025-12-22", "2025-12-28") == 5
+    # Ten years of weekdays, less two weekday holidays, plus the override
+    assert bd.business_days_between("2020-01-01", "2029-12-31") == 2609 - 2 + 1
+
+    with pytest.raises(ValueError, match="must not be before"):
+        bd.business_days_between("2025-12-31", "2025-12-01")
+
+
+# =============================================================================
+# Split Shifts
+# =============================================================================
+
+
+def _make_split_shift_duration():
+    lunch_break = [
+        {"start": "09:00", "end": "12:00"},
+        {"start": "13:00", "end": "17:00"},
+    ]
+    return BusinessDuration(
+        business_timezone="UTC",
+        business_hours={day: lunch_break for day in ("monday", "tuesday")},
+        overrides={
+            "2025-12-23": [
+                {"start": "08:00", "end": "10:00"},
+                {"start": "15:00", "end": "16:00"},
+            ]
+        },
+    )
+
+
+def test_split_shift_calculations():
+    bd = _make_split_shift_duration()
+
+    # Monday 11:00-14:00 skips the lunch break
+    start, end = datetime(2025, 12, 22, 11, 0), datetime(2025, 12, 22, 14, 0)
+    assert bd.calculate(start, end) == timedelta(hours=2)
+    # Monday from 11:00 (5h left) through the Tuesday override (3h)
+    assert bd.calculate(start, datetime(2025, 12, 24, 0, 0)) == timedelta(hours=8)
+
+    assert not bd.is_within_business_hours(datetime(2025, 12, 22, 12, 30))
+    assert bd.is_within_business_hours(datetime(2025, 12, 23, 15, 30))
+    assert bd.next_business_open(datetime(2025, 12, 22, 12, 30)) == datetime(
+        2025, 12, 22, 13, 0
+    )
+    assert bd.next_business_close(datetime(2025, 12, 23, 11, 0)) == datetime(
+        2025, 12, 23, 16, 0
+    )
+    assert bd.add_business_time(start, timedelta(hours=2)) == datetime(
+        2025, 12, 22, 14, 0
+    )
+
+    reference = _make_split_shift_duration()
+    bd.build_index("2025-12-01", "2025-12-31")
+    for hours in (1, 2, 5, 30, 200):
+        end = start + timedelta(hours=hours, minutes=10)
+        assert bd.calculate(start, end) == reference.calculate(start, end)
+
+
+def test_split_shift_round_trip():
+    bd = _make_split_shift_duration()
+    restored = BusinessDuration.from_bytes(bd.to_bytes())
+
+    assert restored.business_hours["monday"] == [
+        {"start": "09:00", "end": "12:00"},
+        {"start": "13:00", "end": "17:00"},
+    ]
+    restored.holidays = []
+    assert restored.calendar == bd.calendar
+
+
+# =============================================================================
+# Overnight Shifts
+# =============================================================================
+
+
+def _make_night_shift_duration(**kwargs):
+    night = {"start": "22:00", "end": "06:00"}
+    return BusinessDuration(
+        business_timezone="America/New_York",
+        business_hours={day: night for day in ("monday", "tuesday", "wednesday")},
+        **kwargs,
+    )
+
+
+def test_overnight_shift_calculations():
+    bd = _make_night_shift_duration()
+    monday_night = datetime(2025, 12, 8, 21, 0)
+
+    assert bd.calculate(monday_night, datetime(2025, 12, 9, 7, 0)) == timedelta(
+        hours=8
+    )
+    # Three shifts from Monday evening to Thursday noon
+    assert bd.calculate(monday_night, datetime(2025, 12, 11, 12, 0)) == timedelta(
+        hours=24
+    )
+    assert bd.is_within_business_hours(datetime(2025, 12, 9, 3, 0))
+    assert not bd.is_within_business_hours(datetime(2025, 12, 8, 3, 0))
+
+    # The shift closes at 06:00, not at midnight
+    assert bd.next_business_close(datetime(2025, 12, 8, 23, 0)) == datetime(
+        2025, 12, 9, 6, 0
+    )
+    assert bd.previous_business_close(datetime(2025, 12, 10, 3, 0)) == datetime(
+        2025, 12, 9, 6, 0
+    )
+    assert bd.add_business_time(monday_night, timedelta(hours=9)) == datetime(
+        2025, 12, 9, 23, 0
+    )
+
+
+def test_overnight_shift_with_holidays_and_overrides():
+    bd = _make_night_shift_duration(
+        holidays=["2025-12-09"],
+        overrides={"2025-12-12": {"start": "20:00", "end": "02:00"}},
+    )
+    # The holiday closes Tuesday, cutting Monday's shift at midnight and
+    # cancelling Tuesday's shift into Wednesday
+    start, end = datetime(2025, 12, 8, 0, 0), datetime(2025, 12, 11, 0, 0)
+    assert bd.calculate(start, end) == timedelta(hours=4)
+    # The Friday override runs into Saturday
+    start, end = datetime(2025, 12, 12, 0, 0), datetime(2025, 12, 14, 0, 0)
+    assert bd.calculate(start, end) == timedelta(hours=6)
+
+    reference = _make_night_shift_duration(
+        holidays=["2025-12-09"],
+        overrides={"2025-12-12": {"start": "20:00", "end": "02:00"}},
+    )
+    bd.build_index("2025-12-01", "2025-12-31")
+    start = datetime(2025, 12, 5, 13, 0)
+    for hours in (10, 50, 100, 300):
+        end = start + timedelta(hours=hours, minutes=20)
+        assert bd.calculate(start, end) == reference.calculate(start, end)
+
+
+def test_overnight_shift_across_dst_transition():
+    bd = BusinessDuration(
+        business_timezone="America/New_York",
+        business_hours={"saturday": {"start": "22:00", "end": "06:00"}},
+    )
+    # Clocks go forward at 02:00 on Sunday 2025-03-09
+    assert bd.get_business_intervals_utc("2025-03-08") == (
+        (
+            datetime(2025, 3, 9, 3, 0, tzinfo=timezone.utc),
+            datetime(2025, 3, 9, 5, 0, tzinfo=timezone.utc),
+        ),
+    )
+    assert bd.get_business_intervals_utc("2025-03-09") == (
+        (
+            datetime(2025, 3, 9, 5, 0, tzinfo=timezone.utc),
+            datetime(2025, 3, 9, 10, 0, tzinfo=timezone.utc),
+        ),
+    )
+    assert bd.next_business_close(datetime(2025, 3, 8, 23, 0)) == datetime(
+        2025, 3, 9, 6, 0
+    )
+
+
+def test_overnight_shift_round_trip():
+    bd = _make_night_shift_duration(
+        holidays=["2025-12-09"],
+        overrides={
+            "2025-12-13": [
+                {"start": "00:00", "end": "12:00"},
+                {"start": "12:00", "end": "00:00"},
+            ]
+        },
+    )
+    restored = BusinessDuration.from_bytes(bd.to_bytes())
+    assert restored.business_hours["monday"] == {"start": "22:00", "end": "00:00"}
+
+    restored.holidays = list(restored.holidays)
+    assert restored.calendar == bd.calendar
+
+
+# =============================================================================
+# Calendar Algebra
+# =============================================================================
+
+NINE_TO_FIVE = {"start": "09:00", "end": "17:00"}
+
+
+def _make_desks():
+    new_york = BusinessDuration(
+        NINE_TO_FIVE, "America/New_York", holidays=["2025-12-25"]
+    )
+    london = BusinessDuration(NINE_TO_FIVE, "Europe/London", holidays=["2025-12-26"])
+    return new_york, london
+
+
+def _probe(durations, is_open, start, end, tz):
+    """Add up quarter hours in which is_open holds, by probing each calendar."""
+    total = timedelta(0)
+    moment = start
+    while moment < end:
+        aware = moment.replace(tzinfo=tz)
+        if is_open([duration.is_within_business_hours(aware) for duration in durations]):
+            total += timedelta(minutes=15)
+        moment += timedelta(minutes=15)
+    return total
+
+
+@pytest.mark.parametrize(
+    "week",
+    [
+        datetime(2025, 3, 10),  # New York on daylight time, London not yet
+        datetime(2025, 6, 16),
+        datetime(2025, 10, 27),  # London back on standard time, New York not
+        datetime(2025, 12, 22),  # Holidays in both
+    ],
+)
+def test_combined_calendars_match_probing(week):
+    new_york, london = _make_desks()
+    singapore = BusinessDuration(NINE_TO_FIVE, "Asia/Singapore")
+    tz = ZoneInfo("America/New_York")
+    end = week + timedelta(days=7)
+
+    union = new_york.union(london, singapore, start="2025-01-01", end="2025-12-31")
+    assert union.calculate(week, end) == _probe(
+        [new_york, london, singapore], any, week, end, tz
+    )
+    assert (new_york & london).calculate(week, end) == _probe(
+        [new_york, london], all, week, end, tz
+    )
+    assert (new_york - london).calculate(week, end) == _probe(
+        [new_york, london], lambda open_: open_[0] and not open_[1], week, end, tz
+    )
+
+
+def test_union_covers_both_desks():
+    new_york, london = _make_desks()
+    coverage = new_york | london
+
+    # 09:00-17:00 London is 04:00-12:00 in New York in December
+    monday = datetime(2025, 12, 15)
+    assert coverage.calculate(monday, monday + timedelta(days=1)) == timedelta(
+        hours=13
+    )
+    assert coverage.next_business_open(datetime(2025, 12, 15, 18, 0)) == datetime(
+        2025, 12, 16, 4, 0
+    )
+    assert coverage.is_within_business_hours(datetime(2025, 12, 25, 5, 0))
+    assert coverage.holidays_between("2025-12-20", "2025-12-31") == []
+
+
+def test_intersection_and_difference():
+    new_york, london = _make_desks()
+    joint = new_york & london
+    monday = datetime(2025, 12, 15)
+
+    assert joint.calculate(monday, monday + timedelta(days=1)) == timedelta(hours=3)
+    assert joint.add_business_time(monday, timedelta(hours=4)) == datetime(
+        2025, 12, 16, 10, 0
+    )
+    assert joint.business_days_between("2025-12-22", "2025-12-28") == 3
+    assert joint.holidays_between("2025-12-20", "2025-12-31") == [
+        date(2025, 12, 25),
+        date(2025, 12, 26),
+    ]
+    assert (new_york - london).calculate(
+        monday, monday + timedelta(days=1)
+    ) == timedelta(hours=5)
+
+
+def test_combined_timezone_and_settings():
+    new_york, london = _make_desks()
+    new_york.memo_size = 16
+    coverage = new_york.union(london, business_timezone="UTC")
+
+    assert coverage.business_timezone == ZoneInfo("UTC")
+    assert coverage.memo_size == 16
+    # Most weeks of the year are on daylight saving time in both cities
+    assert coverage.calendar.weekday_segments[0] == ((8 * 3600, 21 * 3600),)
+    assert BusinessDuration.from_bytes(coverage.to_bytes()).calendar == coverage.calendar
+
+
+def test_combined_same_timezone_has_only_real_exceptions():
+    new_york, _ = _make_desks()
+    evening = BusinessDuration(
+        {"start": "16:00", "end": "20:00"},
+        "America/New_York",
+        overrides={"2025-12-24": {"start": "12:00", "end": "14:00"}},
+    )
+    combined = new_york | evening
+
+    assert combined.calendar.weekday_segments[0] == ((9 * 3600, 20 * 3600),)
+    assert combined.calendar.exception_days == (
+        date(2025, 12, 24).toordinal() - date(1970, 1, 1).toordinal(),
+        date(2025, 12, 25).toordinal() - date(1970, 1, 1).toordinal(),
+    )
+
+
+def test_combine_rejects_invalid_arguments():
+    new_york, _ = _make_desks()
+    with pytest.raises(TypeError, match="BusinessDuration"):
+        new_york.union("Europe/London")
+    with pytest.raises(ValueError, match="must not be before"):
+        new_york.union(new_york, start="2025-12-31", end="2025-01-01")
+    with pytest.raises(TypeError):
+        new_york | 1
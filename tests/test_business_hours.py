@@ -77,11 +77,20 @@ def test_missing_weekday_returns_false():
     assert not bh.is_within_business_hours(datetime(2025, 9, 28, 10, 0))
 
 
-def test_overnight_interval_raises():
-    # If start > end (overnight), current implementation raises ValueError
-    sched = {"monday": {"start": "22:00", "end": "06:00"}}
-    with pytest.raises(ValueError):
-        BusinessHours(schedule=sched, timezone="UTC")
+def test_overnight_interval_splits_at_midnight():
+    # If start > end, the interval runs past midnight into the next day
+    sched = {
+        "monday": {"start": "22:00", "end": "06:00"},
+        "sunday": {"start": "23:00", "end": "01:00"},
+    }
+    bh = BusinessHours(schedule=sched, timezone="UTC")
+    segments = bh.get_weekday_segments()
+    assert segments[0] == ((0, 3600), (79200, 86400))
+    assert segments[1] == ((0, 21600),)
+    assert segments[6] == ((82800, 86400),)
+
+    assert bh.is_within_business_hours(datetime(2025, 12, 9, 5, 59))  # Tuesday
+    assert not bh.is_within_business_hours(datetime(2025, 12, 9, 6, 0))
 
 
 def test_shorthand_schedule_expands_to_monday_friday():
@@ -125,10 +134,6 @@ def test_shorthand_schedule_validation():
     with pytest.raises(ValueError):
         BusinessHours(schedule={"start": "09:00", "end": "09:00"}, timezone="UTC")
 
-    # Start after end
-    with pytest.raises(ValueError):
-        BusinessHours(schedule={"start": "17:00", "end": "09:00"}, timezone="UTC")
-
 
 def test_full_schedule_not_affected_by_shorthand_expansion():
     """Test that providing a full schedule still works normally."""
@@ -221,3 +226,81 @@ def test_schedule_with_only_one_minute_duration():
     assert bh.is_within_business_hours(datetime(2025, 12, 8, 9, 0))
     # At end (exclusive)
     assert not bh.is_within_business_hours(datetime(2025, 12, 8, 9, 1))
+
+
+def test_weekday_segments_in_seconds():
+    """Test that the compiled weekday table holds seconds from midnight."""
+    bh = BusinessHours(
+        schedule={
+            "monday": {"start": "09:00", "end": "17:00"},
+            "wednesday": {"start": "10:00", "end": "12:30"},
+        },
+        timezone="UTC",
+    )
+    segments = bh.get_weekday_segments()
+    assert segments[0] == ((32400, 61200),)
+    assert segments[1] == ()
+    assert segments[2] == ((36000, 45000),)
+
+
+def test_is_within_business_hours_last_microsecond():
+    """Test that the end boundary is exclusive at sub-second precision."""
+    bh = BusinessHours(
+        schedule={"monday": {"start": "09:00", "end": "17:00"}}, timezone="UTC"
+    )
+    assert bh.is_within_business_hours(datetime(2025, 12, 8, 16, 59, 59, 999999))
+    assert not bh.is_within_business_hours(datetime(2025, 12, 8, 17, 0))
+
+
+def test_day_with_several_intervals():
+    """Test that a list of intervals is sorted and merged."""
+    bh = BusinessHours(
+        schedule={
+            "monday": [
+                {"start": "13:00", "end": "17:00"},
+                {"start": "09:00", "end": "12:00"},
+            ],
+            "tuesday": [
+                {"start": "09:00", "end": "12:00"},
+                {"start": "11:00", "end": "13:00"},
+                {"start": "13:00", "end": "14:00"},
+            ],
+        },
+        timezone="UTC",
+    )
+    utc = ZoneInfo("UTC")
+    assert bh.get_day_intervals("monday") == (
+        (time(9, 0, tzinfo=utc), time(12, 0, tzinfo=utc)),
+        (time(13, 0, tzinfo=utc), time(17, 0, tzinfo=utc)),
+    )
+    assert bh.get_day_hours("tuesday") == (
+        time(9, 0, tzinfo=utc),
+        time(14, 0, tzinfo=utc),
+    )
+    assert bh.get_day_intervals("sunday") == ()
+    assert bh.get_weekday_segments()[0] == ((32400, 43200), (46800, 61200))
+
+    assert bh.is_within_business_hours(datetime(2025, 12, 8, 11, 59))
+    assert not bh.is_within_business_hours(datetime(2025, 12, 8, 12, 30))
+    assert bh.is_within_business_hours(datetime(2025, 12, 8, 13, 0))
+
+    with pytest.raises(ValueError, match="get_day_intervals"):
+        bh.get_day_hours("monday")
+
+
+def test_day_interval_list_validation():
+    """Test that every interval in a list is validated."""
+    with pytest.raises(ValueError, match="at least one interval"):
+        BusinessHours(schedule={"monday": []}, timezone="UTC")
+    with pytest.raises(ValueError, match="identical start and end"):
+        BusinessHours(
+            schedule={
+                "monday": [
+                    {"start": "09:00", "end": "12:00"},
+                    {"start": "13:00", "end": "13:00"},
+                ]
+            },
+            timezone="UTC",
+        )
+    with pytest.raises(TypeError, match="must be a dict"):
+        BusinessHours(schedule={"monday": ["09:00-12:00"]}, timezone="UTC")
@@ -127,3 +127,42 @@ def test_get_override_returns_none_for_undefined_date():
     assert bho.get_override_for_date("2025-12-25") is None
     assert bho.get_override_for_date(date(2025, 12, 25)) is None
     assert bho.get_override_for_date(datetime(2025, 12, 25, 10, 0)) is None
+
+
+def test_get_override_dates_sorted():
+    """Test that override dates are returned in ascending order."""
+    bho = BusinessHoursOverrides(
+        overrides={
+            "2025-12-31": {"start": "09:00", "end": "15:00"},
+            date(2025, 12, 24): {"start": "09:00", "end": "12:00"},
+        },
+        timezone="UTC",
+    )
+    assert bho.get_override_dates() == [date(2025, 12, 24), date(2025, 12, 31)]
+
+
+def test_override_with_several_intervals():
+    """Test that an override can hold a sorted, merged list of intervals."""
+    bho = BusinessHoursOverrides(
+        overrides={
+            "2025-12-24": [
+                {"start": "14:00", "end": "16:00"},
+                {"start": "09:00", "end": "11:00"},
+                {"start": "10:00", "end": "12:00"},
+            ]
+        },
+        timezone="UTC",
+    )
+    intervals = bho.get_override_intervals("2025-12-24")
+    assert [(start.hour, end.hour) for start, end in intervals] == [(9, 12), (14, 16)]
+    assert bho.is_override_for_date("2025-12-24")
+    assert bho.get_override_intervals("2025-12-25") is None
+
+    with pytest.raises(ValueError, match="get_override_intervals"):
+        bho.get_override_for_date("2025-12-24")
+
+
+def test_override_empty_interval_list_raises():
+    """Test that an empty list of override intervals raises ValueError."""
+    with pytest.raises(ValueError, match="at least one interval"):
+        BusinessHoursOverrides(overrides={"2025-12-24": []}, timezone="UTC")
@@ -0,0 +1,122 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from bizdurr.BusinessDuration import BusinessDuration
+from bizdurr.BusinessTimeIndex import BusinessTimeIndex
+from bizdurr.CompiledCalendar import CompiledCalendar
+from bizdurr.utils import wall_clock_microseconds
+
+
+def _us(*args):
+    return wall_clock_microseconds(datetime(*args))
+
+
+def _make_calendar():
+    # Weekdays 09:00-17:00, with 2025-12-24 cut to 09:00-12:00 and
+    # 2025-12-25 closed
+    return CompiledCalendar(
+        weekday_segments=(((32400, 61200),),) * 5 + ((), ()),
+        exception_days=(20446, 20447),
+        exception_segments=(((32400, 43200),), ()),
+    )
+
+
+def test_index_matches_calendar():
+    calendar = _make_calendar()
+    index = BusinessTimeIndex(calendar, date(2025, 12, 1), date(2025, 12, 31))
+
+    first = _us(2025, 12, 22, 0, 0)
+    moments = [first + minutes * 60_000_000 for minutes in range(0, 14_400, 37)]
+    assert [index.elapsed(moment) for moment in moments] == [
+        calendar.elapsed(moment) for moment in moments
+    ]
+    start, end = _us(2025, 12, 22, 10, 0), _us(2025, 12, 26, 11, 0)
+    assert index.duration(start, end) == calendar.duration(start, end)
+    assert index.duration(end, start) == 0
+
+
+def test_index_partial_day_keeps_microseconds():
+    calendar = _make_calendar()
+    index = BusinessTimeIndex(calendar, date(2025, 12, 8), date(2025, 12, 8))
+    start = _us(2025, 12, 8, 9, 0)
+    assert index.duration(start, start + 250) == 250
+
+
+def test_index_covers_range_bounds():
+    index = BusinessTimeIndex(_make_calendar(), date(2025, 12, 8), date(2025, 12, 9))
+    assert index.covers(_us(2025, 12, 8, 0, 0))
+    assert index.covers(_us(2025, 12, 9, 23, 59))
+    assert not index.covers(_us(2025, 12, 7, 23, 59))
+    assert not index.covers(_us(2025, 12, 10, 0, 0))
+
+
+def test_index_elapsed_outside_range_raises():
+    index = BusinessTimeIndex(_make_calendar(), date(2025, 12, 8), date(2025, 12, 8))
+    with pytest.raises(ValueError, match="outside the indexed range"):
+        index.elapsed(_us(2025, 12, 9, 10, 0))
+
+
+def test_index_rejects_reversed_range():
+    with pytest.raises(ValueError, match="must not be before"):
+        BusinessTimeIndex(_make_calendar(), date(2025, 12, 8), date(2025, 12, 7))
+
+
+# =============================================================================
+# BusinessDuration integration
+# =============================================================================
+
+
+def _make_duration():
+    return BusinessDuration(
+        business_timezone="America/New_York",
+        business_hours={"start": "09:00", "end": "17:00"},
+        holidays=["2025-12-25"],
+        overrides={"2025-12-24": {"start": "09:00", "end": "12:00"}},
+    )
+
+
+def test_build_index_applies_holidays_and_overrides():
+    bd = _make_duration()
+    index = bd.build_index("2025-12-01", "2025-12-31")
+    assert index.first_date == date(2025, 12, 1)
+    assert index.last_date == date(2025, 12, 31)
+
+    start = datetime(2025, 12, 22, 10, 0)  # Monday
+    end = datetime(2025, 12, 26, 11, 0)  # Friday
+    # Mon 7h + Tue 8h + Wed (override) 3h + Thu (holiday) 0h + Fri 2h
+    assert bd.calculate(start, end) == timedelta(hours=20)
+
+
+def test_indexed_calculate_matches_unindexed():
+    bd = _make_duration()
+    reference = _make_duration()
+    bd.build_index(date(2025, 1, 1), date(2026, 12, 31))
+
+    start = datetime(2025, 3, 4, 13, 17, 5)
+    for hours in (0, 3, 30, 400, 5000):
+        end = start + timedelta(hours=hours, minutes=7)
+        assert bd.calculate(start, end) == reference.calculate(start, end)
+
+
+def test_calculate_outside_index_falls_back():
+    bd = _make_duration()
+    bd.build_index("2025-12-01", "2025-12-31")
+    start = datetime(2025, 11, 28, 16, 0)  # Friday, before the index
+    end = datetime(2025, 12, 1, 10, 0)  # Monday, inside the index
+    assert bd.calculate(start, end) == timedelta(hours=2)
+
+
+def test_clear_index():
+    bd = _make_duration()
+    bd.build_index("2025-12-01", "2025-12-31")
+    bd.clear_index()
+    start = datetime(2025, 12, 24, 8, 0)
+    end = datetime(2025, 12, 24, 18, 0)
+    assert bd.calculate(start, end) == timedelta(hours=3)
+
+
+def test_build_index_rejects_reversed_range():
+    bd = _make_duration()
+    with pytest.raises(ValueError):
+        bd.build_index("2025-12-31", "2025-12-01")
@@ -0,0 +1,82 @@
+from datetime import date, datetime
+
+from bizdurr.BusinessDuration import BusinessDuration
+from bizdurr.CalendarCache import CalendarCache
+
+
+def test_key_is_canonical(calendar_settings):
+    hours = calendar_settings["business_hours"]
+    overrides = calendar_settings["overrides"]
+    key = CalendarCache.key_for(
+        hours, "America/New_York", ["2025-12-26", "2025-12-25"], overrides
+    )
+    assert key == CalendarCache.key_for(
+        hours,
+        "America/New_York",
+        [date(2025, 12, 25), "2025-12-26"],
+        {date(2025, 12, 24): {"end": "12:00", "start": "09:00"}},
+    )
+    assert key != CalendarCache.key_for(
+        hours, "America/Chicago", ["2025-12-25", "2025-12-26"], overrides
+    )
+
+
+def test_store_and_load(tmp_path, bd):
+    cache = CalendarCache(tmp_path / "calendars")
+    calendar = bd.calendar
+
+    assert cache.load("missing") is None
+    cache.store("key", calendar)
+    assert "key" in cache
+    assert cache.load("key") == calendar
+
+    cache.clear()
+    assert "key" not in cache
+
+
+def test_corrupt_entries_are_misses(tmp_path):
+    cache = CalendarCache(tmp_path)
+    (tmp_path / "empty.bzcal").write_bytes(b"")
+    (tmp_path / "garbage.bzcal").write_bytes(b"not a calendar")
+    assert cache.load("empty") is None
+    assert cache.load("garbage") is None
+
+
+def test_business_duration_uses_cache(tmp_path, calendar_settings):
+    cache = CalendarCache(tmp_path)
+    compiled = BusinessDuration(**calendar_settings, calendar_cache=cache)
+    assert len(list(tmp_path.glob("*.bzcal"))) == 1
+
+    loaded = BusinessDuration(**calendar_settings, calendar_cache=cache)
+    assert loaded.calendar == compiled.calendar
+
+    start = datetime(2025, 12, 22, 10, 0)
+    end = datetime(2025, 12, 29, 10, 0)
+    assert loaded.calculate(start, end) == compiled.calculate(start, end)
+    assert loaded.get_business_intervals_utc("2025-12-24") == (
+        compiled.get_business_intervals_utc("2025-12-24")
+    )
+
+
+def test_hit_converts_inputs_like_a_miss(tmp_path, calendar_settings):
+    cache = CalendarCache(tmp_path)
+    compiled = BusinessDuration(**calendar_settings, calendar_cache=cache)
+    loaded = BusinessDuration(**calendar_settings, calendar_cache=cache)
+
+    assert loaded.business_hours == compiled.business_hours
+    assert loaded.overrides == compiled.overrides
+    assert loaded.business_hours.get_day_intervals("monday") == (
+        compiled.business_hours.get_day_intervals("monday")
+    )
+    assert loaded.overrides.get_override_dates() == [date(2025, 12, 24)]
+    assert loaded._calendar_cache_key() == compiled._calendar_cache_key()
+
+
+def test_reassigned_schedule_uses_cache(tmp_path, calendar_settings):
+    cache = CalendarCache(tmp_path)
+    duration = BusinessDuration(**calendar_settings, calendar_cache=cache)
+    duration.holidays = ["2025-12-26"]
+
+    assert len(list(tmp_path.glob("*.bzcal"))) == 2
+    assert duration.is_within_business_hours(datetime(2025, 12, 25, 10, 0))
+    assert not duration.is_within_business_hours(datetime(2025, 12, 26, 10, 0))
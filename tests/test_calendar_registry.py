@@ -0,0 +1,179 @@
+from dataclasses import FrozenInstanceError
+from datetime import datetime, timedelta
+
+import pytest
+
+from bizdurr import CalendarRegistry, FrozenBusinessDuration
+
+NINE_TO_FIVE = {"start": "09:00", "end": "17:00"}
+
+
+@pytest.fixture
+def registry(calendar_settings):
+    registry = CalendarRegistry()
+    for tenant in ("acme", "globex", "initech"):
+        registry.register(tenant, **calendar_settings)
+    registry.register(
+        "umbrella",
+        business_hours={"start": "08:00", "end": "12:00"},
+        business_timezone="Europe/London",
+    )
+    return registry
+
+
+def test_identical_calendars_are_shared(registry):
+    assert registry.get("acme") is registry.get("globex")
+    assert registry.get("acme") is not registry.get("umbrella")
+    assert registry.info() == (4, 2, 2)
+    assert len(registry) == 4
+    assert "acme" in registry
+    assert "hooli" not in registry
+
+
+def test_handles_are_frozen(registry):
+    handle = registry.get("acme")
+    assert isinstance(handle, FrozenBusinessDuration)
+    with pytest.raises(FrozenInstanceError):
+        handle.holidays = []
+
+
+def test_equivalent_inputs_share_one_calendar():
+    registry = CalendarRegistry()
+    weekdays = ("monday", "tuesday", "wednesday", "thursday", "friday")
+    first = registry.register("a", NINE_TO_FIVE, "America/New_York")
+    second = registry.register(
+        "b", {day: NINE_TO_FIVE for day in weekdays}, "America/New_York"
+    )
+    assert first is second
+
+
+def test_compiled_calendar_is_shared_across_timezones():
+    registry = CalendarRegistry()
+    ny = registry.register("a", NINE_TO_FIVE, "America/New_York")
+    tokyo = registry.register("b", NINE_TO_FIVE, "Asia/Tokyo")
+    assert ny is not tokyo
+    assert ny.calendar is tokyo.calendar
+    assert registry.info() == (2, 2, 1)
+
+
+def test_shared_handle_calculates_like_a_standalone_duration(registry, bd):
+    start = datetime(2025, 12, 22, 10, 0)
+    end = datetime(2025, 12, 26, 11, 0)
+    assert registry.get("globex").calculate(start, end) == bd.calculate(start, end)
+
+
+def test_reregister_replaces_calendar(registry):
+    registry.register("acme", {"start": "08:00", "end": "12:00"}, "Europe/London")
+    assert registry.get("acme") is registry.get("umbrella")
+    registry.register("acme", {"start": "08:00", "end": "12:00"}, "Europe/London")
+    assert registry.info() == (4, 2, 2)
+
+
+def test_unregister_releases_unused_calendars(registry):
+    registry.unregister("umbrella")
+    registry.unregister("unknown")
+    assert registry.info() == (3, 1, 1)
+    for tenant in ("acme", "globex", "initech"):
+        registry.unregister(tenant)
+    assert registry.info() == (0, 0, 0)
+
+
+def test_get_unknown_tenant_raises(registry):
+    with pytest.raises(KeyError, match="Unknown tenant"):
+        registry.get("hooli")
+    with pytest.raises(KeyError):
+        registry.get_many(["acme", "hooli"])
+
+
+def test_get_many(registry):
+    handles = registry.get_many(["umbrella", "acme"])
+    assert handles == [registry.get("umbrella"), registry.get("acme")]
+
+
+def test_register_invalid_calendar_raises():
+    registry = CalendarRegistry()
+    with pytest.raises(ValueError):
+        registry.register("a", {"start": "09:00", "end": "09:00"}, "UTC")
+    assert "a" not in registry
+
+
+# =============================================================================
+# Batch Lookups
+# =============================================================================
+
+
+def test_calculate_many_groups_rows_by_calendar(registry):
+    np = pytest.importorskip("numpy")
+    tenants = ["acme", "umbrella", "globex", "umbrella"]
+    starts = [datetime(2025, 12, 22, 10, 0)] * 4
+    ends = [datetime(2025, 12, 23, 10, 0)] * 4
+
+    result = registry.calculate_many(tenants, starts, ends)
+
+    expected = [
+        registry.get(tenant).calculate(start, end)
+        for tenant, start, end in zip(tenants, starts, ends)
+    ]
+    assert result.dtype == np.dtype("timedelta64[us]")
+    assert result.tolist() == expected
+    assert expected == [timedelta(hours=8), timedelta(hours=4)] * 2
+
+
+def test_calculate_many_broadcasts_scalars(registry):
+    np = pytest.importorskip("numpy")
+    starts = np.array(["2025-12-22T10:00", "2025-12-22T11:00"], dtype="datetime64[us]")
+    result = registry.calculate_many(
+        ["umbrella", "acme"], starts, datetime(2025, 12, 22, 12, 0)
+    )
+    assert result.tolist() == [timedelta(hours=2), timedelta(hours=1)]
+
+
+def test_add_business_time_many(registry):
+    pytest.importorskip("numpy")
+    result = registry.add_business_time_many(
+        ["acme", "umbrella"], datetime(2025, 12, 22, 16, 0), timedelta(hours=2)
+    )
+    assert result.tolist() == [
+        datetime(2025, 12, 23, 10, 0),
+        datetime(2025, 12, 23, 10, 0),
+    ]
+
+
+def test_many_rejects_length_mismatch(registry):
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError, match="one per tenant ID"):
+        registry.calculate_many(
+            ["acme", "globex"],
+            [datetime(2025, 12, 22, 10, 0)],
+            datetime(2025, 12, 23, 10, 0),
+        )
+
+
+def test_many_unknown_tenant_raises(registry):
+    pytest.importorskip("numpy")
+    with pytest.raises(KeyError, match="Unknown tenant"):
+        registry.calculate_many(
+            ["acme", "hooli"],
+            datetime(2025, 12, 22, 10, 0),
+            datetime(2025, 12, 23, 10, 0),
+        )
+
+
+@pytest.mark.parametrize(
+    "tenant_ids", [[7, "acme", 7], [("eu", 1), ("us", 1), ("eu", 1)]]
+)
+def test_many_accepts_any_hashable_tenant_ids(tenant_ids):
+    pytest.importorskip("numpy")
+    registry = CalendarRegistry()
+    registry.register(tenant_ids[0], NINE_TO_FIVE, "America/New_York")
+    registry.register(tenant_ids[1], {"start": "08:00", "end": "11:00"}, "UTC")
+
+    result = registry.calculate_many(
+        tenant_ids, datetime(2025, 12, 22, 10, 0), datetime(2025, 12, 22, 12, 0)
+    )
+
+    assert result.tolist() == [
+        timedelta(hours=2),
+        timedelta(hours=1),
+        timedelta(hours=2),
+    ]
@@ -0,0 +1,169 @@
+import json
+from datetime import timedelta
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from bizdurr.cli import main
+
+CONFIG = {
+    "business_hours": {"start": "09:00", "end": "17:00"},
+    "business_timezone": "America/New_York",
+    "holidays": ["2025-12-25"],
+}
+
+CSV_INPUT = (
+    "id,opened_at,closed_at,sla_seconds\n"
+    "1,2025-12-22T10:00:00,2025-12-23T12:00:00,3600\n"
+    "2,2025-12-24T16:00:00,2025-12-26T10:00:00,7200\n"
+    "3,,2025-12-26T10:00:00,60\n"
+)
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "calendar.json"
+    path.write_text(json.dumps(CONFIG))
+    return path
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "tickets.csv"
+    path.write_text(CSV_INPUT)
+    return path
+
+
+def test_csv_to_jsonl(tmp_path, config_path, csv_path):
+    output = tmp_path / "enriched.jsonl"
+    code = main(
+        [
+            "--config", str(config_path), str(csv_path), str(output),
+            "--duration", "business_seconds=opened_at,closed_at",
+            "--deadline", "due_at=opened_at,8h",
+            "--deadline", "sla_due_at=opened_at,sla_seconds",
+            "--within", "opened_in_hours=opened_at",
+            "--batch-size", "1",
+        ]
+    )  # fmt: skip
+    assert code == 0
+
+    rows = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [row["business_seconds"] for row in rows] == [36000.0, 7200.0, None]
+    assert [row["due_at"] for row in rows] == [
+        "2025-12-23T10:00:00",
+        "2025-12-26T16:00:00",
+        None,
+    ]
+    assert [row["sla_due_at"] for row in rows] == [
+        "2025-12-22T11:00:00",
+        "2025-12-26T10:00:00",
+        None,
+    ]
+    assert [row["opened_in_hours"] for row in rows] == [True, True, None]
+    assert [row["id"] for row in rows] == [1, 2, 3]
+
+
+def test_csv_to_parquet_keeps_durations(tmp_path, config_path, csv_path):
+    output = tmp_path / "enriched.parquet"
+    code = main(
+        [
+            "--config", str(config_path), str(csv_path), str(output),
+            "--duration", "business_duration=opened_at,closed_at",
+        ]
+    )  # fmt: skip
+    assert code == 0
+
+    table = pq.read_table(output)
+    assert table["business_duration"].type == pa.duration("us")
+    assert table["business_duration"].to_pylist() == [
+        timedelta(hours=10),
+        timedelta(hours=2),
+        None,
+    ]
+
+
+def test_converts_timestamps_with_offsets(tmp_path, config_path):
+    source = tmp_path / "events.jsonl"
+    source.write_text('{"at": "2025-12-22T15:00:00Z"}\n{"at": "2025-12-22T23:00:00Z"}\n')
+    output = tmp_path / "events.csv"
+
+    code = main(
+        ["--config", str(config_path), str(source), str(output), "--within", "open=at"]
+    )
+    assert code == 0
+    assert output.read_text().splitlines()[1:] == [
+        '"2025-12-22T15:00:00Z",true',
+        '"2025-12-22T23:00:00Z",false',
+    ]
+
+
+def test_toml_config(tmp_path, csv_path):
+    pytest.importorskip("tomllib")
+    config = tmp_path / "calendar.toml"
+    config.write_text(
+        'business_timezone = "America/New_York"\n'
+        "[business_hours]\n"
+        'start = "09:00"\n'
+        'end = "17:00"\n'
+    )
+    output = tmp_path / "enriched.csv"
+    code = main(
+        ["--config", str(config), str(csv_path), str(output), "--within", "o=opened_at"]
+    )
+    assert code == 0
+
+
+def test_reports_unknown_config_keys(tmp_path, csv_path, capsys):
+    config = tmp_path / "calendar.json"
+    config.write_text(json.dumps({**CONFIG, "timezone": "UTC"}))
+    code = main(
+        [
+            "--config", str(config), str(csv_path), str(tmp_path / "out.csv"),
+            "--within", "o=opened_at",
+        ]
+    )  # fmt: skip
+    assert code == 2
+    assert "Unknown key(s)" in capsys.readouterr().err
+
+
+def test_reports_missing_column(tmp_path, config_path, csv_path, capsys):
+    code = main(
+        [
+            "--config", str(config_path), str(csv_path), str(tmp_path / "out.csv"),
+            "--within", "o=missing",
+        ]
+    )  # fmt: skip
+    assert code == 2
+    assert "Column 'missing' not found" in capsys.readouterr().err
+
+
+def test_reports_unknown_format(tmp_path, config_path, csv_path, capsys):
+    code = main(
+        [
+            "--config", str(config_path), str(csv_path), str(tmp_path / "out.txt"),
+            "--within", "o=opened_at",
+        ]
+    )  # fmt: skip
+    assert code == 2
+    assert "Cannot infer the format" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    [
+        [],
+        ["--within", "no_equals_sign"],
+        ["--duration", "d=only_start"],
+        ["--within", "o=opened_at", "--batch-size", "0"],
+    ],
+)
+def test_rejects_bad_arguments(tmp_path, config_path, csv_path, arguments):
+    with pytest.raises(SystemExit) as error:
+        main(
+            ["--config", str(config_path), str(csv_path), str(tmp_path / "out.csv")]
+            + arguments
+        )
+    assert error.value.code == 2
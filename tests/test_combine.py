@@ -0,0 +1,64 @@
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from bizdurr.combine import combine_calendars
+from bizdurr.CompiledCalendar import CompiledCalendar
+from bizdurr.ZoneTransitions import ZoneTransitions
+
+HOUR = 3600
+UTC = ZoneTransitions.for_timezone(ZoneInfo("UTC"))
+
+
+def _weekdays(*segments):
+    return CompiledCalendar(weekday_segments=(tuple(segments),) * 5 + ((), ()))
+
+
+def test_union_merges_touching_segments():
+    morning = _weekdays((9 * HOUR, 12 * HOUR))
+    afternoon = _weekdays((12 * HOUR, 17 * HOUR))
+    combined = combine_calendars(
+        "union", [(morning, UTC), (afternoon, UTC)], UTC, 0, 27
+    )
+    assert combined == _weekdays((9 * HOUR, 17 * HOUR))
+
+
+def test_intersection_and_difference():
+    day = _weekdays((9 * HOUR, 17 * HOUR))
+    lunch = _weekdays((12 * HOUR, 13 * HOUR))
+
+    assert combine_calendars("intersection", [(day, UTC), (lunch, UTC)], UTC, 0, 27) == (
+        lunch
+    )
+    assert combine_calendars("difference", [(day, UTC), (lunch, UTC)], UTC, 0, 27) == (
+        _weekdays((9 * HOUR, 12 * HOUR), (13 * HOUR, 17 * HOUR))
+    )
+
+
+def test_shifts_across_midnight_in_the_result_timezone():
+    tokyo = ZoneTransitions.for_timezone(ZoneInfo("Asia/Tokyo"))
+    day = _weekdays((9 * HOUR, 17 * HOUR))
+
+    combined = combine_calendars("union", [(day, tokyo)], UTC, 0, 27)
+
+    # 09:00-17:00 in Tokyo is 00:00-08:00 UTC, Monday to Friday
+    assert combined == _weekdays((0, 8 * HOUR))
+
+
+def test_exceptions_are_kept():
+    # Closed on Monday 1970-01-05 and open late on Tuesday 1970-01-13
+    calendar = CompiledCalendar(
+        weekday_segments=(((9 * HOUR, 17 * HOUR),),) * 7,
+        exception_days=(4, 12),
+        exception_segments=((), ((9 * HOUR, 21 * HOUR),)),
+    )
+    combined = combine_calendars("union", [(calendar, UTC)], UTC, 0, 27)
+    assert combined == calendar
+
+
+def test_invalid_arguments_raise():
+    day = _weekdays((9 * HOUR, 17 * HOUR))
+    with pytest.raises(ValueError, match="operation"):
+        combine_calendars("xor", [(day, UTC)], UTC, 0, 27)
+    with pytest.raises(ValueError, match="At least one"):
+        combine_calendars("union", [], UTC, 0, 27)
@@ -0,0 +1,312 @@
+import pickle
+
+import pytest
+
+from bizdurr.CompiledCalendar import (
+    MICROSECONDS_PER_DAY,
+    MICROSECONDS_PER_SECOND,
+    CompiledCalendar,
+)
+
+HOUR_US = 3600 * MICROSECONDS_PER_SECOND
+NINE_TO_FIVE = ((32400, 61200),)
+
+# 2025-12-08 (a Monday) as days since 1970-01-01
+MONDAY = 20430
+
+
+def _mon_fri(**kwargs):
+    return CompiledCalendar(weekday_segments=(NINE_TO_FIVE,) * 5 + ((), ()), **kwargs)
+
+
+def test_weekday_of_epoch_days():
+    assert CompiledCalendar.weekday_of(0) == 3  # 1970-01-01 was a Thursday
+    assert CompiledCalendar.weekday_of(MONDAY) == 0
+
+
+def test_week_totals():
+    calendar = _mon_fri()
+    assert calendar.weekday_seconds == (28800,) * 5 + (0, 0)
+    assert calendar.week_seconds == 5 * 28800
+
+
+def test_duration_within_day():
+    calendar = _mon_fri()
+    start = MONDAY * MICROSECONDS_PER_DAY + 10 * HOUR_US
+    end = MONDAY * MICROSECONDS_PER_DAY + 15 * HOUR_US
+    assert calendar.duration(start, end) == 5 * HOUR_US
+
+
+def test_duration_across_weeks():
+    calendar = _mon_fri()
+    start = MONDAY * MICROSECONDS_PER_DAY
+    end = (MONDAY + 14) * MICROSECONDS_PER_DAY
+    assert calendar.duration(start, end) == 80 * HOUR_US
+
+
+def test_duration_reversed_is_zero():
+    calendar = _mon_fri()
+    start = MONDAY * MICROSECONDS_PER_DAY + 15 * HOUR_US
+    end = MONDAY * MICROSECONDS_PER_DAY + 10 * HOUR_US
+    assert calendar.duration(start, end) == 0
+
+
+def test_exceptions_replace_weekday_hours():
+    calendar = _mon_fri(
+        exception_days=(MONDAY + 1, MONDAY + 5),
+        exception_segments=((), ((36000, 50400),)),  # Tuesday closed, Saturday 10-14
+    )
+    assert calendar.segments_for_day(MONDAY + 1) == ()
+    assert calendar.segments_for_day(MONDAY + 2) == NINE_TO_FIVE
+    start = MONDAY * MICROSECONDS_PER_DAY
+    end = (MONDAY + 7) * MICROSECONDS_PER_DAY
+    assert calendar.duration(start, end) == (40 - 8 + 4) * HOUR_US
+
+
+def test_invalid_tables_raise():
+    with pytest.raises(ValueError):
+        CompiledCalendar(weekday_segments=((),) * 6)
+    with pytest.raises(ValueError):
+        CompiledCalendar(weekday_segments=((),) * 7, exception_days=(1,))
+    with pytest.raises(ValueError):
+        CompiledCalendar(
+            weekday_segments=((),) * 7,
+            exception_days=(2, 1),
+            exception_segments=((), ()),
+        )
+    with pytest.raises(ValueError):
+        CompiledCalendar(weekday_segments=(((61200, 32400),),) + ((),) * 6)
+
+
+def test_elapsed_array_matches_scalar():
+    np = pytest.importorskip("numpy")
+    calendar = _mon_fri(
+        exception_days=(MONDAY + 1, MONDAY + 5),
+        exception_segments=((), ((36000, 50400),)),
+    )
+    instants = np.arange(
+        (MONDAY - 3) * MICROSECONDS_PER_DAY,
+        (MONDAY + 10) * MICROSECONDS_PER_DAY,
+        HOUR_US // 4 + 7,
+        dtype=np.int64,
+    )
+    expected = [calendar.elapsed(int(t)) for t in instants]
+    assert calendar.elapsed_array(instants).tolist() == expected
+
+
+def test_advance_inverts_duration():
+    calendar = _mon_fri(
+        exception_days=(MONDAY + 1, MONDAY + 5),
+        exception_segments=((), ((36000, 50400),)),
+    )
+    start = MONDAY * MICROSECONDS_PER_DAY + 16 * HOUR_US
+    for hours in (1, 2, 3, 12, 100):
+        end = calendar.advance(start, hours * HOUR_US)
+        assert calendar.duration(start, end) == hours * HOUR_US
+        assert calendar.advance(end, -hours * HOUR_US) <= start
+
+
+def test_advance_skips_closed_exception_day():
+    calendar = _mon_fri(exception_days=(MONDAY + 1,), exception_segments=((),))
+    start = MONDAY * MICROSECONDS_PER_DAY + 17 * HOUR_US  # Monday close
+    # Tuesday is closed, so one hour lands on Wednesday 10:00
+    expected = (MONDAY + 2) * MICROSECONDS_PER_DAY + 10 * HOUR_US
+    assert calendar.advance(start, HOUR_US) == expected
+
+
+def test_advance_without_business_time_raises():
+    calendar = CompiledCalendar(weekday_segments=((),) * 7)
+    with pytest.raises(ValueError):
+        calendar.advance(0, HOUR_US)
+    with pytest.raises(ValueError):
+        calendar.advance(0, -HOUR_US)
+
+
+def test_advance_array_matches_scalar():
+    np = pytest.importorskip("numpy")
+    calendar = _mon_fri(
+        exception_days=(MONDAY + 1, MONDAY + 5, MONDAY + 9),
+        exception_segments=((), ((36000, 50400),), ((32400, 36000), (50400, 54000))),
+    )
+    instants = np.arange(
+        (MONDAY - 3) * MICROSECONDS_PER_DAY,
+        (MONDAY + 12) * MICROSECONDS_PER_DAY,
+        HOUR_US // 2 + 7,
+        dtype=np.int64,
+    )
+    for hours in (0, 1, 8, -2, -8, 37.5, -100):
+        amount = int(hours * HOUR_US)
+        expected = [calendar.advance(int(t), amount) for t in instants]
+        assert calendar.advance_array(instants, amount).tolist() == expected
+
+
+def test_advance_array_without_business_time_raises():
+    np = pytest.importorskip("numpy")
+    calendar = CompiledCalendar(
+        weekday_segments=((),) * 7,
+        exception_days=(MONDAY,),
+        exception_segments=(NINE_TO_FIVE,),
+    )
+    start = np.array([(MONDAY - 1) * MICROSECONDS_PER_DAY], dtype=np.int64)
+    assert calendar.advance_array(start, HOUR_US).tolist() == [
+        MONDAY * MICROSECONDS_PER_DAY + 10 * HOUR_US
+    ]
+    with pytest.raises(ValueError):
+        calendar.advance_array(start, 9 * HOUR_US)
+    with pytest.raises(ValueError):
+        calendar.advance_array(start, -HOUR_US)
+
+
+def test_next_open_next_close_and_previous_close():
+    calendar = _mon_fri(exception_days=(MONDAY + 1,), exception_segments=((),))
+    monday = MONDAY * MICROSECONDS_PER_DAY
+    wednesday = (MONDAY + 2) * MICROSECONDS_PER_DAY
+    friday = (MONDAY - 3) * MICROSECONDS_PER_DAY
+
+    # Open: the instant itself, the current close, and the previous day's close
+    assert calendar.next_open(monday + 10 * HOUR_US) == monday + 10 * HOUR_US
+    assert calendar.next_close(monday + 10 * HOUR_US) == monday + 17 * HOUR_US
+    assert calendar.previous_close(monday + 10 * HOUR_US) == friday + 17 * HOUR_US
+
+    # Closed at Monday's close; Tuesday is a closed exception day
+    assert calendar.next_open(monday + 17 * HOUR_US) == wednesday + 9 * HOUR_US
+    assert calendar.next_close(monday + 17 * HOUR_US) == wednesday + 17 * HOUR_US
+    assert calendar.previous_close(monday + 17 * HOUR_US) == monday + 17 * HOUR_US
+
+
+def test_open_close_arrays_match_scalar():
+    np = pytest.importorskip("numpy")
+    calendar = _mon_fri(
+        exception_days=(MONDAY + 1, MONDAY + 5),
+        exception_segments=((), ((36000, 43200), (46800, 50400))),
+    )
+    instants = np.arange(
+        (MONDAY - 3) * MICROSECONDS_PER_DAY,
+        (MONDAY + 10) * MICROSECONDS_PER_DAY,
+        HOUR_US // 2,
+        dtype=np.int64,
+    )
+    for scalar, array in (
+        (calendar.next_open, calendar.next_open_array),
+        (calendar.next_close, calendar.next_close_array),
+        (calendar.previous_close, calendar.previous_close_array),
+    ):
+        assert array(instants).tolist() == [scalar(int(t)) for t in instants]
+
+
+def test_segments_meeting_at_midnight_close_once():
+    np = pytest.importorskip("numpy")
+    # A 22:00-06:00 shift starting every weekday, and a whole-day Saturday
+    night = (0, 21600)
+    evening = (79200, 86400)
+    calendar = CompiledCalendar(
+        weekday_segments=((evening,),)
+        + ((night, evening),) * 4
+        + (((0, 86400),), (night,)),
+        exception_days=(MONDAY + 2,),
+        exception_segments=((night,),),
+    )
+    monday = MONDAY * MICROSECONDS_PER_DAY
+    tuesday = monday + MICROSECONDS_PER_DAY
+    thursday = monday + 3 * MICROSECONDS_PER_DAY
+    sunday = monday + 6 * MICROSECONDS_PER_DAY
+
+    assert calendar.next_close(monday + 23 * HOUR_US) == tuesday + 6 * HOUR_US
+    assert calendar.previous_close(tuesday + 3 * HOUR_US) == monday - HOUR_US * 18
+    # Wednesday's shift is cancelled, so Thursday morning is closed
+    assert calendar.next_open(tuesday + 23 * HOUR_US) == tuesday + 23 * HOUR_US
+    assert calendar.next_close(tuesday + 23 * HOUR_US) == thursday - 18 * HOUR_US
+    # Friday night runs through Saturday into Sunday morning
+    friday = thursday + MICROSECONDS_PER_DAY
+    assert calendar.next_close(friday + 23 * HOUR_US) == sunday + 6 * HOUR_US
+
+    instants = np.arange(
+        monday - 2 * MICROSECONDS_PER_DAY,
+        monday + 9 * MICROSECONDS_PER_DAY,
+        HOUR_US // 2,
+        dtype=np.int64,
+    )
+    for scalar, array in (
+        (calendar.next_close, calendar.next_close_array),
+        (calendar.previous_close, calendar.previous_close_array),
+    ):
+        assert array(instants).tolist() == [scalar(int(t)) for t in instants]
+
+
+def test_calendar_open_around_the_clock_never_closes():
+    np = pytest.importorskip("numpy")
+    calendar = CompiledCalendar(weekday_segments=(((0, 86400),),) * 7)
+    with pytest.raises(ValueError, match="never closes"):
+        calendar.next_close(MONDAY * MICROSECONDS_PER_DAY)
+    with pytest.raises(ValueError, match="never closes"):
+        calendar.next_close_array(np.array([MONDAY * MICROSECONDS_PER_DAY]))
+
+
+def test_is_open_array_matches_scalar():
+    np = pytest.importorskip("numpy")
+    calendar = _mon_fri(
+        exception_days=(MONDAY + 1, MONDAY + 2),
+        exception_segments=((), ((32400, 36000), (50400, 54000))),
+    )
+    instants = np.arange(
+        (MONDAY - 1) * MICROSECONDS_PER_DAY,
+        (MONDAY + 4) * MICROSECONDS_PER_DAY,
+        HOUR_US // 4 - 1,
+        dtype=np.int64,
+    )
+    expected = [calendar.is_open(int(t)) for t in instants]
+    assert calendar.is_open_array(instants).tolist() == expected
+    assert any(expected) and not all(expected)
+
+
+def test_to_bytes_round_trip():
+    calendar = _mon_fri(
+        exception_days=(MONDAY, MONDAY + 3),
+        exception_segments=((), ((36000, 43200), (46800, 50400))),
+    )
+    restored = CompiledCalendar.from_buffer(calendar.to_bytes())
+
+    assert restored == calendar
+    assert restored.week_prefix == calendar.week_prefix
+    assert restored.exception_offsets == calendar.exception_offsets
+
+    start = MONDAY * MICROSECONDS_PER_DAY
+    end = (MONDAY + 10) * MICROSECONDS_PER_DAY
+    assert restored.duration(start, end) == calendar.duration(start, end)
+
+
+def test_from_buffer_rejects_invalid_data():
+    encoded = _mon_fri().to_bytes()
+    with pytest.raises(ValueError, match="too short"):
+        CompiledCalendar.from_buffer(b"BZ")
+    with pytest.raises(ValueError, match="does not hold"):
+        CompiledCalendar.from_buffer(b"XXXX" + encoded[4:])
+    with pytest.raises(ValueError, match="wrong length"):
+        CompiledCalendar.from_buffer(encoded[:-8])
+
+
+def test_pickle_uses_compact_encoding():
+    calendar = _mon_fri(exception_days=(MONDAY,), exception_segments=((),))
+    restored = pickle.loads(pickle.dumps(calendar))
+    assert restored == calendar
+    assert restored.exception_offsets == calendar.exception_offsets
+
+
+def test_range_queries_match_brute_force():
+    calendar = CompiledCalendar(
+        weekday_segments=(NINE_TO_FIVE,) * 5 + (((36000, 50400),), ()),
+        exception_days=(MONDAY - 2, MONDAY + 1, MONDAY + 6, MONDAY + 9),
+        exception_segments=((), (), NINE_TO_FIVE, ()),
+    )
+
+    for first in range(MONDAY - 10, MONDAY + 12):
+        for last in range(first - 1, MONDAY + 12):
+            days = range(first, last + 1)
+            assert calendar.open_day_count(first, last) == sum(
+                bool(calendar.segments_for_day(day)) for day in days
+            )
+            assert calendar.closed_exception_days(first, last) == tuple(
+                day
+                for day in days
+                if day in calendar.exception_days and not calendar.segments_for_day(day)
+            )
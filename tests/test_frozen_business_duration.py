@@ -0,0 +1,80 @@
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import FrozenInstanceError
+from datetime import datetime, timedelta
+
+import pytest
+
+from bizdurr import BusinessDuration, FrozenBusinessDuration
+
+SCHEDULE = {
+    "business_timezone": "America/New_York",
+    "business_hours": {"start": "09:00", "end": "17:00"},
+    "holidays": ["2025-12-25"],
+    "overrides": {"2025-12-24": {"start": "09:00", "end": "12:00"}},
+}
+
+
+def test_assignment_after_construction_raises():
+    frozen = FrozenBusinessDuration(**SCHEDULE)
+    with pytest.raises(FrozenInstanceError):
+        frozen.holidays = ["2025-12-26"]
+    with pytest.raises(FrozenInstanceError):
+        frozen.business_timezone = "UTC"
+    with pytest.raises(FrozenInstanceError):
+        del frozen.overrides
+    with pytest.raises(FrozenInstanceError):
+        frozen.build_index("2025-01-01", "2025-12-31")
+
+
+def test_queries_match_business_duration():
+    frozen = FrozenBusinessDuration(**SCHEDULE)
+    duration = BusinessDuration(**SCHEDULE)
+    start = datetime(2025, 12, 22, 10, 0)
+    end = datetime(2025, 12, 26, 11, 0)
+    assert frozen.calculate(start, end) == duration.calculate(start, end)
+    assert frozen.add_business_time(start, timedelta(hours=30)) == (
+        duration.add_business_time(start, timedelta(hours=30))
+    )
+    assert frozen.is_within_business_hours(start)
+
+
+def test_from_duration_shares_calendar_and_index():
+    duration = BusinessDuration(**SCHEDULE)
+    index = duration.build_index("2025-12-01", "2025-12-31")
+    frozen = FrozenBusinessDuration.from_duration(duration)
+
+    assert frozen.calendar is duration.calendar
+    assert frozen._index is index
+    assert frozen._memo is not duration._memo
+
+    duration.holidays = []
+    start = datetime(2025, 12, 25, 8, 0)
+    end = datetime(2025, 12, 25, 18, 0)
+    assert frozen.calculate(start, end) == timedelta(0)
+    assert duration.calculate(start, end) == timedelta(hours=8)
+
+
+def test_pickle_round_trip_stays_frozen():
+    frozen = pickle.loads(pickle.dumps(FrozenBusinessDuration(**SCHEDULE)))
+    assert isinstance(frozen, FrozenBusinessDuration)
+    with pytest.raises(FrozenInstanceError):
+        frozen.holidays = []
+
+
+def test_concurrent_queries_match_serial():
+    frozen = FrozenBusinessDuration(**SCHEDULE, memo_size=64)
+    starts = [
+        datetime(2025, 1, 1, 8, 0) + timedelta(hours=7 * offset) for offset in range(400)
+    ]
+
+    def query(start):
+        return (
+            frozen.calculate(start, start + timedelta(days=9)),
+            frozen.add_business_time(start, timedelta(hours=13)),
+            frozen.next_business_close(start),
+        )
+
+    expected = [query(start) for start in starts]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert list(pool.map(query, starts)) == expected
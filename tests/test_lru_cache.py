@@ -0,0 +1,85 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from bizdurr.LRUCache import CacheInfo, LRUCache
+
+
+def test_hits_and_misses_are_counted():
+    cache = LRUCache(maxsize=4)
+    assert cache.get_or_compute("a", lambda: 1) == 1
+    assert cache.get_or_compute("a", lambda: 2) == 1
+    assert cache.info() == CacheInfo(hits=1, misses=1, evictions=0, size=1, maxsize=4)
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LRUCache(maxsize=2)
+    cache.get_or_compute("a", lambda: 1)
+    cache.get_or_compute("b", lambda: 2)
+    cache.get_or_compute("a", lambda: 1)  # "b" is now least recently used
+    cache.get_or_compute("c", lambda: 3)
+
+    assert cache.info().evictions == 1
+    assert cache.get_or_compute("a", lambda: None) == 1
+    assert cache.get_or_compute("b", lambda: "recomputed") == "recomputed"
+
+
+def test_zero_size_disables_and_none_is_unbounded():
+    disabled = LRUCache(maxsize=0)
+    disabled.get_or_compute("a", lambda: 1)
+    disabled.get_or_compute("a", lambda: 1)
+    assert disabled.info() == CacheInfo(
+        hits=0, misses=2, evictions=0, size=0, maxsize=0
+    )
+
+    unbounded = LRUCache(maxsize=None)
+    for key in range(5000):
+        unbounded.get_or_compute(key, lambda: key)
+    assert len(unbounded) == 5000
+    assert unbounded.info().evictions == 0
+
+
+def test_clear_resets_statistics():
+    cache = LRUCache(maxsize=1)
+    cache.get_or_compute("a", lambda: 1)
+    cache.get_or_compute("b", lambda: 2)
+    cache.clear()
+    assert cache.info() == CacheInfo(hits=0, misses=0, evictions=0, size=0, maxsize=1)
+
+
+def test_negative_size_raises():
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=-1)
+
+
+def test_entries_expire_after_max_age():
+    now = [0.0]
+    cache = LRUCache(maxsize=4, max_age=10, clock=lambda: now[0])
+    cache.get_or_compute("a", lambda: 1)
+    now[0] = 9.0
+    assert cache.get_or_compute("a", lambda: 2) == 1
+    now[0] = 10.0
+    assert cache.get_or_compute("a", lambda: 3) == 3
+
+    info = cache.info()
+    assert (info.hits, info.misses, info.expirations, info.size) == (1, 2, 1, 1)
+
+
+def test_non_positive_max_age_raises():
+    with pytest.raises(ValueError):
+        LRUCache(max_age=0)
+
+
+def test_concurrent_lookups_keep_consistent_statistics():
+    cache = LRUCache(maxsize=50)
+    keys = [index % 80 for index in range(20_000)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        values = list(pool.map(lambda key: cache.get_or_compute(key, lambda: key), keys))
+
+    assert values == keys
+    info = cache.info()
+    assert info.hits + info.misses == len(keys)
+    assert info.size == 50
+    # Threads that miss the same key at once each store it, without an eviction
+    assert info.misses - info.evictions >= info.size
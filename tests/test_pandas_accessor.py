@@ -0,0 +1,117 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from bizdurr.BusinessDuration import BusinessDuration
+from bizdurr.PandasAccessor import register_pandas_accessor
+
+
+@pytest.fixture
+def bd():
+    duration = BusinessDuration(
+        business_timezone="America/New_York",
+        business_hours={"start": "09:00", "end": "17:00"},
+        holidays=["2025-12-25"],
+    )
+    register_pandas_accessor(duration)
+    return duration
+
+
+def _make_frame():
+    return pd.DataFrame(
+        {
+            "start_time": pd.to_datetime(
+                ["2025-12-08 09:00", "2025-12-08 16:00", "2025-12-24 10:00", None]
+            ),
+            "end_time": pd.to_datetime(
+                ["2025-12-08 12:00", "2025-12-09 10:00", "2025-12-26 10:00", "2025-12-26 00:00"]
+            ),
+        },
+        index=["a", "b", "c", "d"],
+    )
+
+
+def test_dataframe_accessor_duration(bd):
+    df = _make_frame()
+    result = df.bizdurr.duration("start_time", "end_time")
+    assert list(result.index) == ["a", "b", "c", "d"]
+    assert result.iloc[:3].tolist() == [
+        pd.Timedelta(hours=3),
+        pd.Timedelta(hours=2),
+        pd.Timedelta(hours=8),  # 7h on the 24th, holiday, 1h on the 26th
+    ]
+    assert pd.isna(result.iloc[3])
+
+
+def test_series_accessor_matches_calculate(bd):
+    df = _make_frame().dropna()
+    result = df["start_time"].bizdurr.duration(df["end_time"])
+    expected = [
+        bd.calculate(start.to_pydatetime(), end.to_pydatetime())
+        for start, end in zip(df["start_time"], df["end_time"])
+    ]
+    assert [value.to_pytimedelta() for value in result] == expected
+
+
+def test_aware_columns_are_converted(bd):
+    df = pd.DataFrame(
+        {
+            "start_time": pd.to_datetime(["2025-12-08 15:00"]).tz_localize("UTC"),
+            "end_time": pd.to_datetime(["2025-12-08 12:00"]).tz_localize(
+                "America/Los_Angeles"
+            ),
+        }
+    )
+    # 10 AM to 3 PM Eastern
+    result = df.bizdurr.duration("start_time", "end_time")
+    assert result.iloc[0] == pd.Timedelta(hours=5)
+
+
+def test_index_accessor_with_scalar_end(bd):
+    index = pd.DatetimeIndex(["2025-12-08 09:00", "2025-12-12 16:00"])
+    result = index.bizdurr.duration(datetime(2025, 12, 15, 10, 0))
+    assert isinstance(result, pd.TimedeltaIndex)
+    assert list(result) == [pd.Timedelta(hours=41), pd.Timedelta(hours=2)]
+
+
+def test_series_accessor_is_within_business_hours(bd):
+    series = pd.Series(
+        pd.to_datetime(
+            ["2025-12-08 14:30", "2025-12-08 22:30", "2025-12-25 15:00", None]
+        ).tz_localize("UTC"),
+        index=["a", "b", "c", "d"],
+        name="timestamp",
+    )
+    result = series.bizdurr.is_within_business_hours()
+    assert result.name == "timestamp"
+    assert result.to_dict() == {"a": True, "b": False, "c": False, "d": False}
+
+
+def test_index_accessor_is_within_business_hours(bd):
+    index = pd.DatetimeIndex(["2025-12-08 09:00", "2025-12-08 17:00"])
+    assert index.bizdurr.is_within_business_hours().tolist() == [True, False]
+
+
+def test_non_datetime_column_raises(bd):
+    df = pd.DataFrame({"start_time": [1, 2], "end_time": [3, 4]})
+    with pytest.raises(TypeError, match="Expected datetime values"):
+        df.bizdurr.duration("start_time", "end_time")
+
+
+def test_register_requires_business_duration():
+    with pytest.raises(TypeError):
+        register_pandas_accessor({"start": "09:00", "end": "17:00"}, name="other")
+
+
+def test_accessor_names_are_independent(bd):
+    utc = BusinessDuration(
+        business_timezone="UTC",
+        business_hours={"start": "00:00", "end": "12:00"},
+    )
+    register_pandas_accessor(utc, name="bizdurr_utc")
+    series = pd.Series(pd.to_datetime(["2025-12-08 00:00"]))
+    end = datetime(2025, 12, 8, 23, 0)
+    assert series.bizdurr.duration(end).iloc[0] == timedelta(hours=8)
+    assert series.bizdurr_utc.duration(end).iloc[0] == timedelta(hours=12)
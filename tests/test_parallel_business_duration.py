@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from bizdurr.ParallelBusinessDuration import ParallelBusinessDuration
+
+
+def _make_batch(rows=1000):
+    rng = np.random.default_rng(0)
+    first = np.datetime64("2025-11-01T00:00", "us").astype(np.int64)
+    starts = (first + rng.integers(0, 90 * 86400 * 10**6, rows)).astype(
+        "datetime64[us]"
+    )
+    lengths = rng.integers(0, 20 * 86400 * 10**6, rows).astype("timedelta64[us]")
+    starts[3] = np.datetime64("NaT", "us")
+    return starts, starts + lengths, lengths
+
+
+def test_calculate_many_matches_serial(bd):
+    starts, ends, _ = _make_batch()
+
+    with ParallelBusinessDuration(bd, max_workers=2, chunk_size=128) as parallel:
+        result = parallel.calculate_many(starts, ends)
+
+    expected = bd.calculate_many(starts, ends)
+    assert np.array_equal(result, expected, equal_nan=True)
+    assert np.isnat(result[3])
+
+
+def test_add_business_time_many_matches_serial(bd):
+    starts, _, lengths = _make_batch()
+
+    with ParallelBusinessDuration(bd, max_workers=2, chunk_size=300) as parallel:
+        result = parallel.add_business_time_many(starts, lengths)
+        # The pool is reused across calls
+        single = parallel.add_business_time_many(
+            datetime(2025, 12, 24, 11, 0), timedelta(hours=2)
+        )
+
+    expected = bd.add_business_time_many(starts, lengths)
+    assert np.array_equal(result, expected, equal_nan=True)
+    assert single == np.datetime64("2025-12-26T10:00", "us")
+
+
+def test_thread_executor_matches_serial(bd):
+    starts, ends, lengths = _make_batch()
+
+    with ParallelBusinessDuration(
+        bd, max_workers=4, chunk_size=100, executor="thread"
+    ) as parallel:
+        durations = parallel.calculate_many(starts, ends)
+        deadlines = parallel.add_business_time_many(starts, lengths)
+
+    assert np.array_equal(durations, bd.calculate_many(starts, ends), equal_nan=True)
+    assert np.array_equal(
+        deadlines, bd.add_business_time_many(starts, lengths), equal_nan=True
+    )
+
+
+@pytest.mark.parametrize("executor", ["process", "thread"])
+def test_reassigned_schedule_is_used(executor, bd):
+    start = datetime(2025, 12, 22, 9, 0)
+    end = datetime(2025, 12, 23, 17, 0)
+
+    with ParallelBusinessDuration(bd, max_workers=2, executor=executor) as parallel:
+        before = parallel.calculate_many([start], [end])
+        bd.holidays = ["2025-12-22"]
+        after = parallel.calculate_many([start], [end])
+
+    assert before.tolist() == [timedelta(hours=16)]
+    assert after.tolist() == [timedelta(hours=8)]
+
+
+def test_empty_batch_does_not_start_pool(bd):
+    parallel = ParallelBusinessDuration(bd)
+    result = parallel.calculate_many(
+        np.array([], dtype="datetime64[us]"), np.array([], dtype="datetime64[us]")
+    )
+    assert result.shape == (0,)
+    assert parallel._executor is None
+
+
+def test_invalid_arguments_raise(bd):
+    with pytest.raises(TypeError):
+        ParallelBusinessDuration("not a calendar")
+    with pytest.raises(ValueError):
+        ParallelBusinessDuration(bd, chunk_size=0)
+    with pytest.raises(ValueError, match="executor"):
+        ParallelBusinessDuration(bd, executor="fiber")
@@ -0,0 +1,117 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+pl = pytest.importorskip("polars")
+
+from bizdurr.PolarsBusinessDuration import PolarsBusinessDuration
+
+
+@pytest.fixture
+def frame(intervals):
+    starts, ends = intervals
+    return pl.DataFrame({"start_time": starts, "end_time": ends})
+
+
+def test_duration_expression(bd, frame):
+    pbd = PolarsBusinessDuration(bd)
+    result = frame.with_columns(
+        business_duration=pbd.duration("start_time", "end_time")
+    )
+    assert result.schema["business_duration"] == pl.Duration("us")
+    assert result["business_duration"].to_list() == [
+        timedelta(hours=3),
+        timedelta(hours=2),
+        timedelta(hours=3),  # 2h on the 24th, holiday, 1h on the 26th
+        timedelta(0),  # start after end
+        None,
+    ]
+
+
+def test_duration_expression_in_lazy_streaming_query(bd, frame):
+    pbd = PolarsBusinessDuration(bd)
+    frame = frame.drop_nulls()
+    result = (
+        frame.lazy()
+        .with_columns(business_duration=pbd.duration("start_time", "end_time"))
+        .collect(engine="streaming")
+    )
+    expected = [
+        bd.calculate(start, end)
+        for start, end in zip(frame["start_time"], frame["end_time"])
+    ]
+    assert result["business_duration"].to_list() == expected
+
+
+def test_duration_expression_converts_aware_columns(bd):
+    pbd = PolarsBusinessDuration(bd)
+    frame = pl.DataFrame(
+        {
+            "start_time": [datetime(2025, 12, 8, 15, 0)],  # 10 AM Eastern
+            "end_time": [datetime(2025, 12, 8, 12, 0)],  # 3 PM Eastern
+        }
+    ).with_columns(
+        pl.col("start_time").dt.replace_time_zone("UTC"),
+        pl.col("end_time").dt.replace_time_zone("America/Los_Angeles"),
+    )
+    result = frame.select(pbd.duration(pl.col("start_time"), pl.col("end_time")))
+    assert result.item() == timedelta(hours=5)
+
+
+def test_is_within_business_hours_expression(bd):
+    pbd = PolarsBusinessDuration(bd)
+    frame = pl.DataFrame(
+        {
+            "ts": [
+                datetime(2025, 12, 8, 9, 0),  # start (inclusive)
+                datetime(2025, 12, 8, 17, 0),  # end (exclusive)
+                datetime(2025, 12, 24, 13, 0),  # after early close override
+                datetime(2025, 12, 25, 10, 0),  # holiday
+                datetime(2025, 12, 13, 10, 0),  # Saturday
+            ]
+        }
+    )
+    result = frame.select(pbd.is_within_business_hours("ts"))
+    assert result.to_series().to_list() == [True, False, False, False, False]
+
+
+def test_non_datetime_column_raises(bd):
+    pbd = PolarsBusinessDuration(bd)
+    frame = pl.DataFrame({"ts": [1, 2]})
+    with pytest.raises(Exception, match="Expected a Datetime column"):
+        frame.select(pbd.is_within_business_hours("ts"))
+
+
+def test_requires_business_duration():
+    with pytest.raises(TypeError):
+        PolarsBusinessDuration({"start": "09:00", "end": "17:00"})
+
+
+def test_add_business_time_expression(bd, frame):
+    pbd = PolarsBusinessDuration(bd)
+    df = frame.with_columns(
+        sla=pl.Series(
+            [timedelta(hours=h) for h in (8, 4, 6, -3, 1)], dtype=pl.Duration("us")
+        )
+    )
+
+    result = (
+        df.lazy()
+        .select(
+            due_at=pbd.add_business_time("start_time", "sla"),
+            due_in_two_hours=pbd.add_business_time("start_time", timedelta(hours=2)),
+        )
+        .collect(engine="streaming")
+    )
+
+    assert result["due_at"].dtype == pl.Datetime("us")
+    expected = [
+        bd.add_business_time(start, sla) if start is not None else None
+        for start, sla in zip(df["start_time"], df["sla"])
+    ]
+    assert result["due_at"].to_list() == expected
+    assert result["due_in_two_hours"].to_list()[:2] == [
+        datetime(2025, 12, 8, 11, 0),
+        datetime(2025, 12, 9, 10, 0),
+    ]
+    assert result["due_at"][4] is None
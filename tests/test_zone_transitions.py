@@ -0,0 +1,154 @@
+import struct
+import zoneinfo
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from bizdurr.LRUCache import LRUCache
+from bizdurr.utils import EPOCH, NAT_INT64, wall_clock_microseconds
+from bizdurr.ZoneTransitions import ZoneTransitions
+
+UTC_EPOCH = EPOCH.replace(tzinfo=timezone.utc)
+
+
+def _utc_us(*args):
+    return wall_clock_microseconds(datetime(*args))
+
+
+def _local_via_zoneinfo(utc_us, tz):
+    return wall_clock_microseconds(
+        (UTC_EPOCH + timedelta(microseconds=utc_us)).astimezone(tz)
+    )
+
+
+def _utc_via_zoneinfo(local_us, tz):
+    local = (EPOCH + timedelta(microseconds=local_us)).replace(tzinfo=tz)
+    return wall_clock_microseconds(local.astimezone(timezone.utc))
+
+
+@pytest.mark.parametrize(
+    "key", ["America/New_York", "Europe/Dublin", "Australia/Lord_Howe", "Pacific/Apia"]
+)
+def test_conversions_match_zoneinfo_around_transitions(key):
+    tz = ZoneInfo(key)
+    transitions = ZoneTransitions(tz)
+    utc_us = np.arange(_utc_us(2010, 1, 1), _utc_us(2013, 1, 1), 3_600_000_000)
+
+    local_us = transitions.to_local_array(utc_us)
+    assert local_us.tolist() == [_local_via_zoneinfo(u, tz) for u in utc_us.tolist()]
+
+    assert transitions.to_utc_array(local_us).tolist() == [
+        _utc_via_zoneinfo(value, tz) for value in local_us.tolist()
+    ]
+
+
+def _write_zone_file(path, moments, offsets):
+    """Write a TZif version 1 file with one type per offset."""
+    types = b"".join(struct.pack(">lBB", offset, 0, 0) for offset in offsets)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(
+        struct.pack(">4s1s15x6l", b"TZif", b"\0", 0, 0, 0, len(moments), len(offsets), 4)
+        + struct.pack(f">{len(moments)}l", *moments)
+        + bytes(range(1, len(moments) + 1))
+        + types
+        + b"ZZZ\0"
+    )
+
+
+@pytest.mark.parametrize("keyed", [True, False])
+def test_finds_transitions_less_than_a_day_apart(tmp_path, keyed):
+    # Daylight time that lasts for one hour, then a new standard offset
+    first = int(datetime(2025, 6, 1, 12, tzinfo=timezone.utc).timestamp())
+    moments = [first, first + 3_600]
+    path = tmp_path / "Test" / "Blip"
+    _write_zone_file(path, moments, [-5 * 3_600, -4 * 3_600, -5 * 3_600 + 1_800])
+
+    zoneinfo.reset_tzpath([str(tmp_path)])
+    try:
+        if keyed:
+            tz = ZoneInfo.no_cache("Test/Blip")
+        else:
+            with open(path, "rb") as zone_file:
+                tz = ZoneInfo.from_file(zone_file)
+        transitions = ZoneTransitions(tz)
+
+        utc_us = range(
+            (first - 7_200) * 1_000_000, (first + 10_800) * 1_000_000, 900_000_000
+        )
+        assert [transitions.to_local(value) for value in utc_us] == [
+            _local_via_zoneinfo(value, tz) for value in utc_us
+        ]
+    finally:
+        zoneinfo.reset_tzpath()
+
+
+def test_gap_and_fold_resolve_like_fold_zero():
+    transitions = ZoneTransitions(ZoneInfo("America/New_York"))
+    local_us = np.array(
+        [
+            _utc_us(2025, 3, 9, 2, 30),  # skipped: EST offset, 03:30 EDT
+            _utc_us(2025, 11, 2, 1, 30),  # ambiguous: first (EDT) occurrence
+            _utc_us(2025, 11, 2, 2, 0),
+        ]
+    )
+    assert transitions.to_utc_array(local_us).tolist() == [
+        _utc_us(2025, 3, 9, 7, 30),
+        _utc_us(2025, 11, 2, 5, 30),
+        _utc_us(2025, 11, 2, 7, 0),
+    ]
+
+
+def test_table_grows_to_cover_far_dates():
+    tz = ZoneInfo("Europe/London")
+    transitions = ZoneTransitions(tz)
+    utc_us = np.array([_utc_us(1916, 6, 1), _utc_us(2150, 7, 1, 12)])
+    assert transitions.to_local_array(utc_us).tolist() == [
+        _local_via_zoneinfo(value, tz) for value in utc_us.tolist()
+    ]
+
+
+def test_missing_values_pass_through():
+    transitions = ZoneTransitions(ZoneInfo("Asia/Tokyo"))
+    values = np.array([NAT_INT64, _utc_us(2025, 1, 1)])
+    assert transitions.to_local_array(values)[0] == NAT_INT64
+    assert transitions.to_utc_array(values)[0] == NAT_INT64
+    assert transitions.to_local_array(values[:1]).tolist() == [NAT_INT64]
+
+
+def test_for_timezone_shares_tables():
+    tz = ZoneInfo("America/Chicago")
+    assert ZoneTransitions.for_timezone(tz) is ZoneTransitions.for_timezone(tz)
+
+
+def test_for_timezone_keeps_a_bounded_number_of_tables(tmp_path, monkeypatch):
+    monkeypatch.setattr(ZoneTransitions, "_shared", {})
+    monkeypatch.setattr(ZoneTransitions, "_shared_unkeyed", LRUCache(maxsize=2))
+
+    # Uncached instances of one zone share the table of its key
+    shared = ZoneTransitions.for_timezone(ZoneInfo("America/Chicago"))
+    for _ in range(3):
+        tz = ZoneInfo.no_cache("America/Chicago")
+        assert ZoneTransitions.for_timezone(tz) is shared
+    assert len(ZoneTransitions._shared) == 1
+
+    # Zones without a key are kept up to the cache size
+    path = tmp_path / "zone"
+    _write_zone_file(path, [0], [0, 3_600])
+    for _ in range(5):
+        with open(path, "rb") as zone_file:
+            tz = ZoneInfo.from_file(zone_file)
+        assert ZoneTransitions.for_timezone(tz) is ZoneTransitions.for_timezone(tz)
+    assert len(ZoneTransitions._shared_unkeyed) == 2
+
+
+def test_scalar_conversions_match_arrays():
+    transitions = ZoneTransitions(ZoneInfo("Europe/Berlin"))
+    utc_us = np.arange(_utc_us(2024, 3, 30), _utc_us(2024, 4, 1), 1_800_000_000)
+    local_us = transitions.to_local_array(utc_us)
+    assert [transitions.to_local(value) for value in utc_us.tolist()] == local_us.tolist()
+    assert [
+        transitions.to_utc(value) for value in local_us.tolist()
+    ] == transitions.to_utc_array(local_us).tolist()